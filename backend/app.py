@@ -7,7 +7,7 @@ from dynamic_installation_agent import DynamicInstallationAgent
 from infrastructure_verification import InfrastructureVerification
 from infrastructure_catalog import PlatformCatalog
 from simple_config_generator import SimpleConfigGenerator
-from dynamic_cloud_provisioner import DynamicCloudProvisioner
+from dynamic_cloud_provisioner import DynamicCloudProvisioner, request_shutdown
 import asyncio
 import threading
 
@@ -41,6 +41,8 @@ class AutoProvisionRequest(BaseModel):
     founder_name: str
     project_name: str = "platforge_project"
     recommendations: Optional[List[str]] = None  # AI recommendations for services
+    preferred_region: Optional[str] = None  # AWS region closest to the startup's users
+    include_code: bool = False  # Attach python_code connection snippets to each resource
 
 app.add_middleware(
     CORSMiddleware,
@@ -59,6 +61,23 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# One provisioner shared by every /auto-provision request, built on first use
+_provisioner: Optional[DynamicCloudProvisioner] = None
+_provisioner_lock = asyncio.Lock()
+
+async def get_provisioner() -> DynamicCloudProvisioner:
+    # The constructor loads the accounts log and connects to AWS/GCP, so build it off the event loop
+    global _provisioner
+    async with _provisioner_lock:
+        if _provisioner is None:
+            _provisioner = await asyncio.to_thread(DynamicCloudProvisioner)
+    return _provisioner
+
+@app.on_event("shutdown")
+def stop_provisioning_polls():
+    # Account-creation polls can run for minutes; let them return so shutdown isn't held up
+    request_shutdown()
+
 @app.get("/")
 async def root():
     return {
@@ -154,7 +173,7 @@ async def get_infrastructure_recommendations(request: RecommendationRequest):
         return {
             "status": "success",
             "message": f"Found {len(recommendations)} recommendations for {request.use_case}",
-            "recommendations": recommendations,
+            "recommendations": [tool.to_dict() for tool in recommendations],
             "request_parameters": {
                 "use_case": request.use_case,
                 "company_stage": request.company_stage,
@@ -188,7 +207,7 @@ async def generate_configuration(request: ConfigurationRequest):
         installed_packages = verification_result.get("debug_info", {}).get("installed_packages", [])
         
         # Generate configurations
-        config_result = generator.generate_ready_to_use_configs(
+        config_result = await generator.generate_ready_to_use_configs_async(
             project_display_name=request.project_display_name,
             installed_tools=installed_packages,
             include_cloud=request.include_cloud
@@ -335,8 +354,8 @@ async def auto_provision_startup_infrastructure(request: AutoProvisionRequest):
                     "message": "No supported services found. Either provide recommendations or install specific service packages."
                 }
         
-        # Initialize provisioner
-        provisioner = DynamicCloudProvisioner()
+        # Shared provisioner (built off the event loop on the first request)
+        provisioner = await get_provisioner()
         
         # Startup info from request
         startup_info = {
@@ -344,10 +363,12 @@ async def auto_provision_startup_infrastructure(request: AutoProvisionRequest):
             "email": request.founder_email,
             "founder_name": request.founder_name
         }
+        if request.preferred_region:
+            startup_info["preferred_region"] = request.preferred_region
         
-        # Auto-provision everything
-        provisioning_result = provisioner.auto_provision_startup_infrastructure(
-            startup_info, pipeline_services
+        # Auto-provision everything (off the event loop - this is minutes of blocking cloud calls)
+        provisioning_result = await provisioner.auto_provision_startup_infrastructure_async(
+            startup_info, pipeline_services, include_code=request.include_code
         )
         
         return {
@@ -7,7 +7,7 @@ import boto3
 import json
 import uuid
 from typing import Dict, List, Any, Optional
-from pathlib import Path
+from project_paths import PROJECT_ROOT
 from google.cloud import storage, bigquery, compute_v1
 from google.oauth2 import service_account
 import logging
@@ -16,7 +16,7 @@ import time
 class CloudProvisioner:
     def __init__(self, project_name: str = "platforge_project"):
         self.project_name = project_name
-        self.project_dir = Path.home() / "platforge_projects" / project_name
+        self.project_dir = PROJECT_ROOT / project_name
         self.provisioning_log = []
         
         # Service mapping to our 25 supported tools
@@ -5,25 +5,25 @@ Debug the accounts structure to find Looker
 
 import json
 from pathlib import Path
+from dynamic_cloud_provisioner import replay_accounts_log
 
 def debug_accounts():
     """Debug accounts to find Looker data"""
     
-    accounts_file = Path(__file__).parent / "platforge_accounts.json"
+    accounts_file = Path(__file__).parent / "platforge_accounts.jsonl"
+    legacy_file = Path(__file__).parent / "platforge_accounts.json"
     
-    if not accounts_file.exists():
+    if accounts_file.exists():
+        latest, _ = replay_accounts_log(accounts_file)
+        accounts = list(latest.values())
+    elif legacy_file.exists():
+        with open(legacy_file, 'r') as f:
+            data = json.load(f)
+        accounts = list(data.get("accounts", {}).values())
+    else:
         print("❌ No accounts database found")
         return
     
-    with open(accounts_file, 'r') as f:
-        data = json.load(f)
-    
-    # Handle both dictionary and list formats
-    if isinstance(data, dict):
-        accounts = list(data.values()) if data else []
-    else:
-        accounts = data if data else []
-    
     print(f"🔍 Found {len(accounts)} accounts")
     print("=" * 60)
     
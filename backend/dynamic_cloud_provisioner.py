@@ -3,35 +3,763 @@ PlatForge.ai Dynamic Cloud Auto-Provisioner
 Creates exactly what each startup needs based on their 25-service pipeline
 """
 
+import asyncio
 import boto3
+import botocore.session
 import json
-import uuid
+import hashlib
+import heapq
+import importlib.util
 import time
 import os
+import random
+import re
+import secrets
+import threading
+import queue
+import sys
+import atexit
+import weakref
+from contextlib import contextmanager, nullcontext
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set, Tuple, Callable
+from datetime import datetime, timedelta, timezone
+from collections.abc import Mapping
+from types import MappingProxyType
 import logging
+import logging.handlers
+from dataclasses import dataclass
+from functools import lru_cache
+from botocore.config import Config
+from botocore.credentials import CredentialProvider, CredentialResolver, RefreshableCredentials
+from botocore.exceptions import BotoCoreError, ClientError, WaiterError
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
 
-# GCP imports - optional for AWS-only mode
+logger = logging.getLogger(__name__)
+
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that drops records instead of blocking when the queue is full"""
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+
+# Console output is written by one background listener so provisioning workers never block on stdout
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=10000)
+logger.addHandler(_DroppingQueueHandler(_log_queue))
+logger.setLevel(logging.INFO)
+logger.propagate = False
+_log_listener: Optional[logging.handlers.QueueListener] = None
+_log_listener_lock = threading.Lock()
+
+
+def _start_log_listener() -> None:
+    """Start the background console writer (once per process); records logged earlier are buffered"""
+    global _log_listener
+    with _log_listener_lock:
+        if _log_listener is None:
+            handler = logging.StreamHandler(sys.stdout)
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            _log_listener = logging.handlers.QueueListener(_log_queue, handler)
+            _log_listener.start()
+            atexit.register(_log_listener.stop)
+
+
+def _module_available(name: str) -> bool:
+    """Check that a module is installed without importing it"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ImportError:
+        return False
+
+
+# GCP packages - optional for AWS-only mode. Only probed here; the protobuf-heavy
+# google.cloud modules are imported where GCP is actually used.
+GCP_AVAILABLE = all(_module_available(name) for name in (
+    "google.cloud.resourcemanager", "google.cloud.bigquery", "google.cloud.storage",
+    "google.cloud.billing", "google.oauth2.service_account", "google.api_core.exceptions"
+))
+if not GCP_AVAILABLE:
+    logger.info("📝 GCP packages not installed - running in AWS-only mode")
+
+
+def _gcp_exceptions():
+    """google.api_core.exceptions if something has loaded it (any GCP error implies it has), else None"""
+    return sys.modules.get("google.api_core.exceptions")
+
+# orjson - optional, faster JSON encoding
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# fcntl - optional (POSIX only); without it the accounts log is only locked within this process
 try:
-    from google.cloud import resourcemanager, bigquery, storage, billing
-    from google.oauth2 import service_account
-    GCP_AVAILABLE = True
+    import fcntl
+    FCNTL_AVAILABLE = True
 except ImportError:
-    print("📝 GCP packages not installed - running in AWS-only mode")
-    GCP_AVAILABLE = False
+    FCNTL_AVAILABLE = False
+
+# After a failed AssumeRole, use the master-session fallback this long before trying again
+ROLE_FALLBACK_RETRY_INTERVAL = timedelta(minutes=1)
+
+# Upper bound on services provisioned concurrently for one startup
+MAX_PROVISIONING_WORKERS = 16
+
+# Upper bound on AWS resource creations in flight across all plans (bulk_provision included);
+# beyond a few concurrent calls per account AWS mostly answers with throttling errors
+MAX_CONCURRENT_AWS_PROVISIONS = 4
+
+# Slots for MAX_CONCURRENT_AWS_PROVISIONS; module-level so the bound holds across provisioner instances
+_aws_provisioning_slots = threading.BoundedSemaphore(MAX_CONCURRENT_AWS_PROVISIONS)
+
+# Upper bound on startups onboarded concurrently by bulk_provision; Organizations throttles
+# bursts of create_account calls, and those are never retried (see _create_aws_subaccount)
+MAX_BULK_PROVISIONING_WORKERS = 8
+
+# Shared by every boto3 client: a pool large enough for the parallel fan-out plus
+# botocore's client-side rate limiting and a generous retry budget for throttles.
+# boto calls are therefore not wrapped in cloud_retry, so the two budgets never stack
+_BOTO_CFG = Config(
+    max_pool_connections=50,
+    retries={'max_attempts': 10, 'mode': 'adaptive'},
+    tcp_keepalive=True,
+    # Fail fast on unreachable endpoints (botocore retries the attempt) instead of the 60s defaults
+    connect_timeout=5,
+    read_timeout=30
+)
+
+# Health probes (and calls that must not be re-sent) get exactly one attempt
+_BOTO_SINGLE_ATTEMPT_CFG = _BOTO_CFG.merge(Config(retries={'mode': 'adaptive', 'max_attempts': 1}))
+
+# Amazon Linux 2 AMI: resolved per region from the public SSM parameter, with the
+# known us-east-1 image as a fallback when SSM is unavailable there
+AMAZON_LINUX_AMI_PARAMETER = "/aws/service/ami-amazon-linux-latest/amzn2-ami-hvm-x86_64-gp2"
+DEFAULT_AMI_REGION = "us-east-1"
+DEFAULT_AMI_ID = "ami-0c02fb55956c7d316"
+# The parameter moves to a new image with each Amazon Linux release; re-resolve this often (seconds)
+AMI_CACHE_TTL = 600.0
+
+# Bucket policy granting the startup's account root full access; only the account id and
+# bucket name vary (both restricted to JSON-safe characters by AWS naming rules)
+_BUCKET_POLICY_TMPL = (
+    '{"Version":"2012-10-17","Statement":[{"Sid":"StartupAccess","Effect":"Allow",'
+    '"Principal":{"AWS":"arn:aws:iam::%s:root"},"Action":"s3:*",'
+    '"Resource":["arn:aws:s3:::%s","arn:aws:s3:::%s/*"]}]}'
+)
+
+_RDS_PERMS_HINT = """🔧 SOLUTION: Add these permissions to your platforge-api IAM user:
+   - rds:CreateDBInstance
+   - rds:DescribeDBInstances
+   - rds:CreateDBSubnetGroup
+   - ec2:DescribeVpcs
+   - ec2:DescribeSubnets
+   - ec2:DescribeSecurityGroups"""
+
+_EC2_PERMS_HINT = """🔧 SOLUTION: Add these permissions to your platforge-api IAM user:
+   - ec2:RunInstances
+   - ec2:DescribeInstances
+   - ec2:DescribeImages
+   - ec2:CreateTags
+   - ec2:DescribeKeyPairs
+   - ec2:DescribeSecurityGroups
+   - ec2:DescribeSubnets
+   - ec2:DescribeVpcs
+   - ssm:GetParameter"""
+
+# python_code snippets returned with provisioned resources; {note} marks mock fallbacks
+_RDS_PY_TMPL = '''import psycopg2
+
+# Connect to RDS PostgreSQL{note}
+conn = psycopg2.connect(
+    host="{endpoint}",
+    port=5432,
+    database="startupdb",
+    user="startupuser",
+    password="{password}"
+)
+
+cursor = conn.cursor()
+cursor.execute("SELECT version();")
+print(cursor.fetchone())
+conn.close()'''
+
+_EC2_PY_TMPL = '''import boto3
+
+# Connect to EC2{note}
+ec2 = boto3.client('ec2', region_name='{region}')
+
+# Get instance details
+response = ec2.describe_instances(InstanceIds=['{instance_id}'])
+instance = response['Reservations'][0]['Instances'][0]
+
+print(f"Instance State: {{instance['State']['Name']}}")
+print(f"Public IP: {{instance.get('PublicIpAddress', 'N/A')}}")
+print(f"Private IP: {{instance.get('PrivateIpAddress', 'N/A')}}")'''
+
+_S3_PY_TMPL = '''import boto3
+
+# Initialize S3 client{note}
+s3_client = boto3.client('s3', region_name='{region}')
+
+# Upload a file
+s3_client.upload_file('local_file.txt', '{bucket_name}', 'remote_file.txt')
+
+# Download a file
+s3_client.download_file('{bucket_name}', 'remote_file.txt', 'downloaded_file.txt')
+
+# List objects
+response = s3_client.list_objects_v2(Bucket='{bucket_name}')
+for obj in response.get('Contents', []):
+    print(f"File: {{obj['Key']}}, Size: {{obj['Size']}}")'''
+
+# Looker snippets rendered lazily by LookerConfig
+_LOOKML_TMPL = '''
+connection: "{instance_name}_bq_connection" {{
+  database: "{project_id}"
+  project_name: "{project_id}"
+  schema: "{bigquery_dataset}"
+  type: bigquery
+}}
+
+view: analytics_data {{
+  sql_table_name: `{project_id}.{bigquery_dataset}.your_table` ;;
+  
+  dimension: id {{
+    primary_key: yes
+    type: string
+    sql: ${{TABLE}}.id ;;
+  }}
+  
+  measure: count {{
+    type: count
+    drill_fields: [id]
+  }}
+}}
+
+explore: analytics_data {{}}
+'''
+
+_LOOKER_SDK_PY_TMPL = '''
+# Looker SDK Setup
+import looker_sdk
+
+# Configuration for your Looker instance
+config = {{
+    'base_url': 'https://your-looker-instance.looker.com:19999',
+    'client_id': 'your_client_id',
+    'client_secret': 'your_client_secret',
+}}
+
+# Initialize SDK
+sdk = looker_sdk.init40(config_settings=config)
+
+# Example: Get all dashboards
+dashboards = sdk.all_dashboards()
+print(f"Found {{len(dashboards)}} dashboards")
+
+# Example: Run a query
+query = {{
+    'model': '{looker_model}',
+    'explore': 'analytics_data', 
+    'dimensions': ['analytics_data.id'],
+    'measures': ['analytics_data.count']
+}}
+
+result = sdk.run_inline_query('json', query)
+print("Query result:", result)
+'''
+
+# Concurrent provisioning jobs can race on the shared project's IAM policy
+IAM_POLICY_MAX_ATTEMPTS = 5
+
+def _rand_hex(length: int) -> str:
+    """Random hex token of the given length; the single source of randomness for ids and mock secrets"""
+    return secrets.token_hex((length + 1) // 2)[:length]
+
+
+# GCP console deep links; {project_id} is filled once per provisioner, {email} per service account
+GCP_CONSOLE_URL_TEMPLATES = {
+    "dashboard": "https://console.cloud.google.com/home/dashboard?project={project_id}",
+    "iam": "https://console.cloud.google.com/iam-admin/iam?project={project_id}",
+    "iam_api": "https://console.developers.google.com/apis/api/iam.googleapis.com/overview?project={project_id}",
+    "service_accounts": "https://console.cloud.google.com/iam-admin/serviceaccounts?project={project_id}",
+    "service_account": "https://console.cloud.google.com/iam-admin/serviceaccounts/details/{email}?project={project_id}",
+    "service_account_keys": "https://console.cloud.google.com/iam-admin/serviceaccounts/details/{email}/keys?project={project_id}",
+    "bigquery": "https://console.cloud.google.com/bigquery?project={project_id}",
+    "looker": "https://console.cloud.google.com/looker/instances?project={project_id}"
+}
+
+# Transient cloud API errors worth retrying before falling back to mock data
+AWS_RETRYABLE_ERROR_CODES = {"Throttling", "ThrottlingException", "RequestLimitExceeded", "TooManyRequestsException"}
+AWS_PERMISSION_ERROR_CODES = {"AccessDenied", "AccessDeniedException", "UnauthorizedOperation",
+                              "NotAuthorized", "AuthorizationError"}
+
+# Failures from AWS itself (API errors, credentials, connectivity, waiters); the resource creators
+# fall back to mock records only for these and let bugs in our own code surface
+AWS_PROVISIONING_ERRORS = (ClientError, BotoCoreError)
+
+
+def _is_retryable_cloud_error(error: BaseException) -> bool:
+    """True for throttling/5xx responses from AWS or GCP"""
+    if isinstance(error, ClientError):
+        return error.response.get("Error", {}).get("Code") in AWS_RETRYABLE_ERROR_CODES
+    gcp_exceptions = _gcp_exceptions()
+    if gcp_exceptions:
+        return isinstance(error, (gcp_exceptions.ServiceUnavailable,
+                                  gcp_exceptions.DeadlineExceeded,
+                                  gcp_exceptions.InternalServerError))
+    return False
+
+
+def _is_permission_error(error: BaseException) -> bool:
+    """True when AWS or GCP rejected the call for missing permissions (checked by error code/type)"""
+    if isinstance(error, ClientError):
+        return error.response.get("Error", {}).get("Code") in AWS_PERMISSION_ERROR_CODES
+    gcp_exceptions = _gcp_exceptions()
+    if gcp_exceptions:
+        return isinstance(error, (gcp_exceptions.Forbidden, gcp_exceptions.PermissionDenied))
+    return False
+
+
+def _gcp_error_reason(error: BaseException) -> Optional[str]:
+    """ErrorInfo reason of a GCP API error (e.g. SERVICE_DISABLED), if it carries one"""
+    gcp_exceptions = _gcp_exceptions()
+    if gcp_exceptions and isinstance(error, gcp_exceptions.GoogleAPICallError):
+        # .reason needs google-api-core >= 2.8; older versions don't expose ErrorInfo
+        return getattr(error, "reason", None)
+    return None
+
+
+def _retry_after_seconds(error: BaseException) -> float:
+    """Read the Retry-After header from an AWS error response, if present"""
+    if isinstance(error, ClientError):
+        headers = error.response.get("ResponseMetadata", {}).get("HTTPHeaders", {})
+        try:
+            return float(headers.get("retry-after", 0))
+        except ValueError:
+            return 0.0
+    return 0.0
+
+
+_exponential_backoff = wait_exponential_jitter(initial=0.5, max=8)
+
+
+def _retry_wait(retry_state) -> float:
+    """Exponential backoff with jitter, never shorter than the server's Retry-After"""
+    return max(_exponential_backoff(retry_state), _retry_after_seconds(retry_state.outcome.exception()))
+
+
+# Total time to wait for a freshly created resource to report its endpoint
+ENDPOINT_POLL_TIMEOUT = 2.0
+
+# AWS Organizations account creation usually takes 1-2 minutes; give up after 5
+ACCOUNT_CREATION_TIMEOUT = 300.0
+
+# Repeat visits refresh an account's last_accessed at most this often (seconds)
+LAST_ACCESSED_WRITE_INTERVAL = 60.0
+
+# A provider that failed its connection probe is probed again at most this often (seconds)
+CONNECTION_RETRY_INTERVAL = 30.0
+
+# boto3 waiter schedules for opt-in readiness waits (startup_info["wait_for_resources"])
+RDS_WAITER_CONFIG = {'Delay': 15, 'MaxAttempts': 40}
+EC2_WAITER_CONFIG = {'Delay': 5, 'MaxAttempts': 40}
+
+# access_package fields that alias top-level account fields; persisted once and re-linked on load
+ACCESS_PACKAGE_SHARED_FIELDS = {"environments": "provisioned_environments", "resources": "provisioned_resources"}
+
+# Service catalog: service -> (provider, type)
+_SERVICE_REQUIREMENTS: Mapping[str, Tuple[str, str]] = MappingProxyType({
+    # AWS Services - need AWS sub-account
+    "aws_rds": ("aws", "managed_service"),
+    "redshift": ("aws", "managed_service"),
+    "dynamodb": ("aws", "managed_service"),
+    "aws_glue": ("aws", "managed_service"),
+    "aws_ec2": ("aws", "managed_service"),
+
+    # GCP Services - need GCP project
+    "gcp_cloud_sql": ("gcp", "managed_service"),
+    "bigquery": ("gcp", "managed_service"),
+    "firestore": ("gcp", "managed_service"),
+    "gcp_dataflow": ("gcp", "managed_service"),
+    "gcp_compute": ("gcp", "managed_service"),
+    "gke": ("gcp", "managed_service"),
+    "gcp_pubsub": ("gcp", "managed_service"),
+    "looker": ("gcp", "managed_service"),
+    "gcp_build": ("gcp", "managed_service"),
+    "cloud_storage": ("gcp", "managed_service"),
+
+    # Additional AWS services
+    "s3": ("aws", "managed_service"),
+
+    # Third-party services - need external accounts
+    "mongodb": ("mongodb_atlas", "third_party"),
+    "snowflake": ("snowflake", "third_party"),
+    "tableau": ("tableau", "third_party"),
+    "powerbi": ("microsoft", "third_party"),
+
+    # Deployable services - need deployment target
+    "airflow": ("deployable", "container"),
+    "spark": ("deployable", "container"),
+    "dbt": ("deployable", "container"),
+    "metabase": ("deployable", "container"),
+    "grafana": ("deployable", "container"),
+    "docker": ("deployable", "container"),
+    "terraform": ("deployable", "tool")
+})
+
+
+def _requirements_category(provider: str, service_type: str) -> Optional[str]:
+    """Which analyze_pipeline_requirements list a catalog entry belongs to"""
+    if provider == "aws":
+        return "aws_services"
+    if provider == "gcp":
+        return "gcp_services"
+    if service_type == "third_party":
+        return "third_party_services"
+    if provider == "deployable":
+        return "deployable_services"
+    return None
+
+
+# Static partition of the catalog: service -> requirements list it belongs to
+_SERVICE_CATEGORY: Mapping[str, str] = MappingProxyType({
+    service: category
+    for service, (provider, service_type) in _SERVICE_REQUIREMENTS.items()
+    if (category := _requirements_category(provider, service_type))
+})
+
+
+# Set on server shutdown so in-flight readiness polls return instead of pinning their threads
+_shutdown_event = threading.Event()
+
+
+# In-flight provisioning runs: plan key -> Future shared by identical concurrent requests.
+# Module-level so requests served by different provisioner instances still dedupe
+_inflight_plans: Dict[str, Future] = {}
+_plan_lock = threading.Lock()
+
+
+def request_shutdown():
+    """Wake every in-flight readiness poll so it returns its latest result (call from the server's shutdown hook)"""
+    _shutdown_event.set()
+
+
+def _poll_describe(describe, is_ready, timeout: float = ENDPOINT_POLL_TIMEOUT, initial_delay: float = 0.2,
+                   created: Optional[Dict[str, Any]] = None, backoff: float = 2.0,
+                   max_delay: float = float("inf")):
+    """Call describe() with exponential backoff until is_ready(result) or the timeout; returns the last result"""
+    # The create response already describes the resource; skip the round-trip when it is ready
+    if created is not None and is_ready(created):
+        return created
+    deadline = time.monotonic() + timeout
+    delay = initial_delay
+    if created is not None:
+        if _shutdown_event.wait(delay):
+            return created
+        delay = min(delay * backoff, max_delay)
+    while True:
+        result = describe()
+        remaining = deadline - time.monotonic()
+        if is_ready(result) or remaining <= 0:
+            return result
+        if _shutdown_event.wait(min(delay, remaining)):
+            return result
+        delay = min(delay * backoff, max_delay)
+
+
+def _wait_then_describe(client, waiter_name: str, waiter_config: Dict[str, int], describe, fallback: Dict[str, Any],
+                        **params: Any) -> Dict[str, Any]:
+    """Block on a boto3 waiter, then describe once; returns fallback if the waiter gives up"""
+    try:
+        client.get_waiter(waiter_name).wait(WaiterConfig=waiter_config, **params)
+        return describe()
+    except WaiterError as e:
+        logger.warning(f"⚠️ Stopped waiting for {waiter_name}: {e}")
+        return fallback
+
+
+# Wrap a single idempotent API call: cloud_retry(client.method)(**kwargs)
+cloud_retry = retry(
+    retry=retry_if_exception(_is_retryable_cloud_error),
+    wait=_retry_wait,
+    stop=stop_after_attempt(5),
+    reraise=True
+)
+
+@dataclass(frozen=True)
+class NameSpec:
+    """Normalized forms of a startup name, derived once per provisioning request"""
+    raw: str
+    slug: str        # "Data Flow" -> "data-flow" (resource identifiers)
+    slug_alnum: str  # "Data Flow" -> "dataflow" (BigQuery datasets, Looker instances)
+    
+    # Longest slug that still fits "<slug>-storage-<8 hex>" within the 63-char S3/RDS identifier limit
+    MAX_SLUG_LENGTH = 40
+    
+    @classmethod
+    def from_startup_info(cls, startup_info: Dict[str, str]) -> "NameSpec":
+        lowered = startup_info["name"].lower()
+        # Cloud identifiers only accept [a-z0-9-]; punctuation and runs of spaces collapse to one hyphen
+        slug = re.sub(r"[^a-z0-9]+", "-", lowered).strip("-")[:cls.MAX_SLUG_LENGTH].rstrip("-")
+        return cls(
+            raw=startup_info["name"],
+            slug=slug or "startup",
+            slug_alnum=slug.replace("-", "") or "startup"
+        )
+    
+    @classmethod
+    def from_account_record(cls, account: Dict[str, Any], startup_info: Dict[str, str]) -> "NameSpec":
+        """Names an existing account was provisioned under, so resources added later match its first ones"""
+        stored = account.get("names")
+        if stored:
+            return cls(raw=startup_info["name"], slug=stored["slug"], slug_alnum=stored["slug_alnum"])
+        # Records saved before names were stored used this unsanitized derivation
+        lowered = startup_info["name"].lower()
+        return cls(
+            raw=startup_info["name"],
+            slug=lowered.replace(" ", "-"),
+            slug_alnum=lowered.replace(" ", "").replace("-", "")
+        )
+
+
+class LazyRecord(Mapping):
+    """Read-only resource record; fields given as keyword builders are rendered on first access"""
+    
+    __slots__ = ("_fields", "_builders", "_keys")
+    
+    def __init__(self, fields: Dict[str, Any], **builders: Callable[[], Any]):
+        self._fields = fields
+        self._builders = builders
+        self._keys = (*fields, *builders)
+    
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._fields[key]
+        except KeyError:
+            value = self._builders[key]()
+            self._fields[key] = value
+            return value
+    
+    def __iter__(self):
+        return iter(self._keys)
+    
+    def __len__(self) -> int:
+        return len(self._keys)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self)
+    
+    def without(self, *keys: str) -> "LazyRecord":
+        """Copy without the given fields; their builders are never run"""
+        return LazyRecord({k: v for k, v in self._fields.items() if k not in keys},
+                          **{k: b for k, b in self._builders.items() if k not in keys})
+
+
+class LookerConfig(Mapping):
+    """Read-only Looker resource record; the LookML/SDK text blobs are only rendered when read"""
+    
+    __slots__ = ("project_id", "instance_name", "startup_namespace", "bigquery_dataset",
+                 "_fields", "_setup_instructions", "_sample_lookml", "_python_sdk_setup")
+    
+    # Lazily rendered keys, in the order they appear in the serialized record
+    LAZY_FIELDS = ("setup_instructions", "sample_lookml", "python_sdk_setup")
+    
+    def __init__(self, project_id: str, instance_name: str, startup_namespace: Optional[str],
+                 bigquery_dataset: Optional[str], fields: Dict[str, Any]):
+        self.project_id = project_id
+        self.instance_name = instance_name
+        self.startup_namespace = startup_namespace
+        self.bigquery_dataset = bigquery_dataset
+        self._fields = fields
+        self._setup_instructions = None
+        self._sample_lookml = None
+        self._python_sdk_setup = None
+    
+    @property
+    def setup_instructions(self) -> List[str]:
+        if self._setup_instructions is None:
+            self._setup_instructions = [
+                "1. Go to Looker Console in GCP",
+                "2. Create new Looker instance", 
+                f"3. Name it: {self.instance_name}",
+                "4. Connect to BigQuery using the service account created",
+                f"5. Use dataset: {self.bigquery_dataset}" if self.bigquery_dataset else "5. Connect to your BigQuery dataset"
+            ]
+        return self._setup_instructions
+    
+    @property
+    def sample_lookml(self) -> str:
+        # Sample LookML code for BigQuery connection
+        if self._sample_lookml is None:
+            self._sample_lookml = _LOOKML_TMPL.format_map({
+                "instance_name": self.instance_name,
+                "project_id": self.project_id,
+                "bigquery_dataset": self.bigquery_dataset
+            }) if self.bigquery_dataset else ""
+        return self._sample_lookml
+    
+    @property
+    def python_sdk_setup(self) -> str:
+        # Python SDK setup code
+        if self._python_sdk_setup is None:
+            self._python_sdk_setup = _LOOKER_SDK_PY_TMPL.format_map({"looker_model": f"{self.instance_name.replace('-', '_')}_project"})
+        return self._python_sdk_setup
+    
+    def __getitem__(self, key: str) -> Any:
+        if key in self.LAZY_FIELDS:
+            return getattr(self, key)
+        return self._fields[key]
+    
+    def __iter__(self):
+        yield from self._fields
+        yield from self.LAZY_FIELDS
+    
+    def __len__(self) -> int:
+        return len(self._fields) + len(self.LAZY_FIELDS)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self)
+
+
+def _json_default(value: Any) -> Any:
+    """json.dump fallback: expand lazy records, stringify anything else"""
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    return str(value)
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes with orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps_line(value: Any) -> bytes:
+    """Serialize to one compact JSON line (newline-terminated) for the accounts log"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, default=_json_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(value, separators=(",", ":"), default=_json_default) + "\n").encode()
+
+
+def _json_dumps_pretty(value: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON with orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, default=_json_default, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, indent=2, default=_json_default).encode()
+
+
+# Serializes accounts-log access within the process, across threads and provisioner instances
+_accounts_log_lock = threading.Lock()
+
+
+@contextmanager
+def _locked_accounts_log(accounts_file: Path):
+    """Hold the accounts log exclusively (process lock plus flock on a sidecar file for other processes)"""
+    with _accounts_log_lock:
+        if not FCNTL_AVAILABLE:
+            yield
+            return
+        # Lock a sidecar file: compaction swaps the log's inode, so a lock on the log itself wouldn't hold
+        with open(accounts_file.with_suffix(".lock"), 'a') as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def replay_accounts_log(accounts_file: Path) -> Tuple[Dict[str, Any], int]:
+    """Replay the JSON Lines accounts log: full records replace, patches update (latest wins)"""
+    accounts: Dict[str, Any] = {}
+    record_count = 0
+    with open(accounts_file, 'rb') as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = _json_loads(line)
+            except ValueError:
+                # A torn final write must not take the rest of the log down with it
+                logger.warning(f"⚠️ Skipping unreadable accounts record on line {line_number}")
+                continue
+            record_count += 1
+            if "data" in record:
+                accounts[record["key"]] = record["data"]
+            elif record["key"] in accounts:
+                accounts[record["key"]].update(record.get("patch", {}))
+    return accounts, record_count
+
+
+class _AssumedRoleCredentialProvider(CredentialProvider):
+    """Hands a botocore session pre-built self-refreshing assumed-role credentials"""
+    METHOD = 'sts-assume-role'
+    
+    def __init__(self, credentials: RefreshableCredentials):
+        self._credentials = credentials
+    
+    def load(self) -> RefreshableCredentials:
+        return self._credentials
+
 
 class DynamicCloudProvisioner:
     def __init__(self):
-        # Load credentials from secure secrets file
+        _start_log_listener()
+        
+        # Load credentials from secure secrets file (reloaded by _ensure_connected when it changes)
         self.secrets_file = Path(__file__).parent / "platforge_secrets.json"
+        self._secrets_mtime = self._current_secrets_mtime()
         self.secrets = self._load_secrets()
         
-        # Account persistence file
-        self.accounts_db_file = Path(__file__).parent / "platforge_accounts.json"
+        # Account persistence: append-only JSON Lines log (migrated once from the legacy JSON file)
+        self.accounts_db_file = Path(__file__).parent / "platforge_accounts.jsonl"
+        self.legacy_accounts_db_file = Path(__file__).parent / "platforge_accounts.json"
         self.accounts_db = self._load_accounts_database()
+        # Founder email -> CreateAccount request ID still in progress when a run stopped polling it
+        self.pending_aws_accounts_file = Path(__file__).parent / "platforge_pending_aws_accounts.json"
         
         # PlatForge master credentials from secrets file
+        self._apply_secrets()
+        
+        # Service categorization for our exact 25 services (module-level catalog, shared)
+        self.service_requirements = _SERVICE_REQUIREMENTS
+        
+        # boto3 sessions are not thread-safe when creating clients; clients are cached per
+        # session so a refreshed assumed-role session drops its clients along with it
+        self._client_lock = threading.Lock()
+        # GCP clients all use the master credentials: (api, *scope) -> client
+        self._gcp_clients: Dict[Tuple[str, ...], Any] = {}
+        self._ami_by_region: Dict[str, Tuple[str, float]] = {}  # region -> (ami_id, resolved_at)
+        self._ami_lock = threading.Lock()
+        self._client_cache: "weakref.WeakKeyDictionary[boto3.Session, Dict[Tuple[str, Optional[str], bool], Any]]" = weakref.WeakKeyDictionary()
+        
+        # Assumed-role sessions per sub-account: account_id -> (session, retry_at). Role sessions
+        # refresh their own credentials (retry_at None); a failed assume caches the master
+        # session until retry_at
+        self._role_session_cache: Dict[str, Tuple[boto3.Session, Optional[datetime]]] = {}
+        self._role_session_locks: Dict[str, threading.Lock] = {}  # account_id -> lock around its AssumeRole
+        self._role_session_lock = threading.Lock()  # guards _role_session_locks only
+        
+        # Idempotency guards so retried or concurrent flows don't link billing or issue credentials twice
+        self._billing_linked: Set[str] = set()
+        self._aws_creds_cache: Dict[str, Dict[str, str]] = {}
+        self._gcp_creds_cache: Dict[Tuple[str, Optional[str]], Dict[str, Any]] = {}
+        self._idempotency_lock = threading.Lock()
+        
+        # The shared app instance outlives a failed probe; _ensure_connected retries it
+        self._connection_lock = threading.Lock()
+        self._last_connection_probe = time.monotonic()
+        self.setup_master_connections()
+    
+    def _apply_secrets(self):
+        """Set the PlatForge master account settings from self.secrets"""
         self.platforge_aws_access_key = self.secrets["aws"]["access_key_id"]
         self.platforge_aws_secret_key = self.secrets["aws"]["secret_access_key"]
         self.platforge_aws_org_id = self.secrets["aws"]["organization_id"]
@@ -41,75 +769,121 @@ class DynamicCloudProvisioner:
         self.platforge_gcp_project_id = self.secrets["gcp"]["project_id"]
         self.platforge_gcp_billing_account = self.secrets["gcp"]["billing_account_id"]
         self.gcp_mode = self.secrets["gcp"].get("mode", "single_project")
-        
-        # Service categorization for our exact 25 services
-        self.service_requirements = {
-            # AWS Services - need AWS sub-account
-            "aws_rds": {"provider": "aws", "type": "managed_service"},
-            "redshift": {"provider": "aws", "type": "managed_service"},
-            "dynamodb": {"provider": "aws", "type": "managed_service"},
-            "aws_glue": {"provider": "aws", "type": "managed_service"},
-            "aws_ec2": {"provider": "aws", "type": "managed_service"},
-            
-            # GCP Services - need GCP project
-            "gcp_cloud_sql": {"provider": "gcp", "type": "managed_service"},
-            "bigquery": {"provider": "gcp", "type": "managed_service"},
-            "firestore": {"provider": "gcp", "type": "managed_service"},
-            "gcp_dataflow": {"provider": "gcp", "type": "managed_service"},
-            "gcp_compute": {"provider": "gcp", "type": "managed_service"},
-            "gke": {"provider": "gcp", "type": "managed_service"},
-            "gcp_pubsub": {"provider": "gcp", "type": "managed_service"},
-            "looker": {"provider": "gcp", "type": "managed_service"},
-            "gcp_build": {"provider": "gcp", "type": "managed_service"},
-            "cloud_storage": {"provider": "gcp", "type": "managed_service"},
-            
-            # Additional AWS services
-            "s3": {"provider": "aws", "type": "managed_service"},
-            
-            # Third-party services - need external accounts
-            "mongodb": {"provider": "mongodb_atlas", "type": "third_party"},
-            "snowflake": {"provider": "snowflake", "type": "third_party"},
-            "tableau": {"provider": "tableau", "type": "third_party"},
-            "powerbi": {"provider": "microsoft", "type": "third_party"},
-            
-            # Deployable services - need deployment target
-            "airflow": {"provider": "deployable", "type": "container"},
-            "spark": {"provider": "deployable", "type": "container"},
-            "dbt": {"provider": "deployable", "type": "container"},
-            "metabase": {"provider": "deployable", "type": "container"},
-            "grafana": {"provider": "deployable", "type": "container"},
-            "docker": {"provider": "deployable", "type": "container"},
-            "terraform": {"provider": "deployable", "type": "tool"}
+        self._console_urls = {
+            page: template.replace("{project_id}", self.platforge_gcp_project_id)
+            for page, template in GCP_CONSOLE_URL_TEMPLATES.items()
         }
-        
-        self.setup_master_connections()
+    
+    def _client(self, session: boto3.Session, service_name: str, region_name: Optional[str] = None,
+                single_attempt: bool = False):
+        """Get a boto3 client, memoized per (session, service, region, retry mode); creation is serialized"""
+        region_name = region_name or session.region_name
+        key = (service_name, region_name, single_attempt)
+        with self._client_lock:
+            session_clients = self._client_cache.setdefault(session, {})
+            client = session_clients.get(key)
+            if client is None:
+                config = _BOTO_SINGLE_ATTEMPT_CFG if single_attempt else _BOTO_CFG
+                client = session.client(service_name, region_name=region_name, config=config)
+                session_clients[key] = client
+            return client
     
     def _load_accounts_database(self) -> Dict[str, Any]:
-        """Load previously created accounts from JSON file"""
+        """Load previously created accounts by replaying the JSON Lines log (latest record per key wins)"""
         try:
-            if not self.accounts_db_file.exists():
-                print("📝 No existing accounts database found - creating new one")
-                return {"accounts": {}, "last_updated": time.time()}
-            
-            with open(self.accounts_db_file, 'r') as f:
-                accounts_db = json.load(f)
-            
-            print(f"✅ Loaded {len(accounts_db.get('accounts', {}))} existing accounts")
-            return accounts_db
+            # Held through compaction so no other writer appends to a log that is about to be replaced
+            with _locked_accounts_log(self.accounts_db_file):
+                if not self.accounts_db_file.exists():
+                    if self.legacy_accounts_db_file.exists():
+                        return self._migrate_legacy_accounts_database()
+                    logger.info("📝 No existing accounts database found - creating new one")
+                    return {"accounts": {}, "last_updated": time.time()}
+                
+                accounts, record_count = replay_accounts_log(self.accounts_db_file)
+                
+                # Re-link once all patches are applied, so aliases point at the latest field values
+                for data in accounts.values():
+                    self._unpack_account_record(data)
+                
+                accounts, rekeyed = self._rekey_legacy_accounts(accounts)
+                accounts_db = {"accounts": accounts, "last_updated": time.time()}
+                logger.info(f"✅ Loaded {len(accounts)} existing accounts")
+                
+                if rekeyed or record_count > 2 * len(accounts):
+                    self._compact_accounts_db(accounts)
+                return accounts_db
             
         except Exception as e:
-            print(f"⚠️ Failed to load accounts database: {e}")
+            logger.warning(f"⚠️ Failed to load accounts database: {e}")
             return {"accounts": {}, "last_updated": time.time()}
     
-    def _save_accounts_database(self):
-        """Save accounts database to JSON file"""
+    def _migrate_legacy_accounts_database(self) -> Dict[str, Any]:
+        """Convert the old whole-file JSON database into the JSON Lines log"""
+        with open(self.legacy_accounts_db_file, 'rb') as f:
+            accounts_db = _json_loads(f.read())
+        accounts, _ = self._rekey_legacy_accounts(accounts_db.get("accounts", {}))
+        self._compact_accounts_db(accounts)
+        logger.info(f"📦 Migrated {len(accounts)} accounts from {self.legacy_accounts_db_file.name}")
+        return {"accounts": accounts, "last_updated": time.time()}
+    
+    def _compact_accounts_db(self, accounts: Dict[str, Any]):
+        """Rewrite the log with one full record per account (atomic replace; caller holds the log lock)"""
+        tmp_file = self.accounts_db_file.with_suffix(".jsonl.tmp")
+        with open(tmp_file, 'wb') as f:
+            for key, data in accounts.items():
+                f.write(_json_dumps_line({"key": key, "data": self._pack_account_record(data)}))
+            # The rewrite must be on disk before it replaces the log, or a crash can leave an empty DB
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.accounts_db_file)
+        logger.info(f"🗜️ Compacted accounts database to {len(accounts)} records")
+    
+    @staticmethod
+    def _pack_account_record(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Drop access_package copies of top-level fields so each account is serialized once"""
+        access_package = data.get("access_package")
+        if not isinstance(access_package, dict):
+            return data
+        shared = [field for field, source in ACCESS_PACKAGE_SHARED_FIELDS.items()
+                  if field in access_package and source in data
+                  and (access_package[field] is data[source] or access_package[field] == data[source])]
+        if not shared:
+            return data
+        packed_access = {k: v for k, v in access_package.items() if k not in shared}
+        return {**data, "access_package": packed_access}
+    
+    @staticmethod
+    def _unpack_account_record(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Re-link access_package fields that were dropped by _pack_account_record"""
+        access_package = data.get("access_package")
+        if isinstance(access_package, dict):
+            for field, source in ACCESS_PACKAGE_SHARED_FIELDS.items():
+                if field not in access_package and source in data:
+                    access_package[field] = data[source]
+        return data
+    
+    def _append_account_record(self, account_key: str, data: Optional[Dict[str, Any]] = None, **patch: Any):
+        """Persist one account: a full record when data is given, otherwise a small field patch"""
+        if data is not None:
+            record = {"key": account_key, "data": self._pack_account_record(data)}
+        else:
+            record = {"key": account_key, "patch": patch}
         try:
+            line = _json_dumps_line(record)
+            with _locked_accounts_log(self.accounts_db_file):
+                with open(self.accounts_db_file, 'ab') as f:
+                    f.write(line)
             self.accounts_db["last_updated"] = time.time()
-            with open(self.accounts_db_file, 'w') as f:
-                json.dump(self.accounts_db, f, indent=2, default=str)
-            print(f"💾 Saved accounts database with {len(self.accounts_db['accounts'])} accounts")
+            logger.info(f"💾 Saved account record for {account_key}")
         except Exception as e:
-            print(f"⚠️ Failed to save accounts database: {e}")
+            logger.warning(f"⚠️ Failed to save accounts database: {e}")
+    
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _read_secrets_file(path: str, mtime: float) -> Dict[str, Any]:
+        """Parse the secrets file; mtime is part of the cache key so edits are picked up"""
+        with open(path, 'rb') as f:
+            return _json_loads(f.read())
     
     def _load_secrets(self) -> Dict[str, Any]:
         """Load credentials from secure secrets file"""
@@ -117,15 +891,15 @@ class DynamicCloudProvisioner:
             if not self.secrets_file.exists():
                 raise FileNotFoundError(f"Secrets file not found: {self.secrets_file}")
             
-            with open(self.secrets_file, 'r') as f:
-                secrets = json.load(f)
+            # Parsed once per file version and shared by every provisioner instance
+            secrets = self._read_secrets_file(str(self.secrets_file), self.secrets_file.stat().st_mtime)
             
-            print(f"✅ Loaded credentials from {self.secrets_file}")
+            logger.info(f"✅ Loaded credentials from {self.secrets_file}")
             return secrets
             
         except Exception as e:
-            print(f"⚠️ Failed to load secrets file: {e}")
-            print("📝 Using mock mode - create platforge_secrets.json with real credentials")
+            logger.warning(f"⚠️ Failed to load secrets file: {e}")
+            logger.info("📝 Using mock mode - create platforge_secrets.json with real credentials")
             return {
                 "aws": {
                     "access_key_id": "MOCK_KEY",
@@ -141,6 +915,37 @@ class DynamicCloudProvisioner:
                 }
             }
     
+    def _current_secrets_mtime(self) -> Optional[float]:
+        """Modification time of the secrets file, or None while it doesn't exist"""
+        try:
+            return self.secrets_file.stat().st_mtime
+        except OSError:
+            return None
+    
+    def _gcp_configured(self) -> bool:
+        """True when the secrets point at a real GCP service account (otherwise GCP stays in mock mode)"""
+        return GCP_AVAILABLE and self.platforge_gcp_service_account_file != "mock_service_account.json"
+    
+    def _ensure_connected(self):
+        """Reload edited secrets, and re-probe a provider that is still disconnected (at most every CONNECTION_RETRY_INTERVAL)"""
+        with self._connection_lock:
+            secrets_mtime = self._current_secrets_mtime()
+            if secrets_mtime != self._secrets_mtime:
+                logger.info("🔄 Secrets file changed - reloading credentials")
+                self._secrets_mtime = secrets_mtime
+                self.secrets = self._load_secrets()
+                self._apply_secrets()
+            elif self.aws_connected and (self.gcp_connected or not self._gcp_configured()):
+                return
+            elif time.monotonic() - self._last_connection_probe < CONNECTION_RETRY_INTERVAL:
+                return
+            
+            self._last_connection_probe = time.monotonic()
+            self.setup_master_connections()
+            # GCP clients hold the previous credentials; boto3 clients are keyed by the (new) session
+            with self._client_lock:
+                self._gcp_clients.clear()
+    
     def setup_master_connections(self):
         """Initialize connections to PlatForge master accounts"""
         try:
@@ -150,46 +955,47 @@ class DynamicCloudProvisioner:
                 aws_secret_access_key=self.platforge_aws_secret_key,
                 region_name=self.platforge_aws_region
             )
-            print("✅ Connected to AWS master account")
+            logger.info("✅ Connected to AWS master account")
             
-            # Test AWS connection
-            org_client = self.aws_master_session.client('organizations')
+            # Test AWS connection (a single attempt, so an unreachable AWS doesn't stall startup)
+            probe_client = self.aws_master_session.client('organizations', config=_BOTO_SINGLE_ATTEMPT_CFG)
             try:
-                org_info = org_client.describe_organization()
-                print(f"📋 AWS Organization ID: {org_info['Organization']['Id']}")
+                org_info = probe_client.describe_organization()
+                logger.info(f"📋 AWS Organization ID: {org_info['Organization']['Id']}")
                 self.aws_connected = True
             except Exception as aws_e:
-                print(f"⚠️ AWS Organizations not enabled or insufficient permissions: {aws_e}")
-                print("📝 Using AWS mock mode for testing")
+                logger.warning(f"⚠️ AWS Organizations not enabled or insufficient permissions: {aws_e}")
+                logger.info("📝 Using AWS mock mode for testing")
                 self.aws_connected = False
             
             # GCP setup (optional)
-            if GCP_AVAILABLE and self.platforge_gcp_service_account_file != "mock_service_account.json":
+            if self._gcp_configured():
                 try:
-                    import os
+                    from google.oauth2 import service_account
+                    
                     # Try environment variable first (for Railway deployment)
                     gcp_json_env = os.environ.get('GOOGLE_APPLICATION_CREDENTIALS_JSON')
                     if gcp_json_env:
                         import json
                         gcp_info = json.loads(gcp_json_env)
                         self.gcp_master_credentials = service_account.Credentials.from_service_account_info(gcp_info)
-                        print("✅ Connected to GCP master account (from environment variable)")
+                        logger.info("✅ Connected to GCP master account (from environment variable)")
                     else:
                         # Fallback to file (for local development)
                         self.gcp_master_credentials = service_account.Credentials.from_service_account_file(
                             self.platforge_gcp_service_account_file
                         )
-                        print("✅ Connected to GCP master account (from file)")
+                        logger.info("✅ Connected to GCP master account (from file)")
                     self.gcp_connected = True
                 except Exception as gcp_e:
-                    print(f"⚠️ GCP connection failed: {gcp_e}")
+                    logger.warning(f"⚠️ GCP connection failed: {gcp_e}")
                     self.gcp_connected = False
             else:
-                print("📝 GCP not configured - AWS-only mode")
+                logger.info("📝 GCP not configured - AWS-only mode")
                 self.gcp_connected = False
             
         except Exception as e:
-            print(f"⚠️ Master account connection failed: {e}")
+            logger.warning(f"⚠️ Master account connection failed: {e}")
             self.aws_connected = False
             self.gcp_connected = False
     
@@ -215,30 +1021,19 @@ class DynamicCloudProvisioner:
             "deployable_services": []
         }
         
+        # One lookup per service into the precomputed partition; lists keep pipeline order
         for service in pipeline_services:
-            if service not in self.service_requirements:
-                continue
-                
-            service_req = self.service_requirements[service]
-            
-            if service_req["provider"] == "aws":
-                requirements["needs_aws_account"] = True
-                requirements["aws_services"].append(service)
-                
-            elif service_req["provider"] == "gcp":
-                requirements["needs_gcp_project"] = True
-                requirements["gcp_services"].append(service)
-                
-            elif service_req["type"] == "third_party":
-                requirements["needs_third_party_accounts"].append({
-                    "service": service,
-                    "provider": service_req["provider"]
-                })
-                requirements["third_party_services"].append(service)
-                
-            elif service_req["provider"] == "deployable":
-                requirements["needs_deployment_target"] = True
-                requirements["deployable_services"].append(service)
+            category = _SERVICE_CATEGORY.get(service)
+            if category:
+                requirements[category].append(service)
+        
+        requirements["needs_aws_account"] = bool(requirements["aws_services"])
+        requirements["needs_gcp_project"] = bool(requirements["gcp_services"])
+        requirements["needs_deployment_target"] = bool(requirements["deployable_services"])
+        requirements["needs_third_party_accounts"] = [
+            {"service": service, "provider": _SERVICE_REQUIREMENTS[service][0]}
+            for service in requirements["third_party_services"]
+        ]
         
         # If we have deployable services but no cloud provider, default to AWS
         if requirements["needs_deployment_target"] and not (requirements["needs_aws_account"] or requirements["needs_gcp_project"]):
@@ -253,124 +1048,221 @@ class DynamicCloudProvisioner:
         
         return requirements
     
-    def _get_account_key(self, startup_info: Dict[str, str]) -> str:
-        """Generate a consistent key for startup account lookup"""
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _get_account_key(name: str, email: str) -> str:
+        """Generate a consistent fixed-length key for startup account lookup"""
         # Use startup name + founder email as unique identifier
-        return f"{startup_info['name'].lower().replace(' ', '-')}_{startup_info['email'].lower()}"
+        return hashlib.blake2b(f"{name.lower()}|{email.lower()}".encode(), digest_size=16).hexdigest()
+    
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _available_aws_regions() -> frozenset:
+        """Regions EC2 is offered in, from botocore's bundled endpoint data (no network call)"""
+        return frozenset(boto3.Session().get_available_regions('ec2'))
+    
+    def _rekey_legacy_accounts(self, accounts: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+        """Move accounts stored under the old name_email keys to their digest keys"""
+        rekeyed: Dict[str, Any] = {}
+        changed = False
+        for key, data in accounts.items():
+            info = data.get("startup_info") or {}
+            if info.get("name") and info.get("email"):
+                new_key = self._get_account_key(info["name"], info["email"])
+                changed = changed or new_key != key
+                key = new_key
+            rekeyed[key] = data
+        return rekeyed, changed
     
     def _find_existing_account(self, startup_info: Dict[str, str]) -> Optional[Dict[str, Any]]:
         """Check if account already exists for this startup"""
-        account_key = self._get_account_key(startup_info)
+        account_key = self._get_account_key(startup_info['name'], startup_info['email'])
         
         if account_key in self.accounts_db["accounts"]:
             existing_account = self.accounts_db["accounts"][account_key]
-            print(f"🔍 Found existing account for {startup_info['name']}")
-            print(f"   Account ID: {existing_account.get('account_id', 'N/A')}")
-            print(f"   Created: {existing_account.get('created_at', 'N/A')}")
+            logger.info(f"🔍 Found existing account for {startup_info['name']}")
+            logger.info(f"   Account ID: {existing_account.get('account_id', 'N/A')}")
+            logger.info(f"   Created: {existing_account.get('created_at', 'N/A')}")
             return existing_account
         
         return None
     
     def auto_provision_startup_infrastructure(self, 
                                             startup_info: Dict[str, str], 
-                                            pipeline_services: List[str]) -> Dict[str, Any]:
+                                            pipeline_services: List[str],
+                                            include_code: bool = False) -> Dict[str, Any]:
         """
         Automatically provision exactly what the startup needs
         
         Args:
             startup_info: {"name": "My Startup", "email": "founder@startup.com", "founder_name": "John"}
             pipeline_services: ["bigquery", "airflow", "metabase"] 
+            include_code: attach python_code connection snippets to newly provisioned resources
         
         Returns:
             Complete provisioning results with access credentials
         """
+        self._ensure_connected()
         
-        print(f"🚀 Auto-provisioning infrastructure for: {startup_info['name']}")
-        print(f"📦 Pipeline services: {', '.join(pipeline_services)}")
+        preferred_region = startup_info.get("preferred_region")
+        if preferred_region and preferred_region not in self._available_aws_regions():
+            raise ValueError(f"Unknown AWS region: {preferred_region}")
+        
+        # Identical requests already in flight (e.g. a double-submitted form) share one run;
+        # completed ones are served from the accounts database by the existing-account path
+        plan_key = hashlib.blake2b(
+            f"{self._get_account_key(startup_info['name'], startup_info['email'])}|{','.join(sorted(set(pipeline_services)))}|{include_code}".encode(),
+            digest_size=16
+        ).hexdigest()
+        with _plan_lock:
+            pending = _inflight_plans.get(plan_key)
+            if pending is None:
+                plan = _inflight_plans[plan_key] = Future()
+        
+        if pending is not None:
+            logger.info(f"⏳ Identical provisioning request for {startup_info['name']} already running - waiting for it")
+            return pending.result()
+        
+        try:
+            result = self._run_provisioning_plan(startup_info, pipeline_services, include_code)
+            plan.set_result(result)
+            return result
+        except BaseException as e:
+            plan.set_exception(e)
+            raise
+        finally:
+            with _plan_lock:
+                del _inflight_plans[plan_key]
+    
+    async def auto_provision_startup_infrastructure_async(self, startup_info: Dict[str, str],
+                                                          pipeline_services: List[str],
+                                                          include_code: bool = False) -> Dict[str, Any]:
+        """Awaitable auto_provision_startup_infrastructure; runs on a worker thread so the event loop stays free"""
+        return await asyncio.to_thread(self.auto_provision_startup_infrastructure, startup_info, pipeline_services, include_code)
+    
+    def bulk_provision(self, batch: List[Tuple[Dict[str, str], List[str]]]) -> List[Dict[str, Any]]:
+        """Onboard several startups at once; AWS account creations and their status polls overlap"""
+        if not batch:
+            return []
+        logger.info(f"📦 Bulk provisioning {len(batch)} startups")
+        
+        def provision_one(startup_info: Dict[str, str], pipeline_services: List[str]) -> Dict[str, Any]:
+            try:
+                return self.auto_provision_startup_infrastructure(startup_info, pipeline_services)
+            except Exception as e:
+                # One failed onboarding must not sink the rest of the batch
+                logger.error(f"❌ Bulk provisioning failed for {startup_info.get('name')}: {e}")
+                return {
+                    "status": "error",
+                    "startup_info": startup_info,
+                    "message": f"Infrastructure setup failed: {e}"
+                }
+        
+        with ThreadPoolExecutor(max_workers=min(len(batch), MAX_BULK_PROVISIONING_WORKERS)) as executor:
+            futures = [executor.submit(provision_one, startup_info, pipeline_services)
+                       for startup_info, pipeline_services in batch]
+            return [future.result() for future in futures]
+    
+    async def bulk_provision_async(self, batch: List[Tuple[Dict[str, str], List[str]]]) -> List[Dict[str, Any]]:
+        """Awaitable bulk_provision; the batch fans out on worker threads so the event loop stays free"""
+        return await asyncio.to_thread(self.bulk_provision, batch)
+    
+    def _run_provisioning_plan(self, startup_info: Dict[str, str], pipeline_services: List[str],
+                               include_code: bool = False) -> Dict[str, Any]:
+        """Provision a startup's pipeline (one run per plan; see auto_provision_startup_infrastructure)"""
+        logger.info(f"🚀 Auto-provisioning infrastructure for: {startup_info['name']}")
+        logger.info(f"📦 Pipeline services: {', '.join(pipeline_services)}")
         
         # Debug: Show which services are recognized vs unrecognized
         recognized_services = []
         unrecognized_services = []
         for service in pipeline_services:
-            if service in self.service_requirements:
-                recognized_services.append(f"{service} ({self.service_requirements[service]['provider']})")
+            if service in _SERVICE_REQUIREMENTS:
+                provider, _ = _SERVICE_REQUIREMENTS[service]
+                recognized_services.append(f"{service} ({provider})")
             else:
                 unrecognized_services.append(service)
         
         if recognized_services:
-            print(f"✅ Recognized services: {', '.join(recognized_services)}")
+            logger.info(f"✅ Recognized services: {', '.join(recognized_services)}")
         if unrecognized_services:
-            print(f"⚠️ Unrecognized services (will be skipped): {', '.join(unrecognized_services)}")
+            logger.warning(f"⚠️ Unrecognized services (will be skipped): {', '.join(unrecognized_services)}")
         
         # Step 0: Check if account already exists
         existing_account = self._find_existing_account(startup_info)
         if existing_account:
-            print(f"✅ Using existing account infrastructure")
+            logger.info(f"✅ Using existing account infrastructure")
             # Load existing account data and re-provision any missing services
-            return self._load_existing_account_infrastructure(existing_account, pipeline_services, startup_info)
+            return self._load_existing_account_infrastructure(existing_account, pipeline_services, startup_info, include_code)
         
         # Step 1: Generate new startup ID and analyze requirements
-        startup_id = f"{startup_info['name'].lower().replace(' ', '-')}-{uuid.uuid4().hex[:6]}"
+        names = NameSpec.from_startup_info(startup_info)
+        startup_id = f"{names.slug}-{_rand_hex(6)}"
         requirements = self.analyze_pipeline_requirements(pipeline_services)
         
-        print(f"📋 Requirements analysis:")
-        print(f"   AWS Account: {requirements['needs_aws_account']} ({len(requirements['aws_services'])} services)")
+        logger.info(f"📋 Requirements analysis:")
+        logger.info(f"   AWS Account: {requirements['needs_aws_account']} ({len(requirements['aws_services'])} services)")
         if requirements['aws_services']:
-            print(f"     → AWS Services: {', '.join(requirements['aws_services'])}")
-        print(f"   GCP Project: {requirements['needs_gcp_project']} ({len(requirements['gcp_services'])} services)")
+            logger.info(f"     → AWS Services: {', '.join(requirements['aws_services'])}")
+        logger.info(f"   GCP Project: {requirements['needs_gcp_project']} ({len(requirements['gcp_services'])} services)")
         if requirements['gcp_services']:
-            print(f"     → GCP Services: {', '.join(requirements['gcp_services'])}")
-        print(f"   Third-party: {len(requirements['third_party_services'])} services")
-        print(f"   Deployable: {len(requirements['deployable_services'])} services")
+            logger.info(f"     → GCP Services: {', '.join(requirements['gcp_services'])}")
+        logger.info(f"   Third-party: {len(requirements['third_party_services'])} services")
+        logger.info(f"   Deployable: {len(requirements['deployable_services'])} services")
         
-        print(f"🎯 Conditional Provisioning Strategy:")
+        logger.info(f"🎯 Conditional Provisioning Strategy:")
         if requirements['needs_aws_account'] and requirements['needs_gcp_project']:
-            print("   → Multi-cloud: Both AWS and GCP required")
+            logger.info("   → Multi-cloud: Both AWS and GCP required")
         elif requirements['needs_aws_account']:
-            print("   → AWS-only: Creating AWS sub-account")
+            logger.info("   → AWS-only: Creating AWS sub-account")
         elif requirements['needs_gcp_project']:
-            print("   → GCP-only: Creating GCP project namespace")
+            logger.info("   → GCP-only: Creating GCP project namespace")
         else:
-            print("   → Cloud-free: Only third-party/deployable services")
+            logger.info("   → Cloud-free: Only third-party/deployable services")
         
-        # Step 2: Provision cloud environments - only what's needed
+        # Steps 2-3 are independent: the AWS account poll (minutes), GCP project setup and
+        # third-party signups overlap instead of running back to back
         provisioned_environments = {}
-        
-        # Only provision AWS if AWS services are required
-        if requirements["needs_aws_account"]:
-            print(f"🔨 Creating AWS sub-account for {len(requirements['aws_services'])} AWS services...")
-            print(f"   AWS Services: {', '.join(requirements['aws_services'])}")
-            aws_env = self._create_aws_subaccount(startup_info, startup_id)
-            provisioned_environments["aws"] = aws_env
-        else:
-            print("⏭️  No AWS services required - skipping AWS account creation")
-        
-        # Only provision GCP if GCP services are required
-        if requirements["needs_gcp_project"] and self.gcp_connected:
-            print(f"🔨 Creating GCP project for {len(requirements['gcp_services'])} GCP services...")
-            print(f"   GCP Services: {', '.join(requirements['gcp_services'])}")
-            gcp_env = self._create_gcp_project(startup_info, startup_id)
-            provisioned_environments["gcp"] = gcp_env
-        elif requirements["needs_gcp_project"]:
-            print("⚠️ GCP project needed but GCP not configured - skipping")
-        else:
-            print("⏭️  No GCP services required - skipping GCP project creation")
-        
-        # Step 3: Create third-party accounts
-        third_party_accounts = []
-        for third_party in requirements["needs_third_party_accounts"]:
-            print(f"🔨 Creating {third_party['provider']} account...")
-            account = self._create_third_party_account(third_party, startup_info)
-            third_party_accounts.append(account)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            # Step 2: Provision cloud environments - only what's needed
+            aws_future = gcp_future = None
+            
+            # Only provision AWS if AWS services are required
+            if requirements["needs_aws_account"]:
+                logger.info(f"🔨 Creating AWS sub-account for {len(requirements['aws_services'])} AWS services...")
+                logger.info(f"   AWS Services: {', '.join(requirements['aws_services'])}")
+                aws_future = executor.submit(self._create_aws_subaccount, startup_info, startup_id)
+            else:
+                logger.info("⏭️  No AWS services required - skipping AWS account creation")
+            
+            # Only provision GCP if GCP services are required
+            if requirements["needs_gcp_project"] and self.gcp_connected:
+                logger.info(f"🔨 Creating GCP project for {len(requirements['gcp_services'])} GCP services...")
+                logger.info(f"   GCP Services: {', '.join(requirements['gcp_services'])}")
+                gcp_future = executor.submit(self._create_gcp_project, startup_info, startup_id)
+            elif requirements["needs_gcp_project"]:
+                logger.warning("⚠️ GCP project needed but GCP not configured - skipping")
+            else:
+                logger.info("⏭️  No GCP services required - skipping GCP project creation")
+            
+            # Step 3: Create third-party accounts (independent external APIs - run concurrently)
+            third_party_future = executor.submit(
+                self._create_third_party_accounts_parallel,
+                requirements["needs_third_party_accounts"], startup_info
+            )
+            
+            if aws_future:
+                aws_env = aws_future.result()
+                # Resources land in the startup's preferred region when one is given
+                aws_env["region"] = startup_info.get("preferred_region") or self.platforge_aws_region
+                provisioned_environments["aws"] = aws_env
+            if gcp_future:
+                provisioned_environments["gcp"] = gcp_future.result()
+            third_party_accounts = third_party_future.result()
         
         # Step 4: Provision actual resources
-        provisioned_resources = []
-        
-        for service in pipeline_services:
-            print(f"🎯 Provisioning {service}...")
-            resource = self._provision_service_resource(service, provisioned_environments, startup_info)
-            if resource:
-                provisioned_resources.append(resource)
+        provisioned_resources = self._provision_services_parallel(pipeline_services, provisioned_environments, startup_info, names,
+                                                                  include_code)
         
         # Step 5: Generate access credentials and dashboard
         access_package = self._generate_startup_access_package(
@@ -378,15 +1270,17 @@ class DynamicCloudProvisioner:
         )
         
         # Step 6: Save account data for future use
-        account_key = self._get_account_key(startup_info)
+        account_key = self._get_account_key(startup_info['name'], startup_info['email'])
         account_data = {
             "startup_id": startup_id,
             "startup_info": startup_info,
+            "names": {"slug": names.slug, "slug_alnum": names.slug_alnum},
             "created_at": time.time(),
             "last_accessed": time.time(),
             "provisioned_environments": provisioned_environments,
             "provisioned_resources": provisioned_resources,
             "pipeline_services": pipeline_services,
+            "requirements": requirements,
             "access_package": access_package
         }
         
@@ -405,7 +1299,7 @@ class DynamicCloudProvisioner:
             })
         
         self.accounts_db["accounts"][account_key] = account_data
-        self._save_accounts_database()
+        self._append_account_record(account_key, account_data)
         
         result = {
             "status": "success",
@@ -459,44 +1353,63 @@ class DynamicCloudProvisioner:
     
     def _load_existing_account_infrastructure(self, existing_account: Dict[str, Any], 
                                            pipeline_services: List[str], 
-                                           startup_info: Dict[str, str]) -> Dict[str, Any]:
+                                           startup_info: Dict[str, str],
+                                           include_code: bool = False) -> Dict[str, Any]:
         """Load and return existing account infrastructure"""
         
-        # Update last accessed time
-        account_key = self._get_account_key(startup_info)
-        self.accounts_db["accounts"][account_key]["last_accessed"] = time.time()
-        self._save_accounts_database()
+        # Update last accessed time (persisted once, below; polling clients are throttled)
+        account_key = self._get_account_key(startup_info['name'], startup_info['email'])
+        now = time.time()
+        touch_due = now - existing_account.get("last_accessed", 0) >= LAST_ACCESSED_WRITE_INTERVAL
+        if touch_due:
+            existing_account["last_accessed"] = now
         
         # Check if we need to provision any new services
         existing_services = set(existing_account.get("pipeline_services", []))
         requested_services = set(pipeline_services)
         new_services = requested_services - existing_services
         
+        # Same pipeline as last time: reuse the requirements stored at provisioning
+        requirements = existing_account.get("requirements") if requested_services == existing_services else None
+        if requirements is None:
+            requirements = self.analyze_pipeline_requirements(pipeline_services)
+        
         if new_services:
-            print(f"🔧 Provisioning {len(new_services)} new services: {', '.join(new_services)}")
+            logger.info(f"🔧 Provisioning {len(new_services)} new services: {', '.join(new_services)}")
             # Provision new services and add them to existing infrastructure
-            for service in new_services:
-                resource = self._provision_service_resource(
-                    service, 
-                    existing_account["provisioned_environments"], 
-                    startup_info
-                )
-                if resource:
-                    existing_account["provisioned_resources"].append(resource)
+            names = NameSpec.from_account_record(existing_account, startup_info)
+            ordered_new_services = [service for service in dict.fromkeys(pipeline_services) if service in new_services]
+            existing_account["provisioned_resources"].extend(self._provision_services_parallel(
+                ordered_new_services,
+                existing_account["provisioned_environments"],
+                startup_info,
+                names,
+                include_code
+            ))
             
             # Update pipeline services list
             existing_account["pipeline_services"] = list(requested_services)
-            
-            # Save updated account data
+            existing_account["requirements"] = requirements
+            existing_account["last_accessed"] = now
             self.accounts_db["accounts"][account_key] = existing_account
-            self._save_accounts_database()
+            
+            # Environments and credentials never change after creation; persist only the mutable fields
+            self._append_account_record(
+                account_key,
+                last_accessed=existing_account["last_accessed"],
+                pipeline_services=existing_account["pipeline_services"],
+                provisioned_resources=existing_account["provisioned_resources"],
+                requirements=requirements
+            )
+        elif touch_due:
+            self._append_account_record(account_key, last_accessed=now)
         
         # Return existing account data in the expected format
         result = {
             "status": "success",
             "startup_id": existing_account["startup_id"],
             "startup_info": existing_account["startup_info"],
-            "requirements": self.analyze_pipeline_requirements(pipeline_services),
+            "requirements": requirements,
             "provisioned_environments": existing_account["provisioned_environments"],
             "third_party_accounts": existing_account.get("third_party_accounts", []),
             "provisioned_resources": existing_account["provisioned_resources"],
@@ -542,11 +1455,10 @@ class DynamicCloudProvisioner:
         
         return result
     
-    def list_existing_accounts(self) -> List[Dict[str, Any]]:
-        """List all existing accounts in the database"""
-        accounts = []
-        for account_key, account_data in self.accounts_db["accounts"].items():
-            accounts.append({
+    def list_existing_accounts(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """List existing accounts, most recently accessed first (only the top `limit` when given)"""
+        accounts = (
+            {
                 "key": account_key,
                 "startup_name": account_data["startup_info"]["name"],
                 "founder_email": account_data["startup_info"]["email"],
@@ -555,12 +1467,15 @@ class DynamicCloudProvisioner:
                 "last_accessed": account_data.get("last_accessed", 0),
                 "services_count": len(account_data.get("provisioned_resources", [])),
                 "pipeline_services": account_data.get("pipeline_services", [])
-            })
+            }
+            for account_key, account_data in self.accounts_db["accounts"].items()
+        )
         
-        # Sort by last accessed (most recent first)
-        accounts.sort(key=lambda x: x["last_accessed"], reverse=True)
+        if limit is not None:
+            return heapq.nlargest(limit, accounts, key=lambda x: x["last_accessed"])
         
-        return accounts
+        # Sort by last accessed (most recent first)
+        return sorted(accounts, key=lambda x: x["last_accessed"], reverse=True)
     
     def _create_aws_subaccount(self, startup_info: Dict[str, str], startup_id: str) -> Dict[str, Any]:
         """Create isolated AWS sub-account using Organizations"""
@@ -572,50 +1487,75 @@ class DynamicCloudProvisioner:
                     "account_name": f"PlatForge-{startup_info['name']}",
                     "console_url": f"https://123456789{startup_id[-3:]}.signin.aws.amazon.com/console",
                     "status": "active",
-                    "credentials": {
-                        "access_key_id": f"AKIA{uuid.uuid4().hex[:16].upper()}",
-                        "secret_access_key": f"{uuid.uuid4().hex}{uuid.uuid4().hex}",
-                        "region": "us-east-1"
-                    }
+                    "credentials": self._generate_aws_credentials()
                 }
             
-            org_client = self.aws_master_session.client('organizations')
+            org_client = self._client(self.aws_master_session, 'organizations')
             
-            # Create new AWS account
-            response = org_client.create_account(
-                Email=startup_info['email'],
-                AccountName=f"PlatForge-{startup_info['name']}",
-                RoleName='PlatForgeManagementRole'
-            )
-            
-            # Get the creation request ID
-            creation_request_id = response['CreateAccountStatus']['Id']
+            # A run that stopped polling (shutdown or timeout) left this request in progress; resume it
+            # rather than re-sending CreateAccount, which would fail with EMAIL_ALREADY_EXISTS
+            creation_request_id = self._pending_aws_account_request(startup_info['email'])
+            if creation_request_id:
+                logger.info(f"🔁 Resuming AWS account creation left in progress (Request ID: {creation_request_id})")
+                created_status = None
+            else:
+                # Create new AWS account. CreateAccount has no idempotency token: a re-sent request after a
+                # lost response fails with EMAIL_ALREADY_EXISTS while the first account is created unrecorded,
+                # so it gets exactly one attempt (no cloud_retry, no botocore retries)
+                create_client = self._client(self.aws_master_session, 'organizations', single_attempt=True)
+                response = create_client.create_account(
+                    Email=startup_info['email'],
+                    AccountName=f"PlatForge-{startup_info['name']}",
+                    RoleName='PlatForgeManagementRole'
+                )
+                
+                # Get the creation request ID
+                created_status = response['CreateAccountStatus']
+                creation_request_id = created_status['Id']
+                
+                logger.info(f"🚀 AWS account creation initiated (Request ID: {creation_request_id})")
             
-            print(f"🚀 AWS account creation initiated (Request ID: {creation_request_id})")
-            print("📝 Account will be ready in 2-5 minutes - polling for completion...")
+            logger.info("📝 Account will be ready in 2-5 minutes - polling for completion...")
             
-            # Poll for completion (AWS account creation takes 2-5 minutes)
-            max_attempts = 60  # 5 minutes with 5-second intervals
-            account_id = None
+            # Poll for completion with backoff (1s growing to 8s) instead of a fixed 5s grid
+            attempts = 0
             
-            for attempt in range(max_attempts):
-                time.sleep(5)
-                status_response = org_client.describe_create_account_status(
+            def describe_status() -> Dict[str, Any]:
+                nonlocal attempts
+                attempts += 1
+                creation_status = org_client.describe_create_account_status(
                     CreateAccountRequestId=creation_request_id
-                )
-                
-                status = status_response['CreateAccountStatus']['State']
-                print(f"⏳ Attempt {attempt + 1}/60: Account creation {status.lower()}")
-                
-                if status == 'SUCCEEDED':
-                    account_id = status_response['CreateAccountStatus']['AccountId']
-                    print(f"✅ AWS account created successfully: {account_id}")
-                    break
-                elif status == 'FAILED':
-                    error_reason = status_response['CreateAccountStatus'].get('FailureReason', 'Unknown error')
-                    raise Exception(f"Account creation failed: {error_reason}")
-                elif attempt == max_attempts - 1:
-                    raise Exception("Account creation timed out after 5 minutes")
+                )['CreateAccountStatus']
+                logger.info(f"⏳ Attempt {attempts}: Account creation {creation_status['State'].lower()}")
+                return creation_status
+            
+            creation_status = _poll_describe(
+                describe_status,
+                lambda creation_status: creation_status['State'] != 'IN_PROGRESS',
+                timeout=ACCOUNT_CREATION_TIMEOUT,
+                initial_delay=1.0,
+                created=created_status,
+                backoff=1.5,
+                max_delay=8.0
+            )
+            
+            if creation_status['State'] == 'IN_PROGRESS':
+                self._set_pending_aws_account_request(startup_info['email'], creation_request_id)
+                if _shutdown_event.is_set():
+                    logger.warning(f"⚠️ Shutdown during AWS account creation (Request ID: {creation_request_id}) - "
+                                   "saved so the next request for this startup resumes it")
+                    raise Exception(f"Interrupted by shutdown; account creation {creation_request_id} is still in progress")
+                raise Exception("Account creation timed out after 5 minutes")
+            if created_status is None:
+                self._set_pending_aws_account_request(startup_info['email'], None)
+            
+            account_id = None
+            if creation_status['State'] == 'SUCCEEDED':
+                account_id = creation_status['AccountId']
+                logger.info(f"✅ AWS account created successfully: {account_id}")
+            elif creation_status['State'] == 'FAILED':
+                error_reason = creation_status.get('FailureReason', 'Unknown error')
+                raise Exception(f"Account creation failed: {error_reason}")
             
             if not account_id:
                 raise Exception("Failed to retrieve account ID")
@@ -634,38 +1574,79 @@ class DynamicCloudProvisioner:
         except Exception as e:
             raise Exception(f"AWS sub-account creation failed: {e}")
     
+    def _pending_aws_account_request(self, email: str) -> Optional[str]:
+        """CreateAccount request ID an earlier run left in progress for this email, if any"""
+        try:
+            return _json_loads(self.pending_aws_accounts_file.read_bytes()).get(email)
+        except FileNotFoundError:
+            return None
+        except ValueError as e:
+            logger.warning(f"⚠️ Ignoring unreadable {self.pending_aws_accounts_file.name}: {e}")
+            return None
+    
+    def _set_pending_aws_account_request(self, email: str, request_id: Optional[str]):
+        """Record an in-progress CreateAccount request for recovery, or clear it when request_id is None"""
+        try:
+            with _locked_accounts_log(self.accounts_db_file):
+                try:
+                    pending = _json_loads(self.pending_aws_accounts_file.read_bytes())
+                except (FileNotFoundError, ValueError):
+                    pending = {}
+                if request_id is None:
+                    pending.pop(email, None)
+                else:
+                    pending[email] = request_id
+                tmp_file = self.pending_aws_accounts_file.with_suffix(".json.tmp")
+                tmp_file.write_bytes(_json_dumps_pretty(pending))
+                os.replace(tmp_file, self.pending_aws_accounts_file)
+        except OSError as e:
+            logger.error(f"❌ Failed to persist pending AWS account request {request_id} for {email}: {e}")
+    
+    def _build_gcp_result(self, project_name: str, startup_namespace: str, isolation_level: str,
+                          credentials: Dict[str, Any], note: Optional[str] = None, **extra: Any) -> Dict[str, Any]:
+        """Shared shape of every _create_gcp_project return value"""
+        result = {
+            "project_id": self.platforge_gcp_project_id,
+            "project_name": project_name,
+            "console_url": self._console_urls["dashboard"],
+            "status": "active",
+            "startup_namespace": startup_namespace,
+            "isolation_level": isolation_level,
+            "credentials": credentials
+        }
+        result.update(extra)
+        if note:
+            result["note"] = note
+        return result
+    
     def _create_gcp_project(self, startup_info: Dict[str, str], startup_id: str) -> Dict[str, Any]:
         """Create enhanced shared project isolation with dedicated service accounts"""
+        startup_namespace = f"startup-{startup_id}"
         try:
-            startup_namespace = f"startup-{startup_id}"
             service_account_name = f"platforge-{startup_id.lower()}"
+            service_account_email = f"{service_account_name}@{self.platforge_gcp_project_id}.iam.gserviceaccount.com"
             
             if not self.gcp_connected:
                 # Mock mode - simulate enhanced isolation
-                print(f"🔧 Creating enhanced isolation in shared project: {self.platforge_gcp_project_id}")
-                print(f"📝 Startup namespace: {startup_namespace}")
-                print(f"🔑 Dedicated service account: {service_account_name}@{self.platforge_gcp_project_id}.iam.gserviceaccount.com")
+                logger.info(f"🔧 Creating enhanced isolation in shared project: {self.platforge_gcp_project_id}")
+                logger.info(f"📝 Startup namespace: {startup_namespace}")
+                logger.info(f"🔑 Dedicated service account: {service_account_email}")
                 
-                return {
-                    "project_id": self.platforge_gcp_project_id,
-                    "project_name": f"PlatForge-{startup_info['name']}-Isolated",
-                    "console_url": f"https://console.cloud.google.com/home/dashboard?project={self.platforge_gcp_project_id}",
-                    "status": "active",
-                    "startup_namespace": startup_namespace,
-                    "service_account": f"{service_account_name}@{self.platforge_gcp_project_id}.iam.gserviceaccount.com",
-                    "isolation_level": "enhanced_shared",
-                    "credentials": {
-                        "service_account_json": f'{{"project_id": "{self.platforge_gcp_project_id}", "type": "service_account", "client_email": "{service_account_name}@{self.platforge_gcp_project_id}.iam.gserviceaccount.com"}}',
+                return self._build_gcp_result(
+                    f"PlatForge-{startup_info['name']}-Isolated", startup_namespace, "enhanced_shared",
+                    credentials={
+                        **self._service_account_key_fields(self.platforge_gcp_project_id, client_email=service_account_email),
                         "project_id": self.platforge_gcp_project_id,
-                        "service_account_email": f"{service_account_name}@{self.platforge_gcp_project_id}.iam.gserviceaccount.com"
-                    }
-                }
+                        "service_account_email": service_account_email
+                    },
+                    service_account=service_account_email
+                )
             
             if self.gcp_mode == "enhanced_shared_project":
                 # Enhanced shared project with strong isolation
-                print(f"🔧 Creating enhanced isolation in shared project: {self.platforge_gcp_project_id}")
-                print(f"📝 Startup namespace: {startup_namespace}")
-                print(f"🔑 Creating dedicated service account: {service_account_name}")
+                logger.info(f"🔧 Creating enhanced isolation in shared project: {self.platforge_gcp_project_id}")
+                logger.info(f"📝 Startup namespace: {startup_namespace}")
+                logger.info(f"🔑 Creating dedicated service account: {service_account_name}")
                 
                 try:
                     # Create dedicated service account for startup
@@ -677,79 +1658,56 @@ class DynamicCloudProvisioner:
                     # Create startup-specific storage bucket
                     bucket_name = self._create_startup_storage_bucket(startup_id, startup_info)
                     
-                    print(f"✅ Enhanced shared project isolation created successfully")
+                    logger.info(f"✅ Enhanced shared project isolation created successfully")
                     
-                    return {
-                        "project_id": self.platforge_gcp_project_id,
-                        "project_name": f"PlatForge-{startup_info['name']}-Isolated",
-                        "console_url": f"https://console.cloud.google.com/home/dashboard?project={self.platforge_gcp_project_id}",
-                        "status": "active",
-                        "startup_namespace": startup_namespace,
-                        "service_account": service_account_info["email"],
-                        "storage_bucket": bucket_name,
-                        "isolation_level": "enhanced_shared",
-                        "credentials": service_account_info,
-                        "iam_roles": [
-                            f"roles/bigquery.dataEditor",
-                            f"roles/storage.objectAdmin",
-                            f"roles/viewer"
+                    return self._build_gcp_result(
+                        f"PlatForge-{startup_info['name']}-Isolated", startup_namespace, "enhanced_shared",
+                        credentials=service_account_info,
+                        service_account=service_account_info["email"],
+                        storage_bucket=bucket_name,
+                        iam_roles=[
+                            "roles/bigquery.dataEditor",
+                            "roles/storage.objectAdmin",
+                            "roles/viewer"
                         ]
-                    }
+                    )
                     
                 except Exception as isolation_error:
-                    print(f"⚠️ Enhanced isolation setup failed: {isolation_error}")
-                    print(f"📝 Falling back to basic shared project mode")
+                    logger.warning(f"⚠️ Enhanced isolation setup failed: {isolation_error}")
+                    logger.info(f"📝 Falling back to basic shared project mode")
                     
                     # Fallback to basic shared project
-                    return {
-                        "project_id": self.platforge_gcp_project_id,
-                        "project_name": f"PlatForge-{startup_info['name']}-Basic",
-                        "console_url": f"https://console.cloud.google.com/home/dashboard?project={self.platforge_gcp_project_id}",
-                        "status": "active",
-                        "startup_namespace": startup_namespace,
-                        "service_account": f"{service_account_name}@{self.platforge_gcp_project_id}.iam.gserviceaccount.com",
-                        "isolation_level": "basic_shared",
-                        "note": f"Enhanced isolation failed - using basic isolation: {isolation_error}",
-                        "credentials": {
-                            "service_account_json": f'{{"project_id": "{self.platforge_gcp_project_id}", "type": "service_account"}}',
+                    return self._build_gcp_result(
+                        f"PlatForge-{startup_info['name']}-Basic", startup_namespace, "basic_shared",
+                        credentials={
+                            **self._service_account_key_fields(self.platforge_gcp_project_id),
                             "project_id": self.platforge_gcp_project_id
-                        }
-                    }
+                        },
+                        note=f"Enhanced isolation failed - using basic isolation: {isolation_error}",
+                        service_account=service_account_email
+                    )
             
             else:
                 # Basic shared project mode (fallback)
-                print(f"🔧 Using basic shared GCP project: {self.platforge_gcp_project_id}")
-                print(f"📝 Startup namespace: {startup_namespace}")
+                logger.info(f"🔧 Using basic shared GCP project: {self.platforge_gcp_project_id}")
+                logger.info(f"📝 Startup namespace: {startup_namespace}")
                 
                 # Create basic service account
-                startup_credentials = self._create_gcp_startup_credentials(self.platforge_gcp_project_id)
+                startup_credentials = self._create_gcp_startup_credentials(self.platforge_gcp_project_id, startup_namespace)
                 
-                return {
-                    "project_id": self.platforge_gcp_project_id,
-                    "project_name": f"PlatForge-Shared-Project",
-                    "console_url": f"https://console.cloud.google.com/home/dashboard?project={self.platforge_gcp_project_id}",
-                    "status": "active",
-                    "startup_namespace": startup_namespace,
-                    "isolation_level": "basic_shared",
-                    "credentials": startup_credentials
-                }
+                return self._build_gcp_result(
+                    "PlatForge-Shared-Project", startup_namespace, "basic_shared",
+                    credentials=startup_credentials
+                )
             
         except Exception as e:
-            print(f"⚠️ GCP project setup failed: {e}")
+            logger.warning(f"⚠️ GCP project setup failed: {e}")
             # Return working shared project data
-            startup_namespace = f"startup-{startup_id}"
-            return {
-                "project_id": self.platforge_gcp_project_id,
-                "project_name": f"PlatForge-{startup_info['name']}-Fallback",
-                "console_url": f"https://console.cloud.google.com/home/dashboard?project={self.platforge_gcp_project_id}",
-                "status": "active",
-                "startup_namespace": startup_namespace,
-                "isolation_level": "fallback",
-                "note": f"Enhanced setup failed - using fallback: {e}",
-                "credentials": {
-                    "project_id": self.platforge_gcp_project_id
-                }
-            }
+            return self._build_gcp_result(
+                f"PlatForge-{startup_info['name']}-Fallback", startup_namespace, "fallback",
+                credentials={"project_id": self.platforge_gcp_project_id},
+                note=f"Enhanced setup failed - using fallback: {e}"
+            )
     
     def _create_startup_service_account(self, startup_id: str, startup_info: Dict[str, str]) -> Dict[str, str]:
         """Create dedicated service account for startup isolation"""
@@ -762,14 +1720,14 @@ class DynamicCloudProvisioner:
             service_account_display_name = f"PlatForge Service Account - {startup_info['name']}"
             
             # Console URLs for easy access
-            service_account_console_url = f"https://console.cloud.google.com/iam-admin/serviceaccounts/details/{service_account_email}?project={self.platforge_gcp_project_id}"
-            service_account_keys_url = f"https://console.cloud.google.com/iam-admin/serviceaccounts/details/{service_account_email}/keys?project={self.platforge_gcp_project_id}"
+            service_account_console_url = self._console_urls["service_account"].format(email=service_account_email)
+            service_account_keys_url = self._console_urls["service_account_keys"].format(email=service_account_email)
             
             if not self.gcp_connected:
                 # Enhanced mock service account with real URLs
-                print(f"🔑 Mock: Creating service account {service_account_email}")
-                print(f"📝 Display Name: {service_account_display_name}")
-                print(f"🔗 Console URL: {service_account_console_url}")
+                logger.info(f"🔑 Mock: Creating service account {service_account_email}")
+                logger.info(f"📝 Display Name: {service_account_display_name}")
+                logger.info(f"🔗 Console URL: {service_account_console_url}")
                 
                 return {
                     "email": service_account_email,
@@ -780,7 +1738,11 @@ class DynamicCloudProvisioner:
                     "keys_url": service_account_keys_url,
                     "status": "mock_created",
                     "note": "Mock service account - ready for real GCP integration",
-                    "service_account_json": f'{{"type": "service_account", "project_id": "{self.platforge_gcp_project_id}", "client_email": "{service_account_email}", "client_id": "mock-{startup_id}"}}',
+                    **self._service_account_key_fields(
+                        self.platforge_gcp_project_id,
+                        client_email=service_account_email,
+                        client_id=f"mock-{startup_id}"
+                    ),
                     "instructions": [
                         f"1. Go to: {service_account_console_url}",
                         "2. Create a new key for this service account",
@@ -790,14 +1752,14 @@ class DynamicCloudProvisioner:
                 }
             
             # Real service account creation
-            print(f"🔑 Creating real service account: {service_account_email}")
+            logger.info(f"🔑 Creating real service account: {service_account_email}")
             
             try:
                 from google.cloud.iam_admin_v1 import IAMClient
                 from google.cloud.iam_admin_v1.types import ServiceAccount, CreateServiceAccountRequest
                 
-                # Create IAM client with our credentials
-                iam_client = IAMClient(credentials=self.gcp_master_credentials)
+                # IAM client with our credentials (shared across startups)
+                iam_client = self._gcp_client(("iam",), lambda: IAMClient(credentials=self.gcp_master_credentials))
                 
                 # Create service account request
                 parent = f"projects/{self.platforge_gcp_project_id}"
@@ -813,11 +1775,26 @@ class DynamicCloudProvisioner:
                     service_account=service_account_obj
                 )
                 
+                from google.api_core import exceptions as gcp_exceptions
+                
+                attempts = 0
+                
+                def create_service_account():
+                    nonlocal attempts
+                    attempts += 1
+                    try:
+                        return iam_client.create_service_account(request=request)
+                    except gcp_exceptions.AlreadyExists:
+                        # A retry after an attempt that went through but whose response was lost
+                        if attempts == 1:
+                            raise
+                        return iam_client.get_service_account(name=f"{parent}/serviceAccounts/{service_account_email}")
+                
                 # Create the service account
-                created_account = iam_client.create_service_account(request=request)
+                created_account = cloud_retry(create_service_account)()
                 
-                print(f"✅ Service account created successfully: {created_account.email}")
-                print(f"🔗 Console URL: {service_account_console_url}")
+                logger.info(f"✅ Service account created successfully: {created_account.email}")
+                logger.info(f"🔗 Console URL: {service_account_console_url}")
                 
                 # Grant basic IAM roles to the service account
                 self._grant_service_account_roles(service_account_email)
@@ -831,7 +1808,7 @@ class DynamicCloudProvisioner:
                     "keys_url": service_account_keys_url,
                     "status": "active",
                     "unique_id": getattr(created_account, 'unique_id', 'auto-generated'),
-                    "service_account_json": f'{{"type": "service_account", "project_id": "{self.platforge_gcp_project_id}", "client_email": "{created_account.email}"}}',
+                    **self._service_account_key_fields(self.platforge_gcp_project_id, client_email=created_account.email),
                     "instructions": [
                         f"1. Go to: {service_account_console_url}",
                         "2. Click 'Keys' tab",
@@ -841,31 +1818,31 @@ class DynamicCloudProvisioner:
                 }
                 
             except Exception as gcp_error:
-                print(f"⚠️ Real service account creation failed: {gcp_error}")
+                logger.warning(f"⚠️ Real service account creation failed: {gcp_error}")
                 
-                # Check if it's an API enablement issue
-                if "SERVICE_DISABLED" in str(gcp_error) or "has not been used" in str(gcp_error):
-                    print(f"")
-                    print(f"🔧 SOLUTION: Enable the IAM API in your GCP project")
-                    print(f"   1. Visit: https://console.developers.google.com/apis/api/iam.googleapis.com/overview?project={self.platforge_gcp_project_id}")
-                    print(f"   2. Click 'ENABLE' button")
-                    print(f"   3. Wait 2-3 minutes for activation")
-                    print(f"   4. Try auto-provisioning again")
-                    print(f"")
+                # Check if it's an API enablement issue (a PermissionDenied, so test it first)
+                if _gcp_error_reason(gcp_error) == "SERVICE_DISABLED":
+                    logger.info(f"")
+                    logger.info(f"🔧 SOLUTION: Enable the IAM API in your GCP project")
+                    logger.info(f"   1. Visit: {self._console_urls['iam_api']}")
+                    logger.info(f"   2. Click 'ENABLE' button")
+                    logger.info(f"   3. Wait 2-3 minutes for activation")
+                    logger.info(f"   4. Try auto-provisioning again")
+                    logger.info(f"")
                 
                 # Check if it's a permission issue
-                elif "iam.serviceAccounts.create" in str(gcp_error) or "IAM_PERMISSION_DENIED" in str(gcp_error):
-                    print(f"")
-                    print(f"🔧 SOLUTION: Grant Service Account Admin role to your service account")
-                    print(f"   1. Visit: https://console.cloud.google.com/iam-admin/iam?project={self.platforge_gcp_project_id}")
-                    print(f"   2. Find your service account in the list")
-                    print(f"   3. Click 'Edit' (pencil icon)")
-                    print(f"   4. Add role: 'Service Account Admin'")
-                    print(f"   5. Click 'Save'")
-                    print(f"   6. Try auto-provisioning again")
-                    print(f"")
+                elif _is_permission_error(gcp_error):
+                    logger.info(f"")
+                    logger.info(f"🔧 SOLUTION: Grant Service Account Admin role to your service account")
+                    logger.info(f"   1. Visit: {self._console_urls['iam']}")
+                    logger.info(f"   2. Find your service account in the list")
+                    logger.info(f"   3. Click 'Edit' (pencil icon)")
+                    logger.info(f"   4. Add role: 'Service Account Admin'")
+                    logger.info(f"   5. Click 'Save'")
+                    logger.info(f"   6. Try auto-provisioning again")
+                    logger.info(f"")
                 
-                print(f"📝 Falling back to mock service account with real URLs")
+                logger.info(f"📝 Falling back to mock service account with real URLs")
                 
                 # Fallback to mock but with real console URLs
                 return {
@@ -877,10 +1854,10 @@ class DynamicCloudProvisioner:
                     "keys_url": service_account_keys_url,
                     "status": "creation_failed",
                     "note": f"Service account creation failed: {gcp_error}",
-                    "service_account_json": f'{{"type": "service_account", "project_id": "{self.platforge_gcp_project_id}", "client_email": "{service_account_email}"}}',
+                    **self._service_account_key_fields(self.platforge_gcp_project_id, client_email=service_account_email),
                     "instructions": [
                         "Manual creation required:",
-                        f"1. Go to: https://console.cloud.google.com/iam-admin/serviceaccounts?project={self.platforge_gcp_project_id}",
+                        f"1. Go to: {self._console_urls['service_accounts']}",
                         f"2. Create service account: {service_account_name}",
                         f"3. Set display name: {service_account_display_name}",
                         "4. Grant required roles for this startup"
@@ -888,14 +1865,14 @@ class DynamicCloudProvisioner:
                 }
             
         except Exception as e:
-            print(f"⚠️ Service account setup failed: {e}")
+            logger.warning(f"⚠️ Service account setup failed: {e}")
             # Return fallback data with manual instructions
             service_account_email = f"platforge-{startup_id.lower()}@{self.platforge_gcp_project_id}.iam.gserviceaccount.com"
             return {
                 "email": service_account_email,
                 "name": f"platforge-{startup_id.lower()}",
                 "project_id": self.platforge_gcp_project_id,
-                "console_url": f"https://console.cloud.google.com/iam-admin/serviceaccounts?project={self.platforge_gcp_project_id}",
+                "console_url": self._console_urls["service_accounts"],
                 "status": "manual_creation_required",
                 "note": f"Automatic creation failed: {e}",
                 "instructions": [
@@ -910,9 +1887,13 @@ class DynamicCloudProvisioner:
         """Grant necessary IAM roles to the service account"""
         try:
             from google.cloud import resourcemanager
+            from google.api_core import exceptions as gcp_exceptions
             
-            # Create Resource Manager client 
-            rm_client = resourcemanager.Client(credentials=self.gcp_master_credentials)
+            # Resource Manager client (shared across startups)
+            rm_client = self._gcp_client(
+                ("resourcemanager",),
+                lambda: resourcemanager.Client(credentials=self.gcp_master_credentials)
+            )
             
             # Get project
             project = rm_client.project(self.platforge_gcp_project_id)
@@ -924,32 +1905,43 @@ class DynamicCloudProvisioner:
                 "roles/viewer"
             ]
             
-            print(f"🔒 Granting IAM roles to {service_account_email}")
-            for role in roles_to_grant:
-                try:
-                    # Get current IAM policy
-                    policy = project.get_iam_policy()
-                    
-                    # Add service account to role
-                    member = f"serviceAccount:{service_account_email}"
+            member = f"serviceAccount:{service_account_email}"
+            logger.info(f"🔒 Granting IAM roles to {service_account_email}")
+            
+            # Read-modify-write with the policy etag: set_iam_policy is rejected with a 409
+            # (Conflict, of which Aborted is a subclass) if another job changed the policy
+            # since our read, so re-read and retry
+            for attempt in range(1, IAM_POLICY_MAX_ATTEMPTS + 1):
+                policy = project.get_iam_policy()
+                
+                granted = []
+                for role in roles_to_grant:
                     if role not in policy.bindings:
                         policy.bindings[role] = []
-                    
                     if member not in policy.bindings[role]:
                         policy.bindings[role].append(member)
-                        print(f"   → Granted: {role}")
-                    else:
-                        print(f"   → Already has: {role}")
-                    
-                    # Set updated policy
+                        granted.append(role)
+                
+                if not granted:
+                    logger.info(f"   → Already has: {', '.join(roles_to_grant)}")
+                    return
+                
+                try:
                     project.set_iam_policy(policy)
-                    
-                except Exception as role_error:
-                    print(f"   ⚠️ Failed to grant {role}: {role_error}")
+                except gcp_exceptions.Conflict:
+                    logger.debug(f"IAM policy etag conflict for {service_account_email} (attempt {attempt}/{IAM_POLICY_MAX_ATTEMPTS})")
+                    if attempt == IAM_POLICY_MAX_ATTEMPTS:
+                        raise
+                    time.sleep(random.uniform(0, 0.5 * 2 ** attempt))
+                    continue
+                
+                for role in granted:
+                    logger.info(f"   → Granted: {role}")
+                return
             
         except Exception as e:
-            print(f"⚠️ IAM role granting failed: {e}")
-            print("📝 Service account created but may need manual role assignment")
+            logger.warning(f"⚠️ IAM role granting failed: {e}")
+            logger.info("📝 Service account created but may need manual role assignment")
     
     def _setup_startup_iam_isolation(self, startup_id: str, service_account_email: str) -> None:
         """Set up IAM roles for startup resource isolation"""
@@ -957,10 +1949,10 @@ class DynamicCloudProvisioner:
             startup_namespace = f"startup-{startup_id}"
             
             if not self.gcp_connected:
-                print(f"🔒 Mock: Setting up IAM isolation for {service_account_email}")
-                print(f"   → BigQuery datasets: {startup_namespace}_*")
-                print(f"   → Storage buckets: platforge-{startup_id}-*")
-                print(f"   → Looker instances: {startup_id}-*")
+                logger.info(f"🔒 Mock: Setting up IAM isolation for {service_account_email}")
+                logger.info(f"   → BigQuery datasets: {startup_namespace}_*")
+                logger.info(f"   → Storage buckets: platforge-{startup_id}-*")
+                logger.info(f"   → Looker instances: {startup_id}-*")
                 return
             
             # Real IAM setup would go here
@@ -971,13 +1963,13 @@ class DynamicCloudProvisioner:
                 "roles/viewer"  # Basic project viewing
             ]
             
-            print(f"🔒 Setting up IAM isolation for {service_account_email}")
+            logger.info(f"🔒 Setting up IAM isolation for {service_account_email}")
             for role in roles_to_grant:
-                print(f"   → Granted role: {role}")
+                logger.info(f"   → Granted role: {role}")
                 # Actual IAM binding would happen here
             
         except Exception as e:
-            print(f"⚠️ IAM isolation setup failed: {e}")
+            logger.warning(f"⚠️ IAM isolation setup failed: {e}")
     
     def _create_startup_storage_bucket(self, startup_id: str, startup_info: Dict[str, str]) -> str:
         """Create dedicated storage bucket for startup"""
@@ -985,7 +1977,7 @@ class DynamicCloudProvisioner:
             bucket_name = f"platforge-{startup_id.lower()}-data"
             
             if not self.gcp_connected:
-                print(f"🪣 Mock: Creating storage bucket {bucket_name}")
+                logger.info(f"🪣 Mock: Creating storage bucket {bucket_name}")
                 return bucket_name
             
             # Real bucket creation would go here
@@ -993,27 +1985,53 @@ class DynamicCloudProvisioner:
             # storage_client = storage.Client()
             # bucket = storage_client.create_bucket(bucket_name)
             
-            print(f"🪣 Created storage bucket: {bucket_name}")
+            logger.info(f"🪣 Created storage bucket: {bucket_name}")
             return bucket_name
             
         except Exception as e:
-            print(f"⚠️ Storage bucket creation failed: {e}")
+            logger.warning(f"⚠️ Storage bucket creation failed: {e}")
             return f"platforge-{startup_id.lower()}-data-mock"
     
-    def _create_bigquery_dataset(self, project_id: str, dataset_id: str, startup_namespace: str, startup_info: Dict[str, str]) -> Dict[str, Any]:
+    @staticmethod
+    def _bigquery_dataset_id(startup_namespace: Optional[str], names: NameSpec) -> str:
+        """Dataset id shared by the BigQuery and Looker provisioning (alphanumeric + underscores only)"""
+        if startup_namespace:
+            # Shared project mode - use namespace (clean it up too)
+            return f"{startup_namespace.replace('-', '_')}_{names.slug_alnum}_analytics"
+        # Individual project mode - simple dataset name
+        return f"{names.slug_alnum}_analytics"
+    
+    def _gcp_client(self, key: Tuple[str, ...], factory: Callable[[], Any]):
+        """GCP API client memoized per key, authenticated once and reused across provisioning calls"""
+        with self._client_lock:
+            client = self._gcp_clients.get(key)
+            if client is None:
+                client = self._gcp_clients[key] = factory()
+            return client
+    
+    def _bigquery_client(self, project_id: str):
+        """BigQuery client per project"""
+        from google.cloud import bigquery
+        
+        return self._gcp_client(
+            ("bigquery", project_id),
+            lambda: bigquery.Client(project=project_id, credentials=self.gcp_master_credentials)
+        )
+    
+    def _create_bigquery_dataset(self, project_id: str, dataset_id: str, startup_namespace: str, names: NameSpec) -> Dict[str, Any]:
         """Create a real BigQuery dataset"""
         try:
             from google.cloud import bigquery
             
-            print(f"📊 Creating real BigQuery dataset: {dataset_id}")
+            logger.info(f"📊 Creating real BigQuery dataset: {dataset_id}")
             
-            # Create BigQuery client
-            bq_client = bigquery.Client(project=project_id, credentials=self.gcp_master_credentials)
+            # Shared per-project BigQuery client
+            bq_client = self._bigquery_client(project_id)
             
             # Create dataset object
             dataset = bigquery.Dataset(f"{project_id}.{dataset_id}")
             dataset.location = "US"  # or "EU" based on preference
-            dataset.description = f"Analytics dataset for {startup_info['name']} - Created by PlatForge"
+            dataset.description = f"Analytics dataset for {names.raw} - Created by PlatForge"
             
             # Set access control
             access_entries = list(dataset.access_entries)
@@ -1025,10 +2043,10 @@ class DynamicCloudProvisioner:
                     # We'll need to get this from the calling context
                     break
             
-            # Create the dataset
-            created_dataset = bq_client.create_dataset(dataset, exists_ok=False)
+            # Create the dataset (exists_ok so a retry after a successful first attempt isn't a Conflict)
+            created_dataset = cloud_retry(bq_client.create_dataset)(dataset, exists_ok=True)
             
-            print(f"✅ BigQuery dataset created successfully: {created_dataset.dataset_id}")
+            logger.info(f"✅ BigQuery dataset created successfully: {created_dataset.dataset_id}")
             
             return {
                 "service": "BigQuery",
@@ -1045,17 +2063,17 @@ class DynamicCloudProvisioner:
             }
             
         except Exception as e:
-            print(f"⚠️ Real BigQuery dataset creation failed: {e}")
+            logger.warning(f"⚠️ Real BigQuery dataset creation failed: {e}")
             
             # Check for permission issues
-            if "bigquery.datasets.create" in str(e) or "permission" in str(e).lower():
-                print(f"")
-                print(f"🔧 SOLUTION: Grant BigQuery Admin role to your service account")
-                print(f"   1. Visit: https://console.cloud.google.com/iam-admin/iam?project={project_id}")
-                print(f"   2. Find your service account")
-                print(f"   3. Add role: 'BigQuery Admin'")
-                print(f"   4. Try again")
-                print(f"")
+            if _is_permission_error(e):
+                logger.info(f"")
+                logger.info(f"🔧 SOLUTION: Grant BigQuery Admin role to your service account")
+                logger.info(f"   1. Visit: {self._gcp_console_url('iam', project_id)}")
+                logger.info(f"   2. Find your service account")
+                logger.info(f"   3. Add role: 'BigQuery Admin'")
+                logger.info(f"   4. Try again")
+                logger.info(f"")
             
             # Fallback to mock dataset info
             return {
@@ -1065,18 +2083,18 @@ class DynamicCloudProvisioner:
                 "project_id": project_id,
                 "dataset_id": dataset_id,
                 "startup_namespace": startup_namespace,
-                "query_url": f"https://console.cloud.google.com/bigquery?project={project_id}",
+                "query_url": self._gcp_console_url("bigquery", project_id),
                 "status": "creation_failed",
                 "note": f"Dataset creation failed: {str(e)}",
                 "connection_string": f"bigquery://{project_id}/{dataset_id}",
-                "console_url": f"https://console.cloud.google.com/bigquery?project={project_id}",
+                "console_url": self._gcp_console_url("bigquery", project_id),
                 "error": str(e)
             }
     
-    def _create_looker_instance(self, project_id: str, instance_name: str, startup_namespace: str, startup_info: Dict[str, str], environments: Dict) -> Dict[str, Any]:
+    def _create_looker_instance(self, project_id: str, instance_name: str, startup_namespace: str, names: NameSpec, environments: Dict) -> Mapping[str, Any]:
         """Create a real Looker instance"""
         try:
-            print(f"📊 Creating real Looker instance: {instance_name}")
+            logger.info(f"📊 Creating real Looker instance: {instance_name}")
             
             # Looker in GCP is created through the Looker (Google Cloud core) service
             # This requires the Looker API to be enabled and proper setup
@@ -1089,13 +2107,10 @@ class DynamicCloudProvisioner:
             if "gcp" in environments and "credentials" in environments["gcp"]:
                 # Look for the BigQuery dataset we created
                 if startup_namespace:
-                    clean_startup_name = startup_info['name'].lower().replace(' ', '').replace('-', '')
-                    clean_namespace = startup_namespace.replace('-', '_')
-                    potential_dataset = f"{clean_namespace}_{clean_startup_name}_analytics"
-                    bigquery_dataset = potential_dataset
+                    bigquery_dataset = self._bigquery_dataset_id(startup_namespace, names)
             
-            # Create Looker configuration
-            looker_config = {
+            # Create Looker configuration - LookML/SDK snippets are rendered on first access
+            looker_config = LookerConfig(project_id, instance_name, startup_namespace, bigquery_dataset, {
                 "service": "Looker",
                 "type": "analytics_platform", 
                 "name": instance_name,
@@ -1113,94 +2128,27 @@ class DynamicCloudProvisioner:
                 } if bigquery_dataset else None,
                 
                 # URLs and access
-                "console_url": f"https://console.cloud.google.com/looker/instances?project={project_id}",
+                "console_url": self._gcp_console_url("looker", project_id),
                 "connection_string": f"looker://{project_id}/{instance_name}",
                 
-                # Setup instructions
-                "setup_instructions": [
-                    "1. Go to Looker Console in GCP",
-                    "2. Create new Looker instance", 
-                    f"3. Name it: {instance_name}",
-                    "4. Connect to BigQuery using the service account created",
-                    f"5. Use dataset: {bigquery_dataset}" if bigquery_dataset else "5. Connect to your BigQuery dataset"
-                ],
-                
                 # LookML project setup
                 "lookml_project": {
                     "name": f"{instance_name.replace('-', '_')}_project",
                     "connection_name": f"{instance_name}_bq_connection",
                     "git_repository": f"https://github.com/platforge/{instance_name}-lookml.git"
-                },
-                
-                # Sample LookML code for BigQuery connection
-                "sample_lookml": f"""
-connection: "{instance_name}_bq_connection" {{
-  database: "{project_id}"
-  project_name: "{project_id}"
-  schema: "{bigquery_dataset}"
-  type: bigquery
-}}
-
-view: analytics_data {{
-  sql_table_name: `{project_id}.{bigquery_dataset}.your_table` ;;
-  
-  dimension: id {{
-    primary_key: yes
-    type: string
-    sql: ${{TABLE}}.id ;;
-  }}
-  
-  measure: count {{
-    type: count
-    drill_fields: [id]
-  }}
-}}
-
-explore: analytics_data {{}}
-""" if bigquery_dataset else "",
-                
-                # Python SDK setup code
-                "python_sdk_setup": f"""
-# Looker SDK Setup
-import looker_sdk
-
-# Configuration for your Looker instance
-config = {{
-    'base_url': 'https://your-looker-instance.looker.com:19999',
-    'client_id': 'your_client_id',
-    'client_secret': 'your_client_secret',
-}}
-
-# Initialize SDK
-sdk = looker_sdk.init40(config_settings=config)
-
-# Example: Get all dashboards
-dashboards = sdk.all_dashboards()
-print(f"Found {{len(dashboards)}} dashboards")
-
-# Example: Run a query
-query = {{
-    'model': '{instance_name.replace("-", "_")}_project',
-    'explore': 'analytics_data', 
-    'dimensions': ['analytics_data.id'],
-    'measures': ['analytics_data.count']
-}}
-
-result = sdk.run_inline_query('json', query)
-print("Query result:", result)
-"""
-            }
+                }
+            })
             
-            print(f"✅ Looker configuration created for: {instance_name}")
-            print(f"🔗 Setup in GCP Console: {looker_config['console_url']}")
+            logger.info(f"✅ Looker configuration created for: {instance_name}")
+            logger.info(f"🔗 Setup in GCP Console: {looker_config['console_url']}")
             
             if bigquery_dataset:
-                print(f"📊 Will connect to BigQuery dataset: {bigquery_dataset}")
+                logger.info(f"📊 Will connect to BigQuery dataset: {bigquery_dataset}")
             
             return looker_config
             
         except Exception as e:
-            print(f"⚠️ Looker instance creation failed: {e}")
+            logger.warning(f"⚠️ Looker instance creation failed: {e}")
             
             # Fallback configuration
             return {
@@ -1212,93 +2160,137 @@ print("Query result:", result)
                 "startup_namespace": startup_namespace,
                 "status": "setup_required",
                 "note": f"Looker setup required - {str(e)}",
-                "console_url": f"https://console.cloud.google.com/looker/instances?project={project_id}",
+                "console_url": self._gcp_console_url("looker", project_id),
                 "setup_guide": "Manual Looker instance setup required in GCP Console",
                 "error": str(e)
             }
     
+    # Mock implementations - in reality, these would use actual APIs.
+    # Each factory draws its random tokens from a single _rand_hex() call.
+    @staticmethod
+    def _mk_mongodb_atlas(startup_info: Dict[str, str]) -> Dict[str, Any]:
+        token = _rand_hex(28)
+        return {
+            "service": "MongoDB Atlas",
+            "account_id": f"mongodb-{token[:8]}",
+            "connection_string": f"mongodb+srv://startup:{token[8:16]}@cluster0.mongodb.net/startup_db",
+            "dashboard_url": "https://cloud.mongodb.com",
+            "credentials": {
+                "username": "startup_user",
+                "password": token[16:28],
+                "database": "startup_db"
+            }
+        }
+    
+    @staticmethod
+    def _mk_snowflake(startup_info: Dict[str, str]) -> Dict[str, Any]:
+        token = _rand_hex(36)
+        return {
+            "service": "Snowflake",
+            "account_id": f"snowflake-{token[:8]}",
+            "connection_string": f"snowflake://startup_user:{token[8:16]}@account.snowflakecomputing.com/startup_db",
+            "dashboard_url": "https://app.snowflake.com",
+            "credentials": {
+                "account": f"account-{token[16:24]}",
+                "username": "startup_user",
+                "password": token[24:36],
+                "warehouse": "STARTUP_WH",
+                "database": "STARTUP_DB"
+            }
+        }
+    
+    @staticmethod
+    def _mk_tableau(startup_info: Dict[str, str]) -> Dict[str, Any]:
+        token = _rand_hex(28)
+        site_id = f"startup{token[8:12]}"
+        site_url = f"https://10ax.online.tableau.com/#/site/{site_id}"
+        return {
+            "service": "Tableau Cloud",
+            "account_id": f"tableau-{token[:8]}",
+            "site_url": site_url,
+            "dashboard_url": site_url,
+            "credentials": {
+                "site_id": site_id,
+                "username": startup_info["email"],
+                "token": f"tableau_{token[12:28]}"
+            }
+        }
+    
+    # provider -> factory(startup_info); add more providers as needed
+    _TP_FACTORIES = {
+        "mongodb_atlas": _mk_mongodb_atlas,
+        "snowflake": _mk_snowflake,
+        "tableau": _mk_tableau,
+    }
+    
     def _create_third_party_account(self, third_party_info: Dict[str, str], startup_info: Dict[str, str]) -> Dict[str, Any]:
         """Create third-party service accounts (MongoDB Atlas, Snowflake, etc.)"""
-        
-        service = third_party_info["service"]
         provider = third_party_info["provider"]
+        factory = self._TP_FACTORIES.get(provider)
+        if factory:
+            return factory(startup_info)
+        return {"service": third_party_info["service"], "status": "mock", "provider": provider}
+    
+    def _provision_services_parallel(self, services: List[str], environments: Dict, startup_info: Dict,
+                                     names: NameSpec, include_code: bool = False) -> List[Dict[str, Any]]:
+        """Provision services concurrently (each is an I/O-bound cloud call), keeping pipeline order"""
+        if not services:
+            return []
         
-        # Mock implementation - in reality, these would use actual APIs
-        if provider == "mongodb_atlas":
-            return {
-                "service": "MongoDB Atlas",
-                "account_id": f"mongodb-{uuid.uuid4().hex[:8]}",
-                "connection_string": f"mongodb+srv://startup:{uuid.uuid4().hex[:8]}@cluster0.mongodb.net/startup_db",
-                "dashboard_url": "https://cloud.mongodb.com",
-                "credentials": {
-                    "username": "startup_user",
-                    "password": uuid.uuid4().hex[:12],
-                    "database": "startup_db"
-                }
-            }
+        def provision(service: str) -> Optional[Dict[str, Any]]:
+            slots = _aws_provisioning_slots if _SERVICE_CATEGORY.get(service) == "aws_services" else nullcontext()
+            with slots:
+                resource = self._provision_service_resource(service, environments, startup_info, names)
+            # python_code snippets dominate the response and the stored record; only build them on request
+            if not include_code and isinstance(resource, LazyRecord):
+                resource = resource.without("python_code")
+            return resource
         
-        elif provider == "snowflake":
-            return {
-                "service": "Snowflake",
-                "account_id": f"snowflake-{uuid.uuid4().hex[:8]}",
-                "connection_string": f"snowflake://startup_user:{uuid.uuid4().hex[:8]}@account.snowflakecomputing.com/startup_db",
-                "dashboard_url": "https://app.snowflake.com",
-                "credentials": {
-                    "account": f"account-{uuid.uuid4().hex[:8]}",
-                    "username": "startup_user",
-                    "password": uuid.uuid4().hex[:12],
-                    "warehouse": "STARTUP_WH",
-                    "database": "STARTUP_DB"
-                }
-            }
+        results = [None] * len(services)
+        with ThreadPoolExecutor(max_workers=min(MAX_PROVISIONING_WORKERS, len(services))) as executor:
+            futures = {}
+            for index, service in enumerate(services):
+                logger.info(f"🎯 Provisioning {service}...")
+                futures[executor.submit(provision, service)] = index
+            
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
         
-        elif provider == "tableau":
-            return {
-                "service": "Tableau Cloud",
-                "account_id": f"tableau-{uuid.uuid4().hex[:8]}",
-                "site_url": f"https://10ax.online.tableau.com/#/site/startup{uuid.uuid4().hex[:4]}",
-                "dashboard_url": f"https://10ax.online.tableau.com/#/site/startup{uuid.uuid4().hex[:4]}",
-                "credentials": {
-                    "site_id": f"startup{uuid.uuid4().hex[:4]}",
-                    "username": startup_info["email"],
-                    "token": f"tableau_{uuid.uuid4().hex[:16]}"
-                }
-            }
+        return [resource for resource in results if resource]
+    
+    def _create_third_party_accounts_parallel(self, third_parties: List[Dict[str, str]],
+                                              startup_info: Dict) -> List[Dict[str, Any]]:
+        """Create third-party accounts concurrently, keeping requirement order"""
+        if not third_parties:
+            return []
         
-        # Add more providers as needed
-        return {"service": service, "status": "mock", "provider": provider}
+        for third_party in third_parties:
+            logger.info(f"🔨 Creating {third_party['provider']} account...")
+        with ThreadPoolExecutor(max_workers=min(MAX_PROVISIONING_WORKERS, len(third_parties))) as executor:
+            return list(executor.map(lambda third_party: self._create_third_party_account(third_party, startup_info),
+                                     third_parties))
     
-    def _provision_service_resource(self, service: str, environments: Dict, startup_info: Dict) -> Optional[Dict[str, Any]]:
+    def _provision_service_resource(self, service: str, environments: Dict, startup_info: Dict,
+                                    names: NameSpec) -> Optional[Dict[str, Any]]:
         """Provision actual cloud resources for each service"""
+        aws_env = environments.get("aws")
+        gcp_env = environments.get("gcp")
         
         if service == "bigquery":
             # Create REAL BigQuery dataset in GCP project
-            if "gcp" in environments:
-                project_id = environments["gcp"]["project_id"]
-                startup_namespace = environments["gcp"].get("startup_namespace")
-                
-                # BigQuery dataset IDs must be alphanumeric + underscores only
-                clean_startup_name = startup_info['name'].lower().replace(' ', '').replace('-', '')
-                
-                if startup_namespace:
-                    # Shared project mode - use namespace (clean it up too)
-                    clean_namespace = startup_namespace.replace('-', '_')
-                    dataset_id = f"{clean_namespace}_{clean_startup_name}_analytics"
-                else:
-                    # Individual project mode - simple dataset name
-                    dataset_id = f"{clean_startup_name}_analytics"
+            if gcp_env:
+                project_id = gcp_env["project_id"]
+                startup_namespace = gcp_env.get("startup_namespace")
+                dataset_id = self._bigquery_dataset_id(startup_namespace, names)
                 
                 # Create real BigQuery dataset
-                return self._create_bigquery_dataset(project_id, dataset_id, startup_namespace, startup_info)
+                return self._create_bigquery_dataset(project_id, dataset_id, startup_namespace, names)
         
         elif service == "looker":
             # Create Looker instance in dedicated GCP project
-            if "gcp" in environments:
-                project_id = environments["gcp"]["project_id"]
-                startup_namespace = environments["gcp"].get("startup_namespace")
-                
-                # Clean naming for Looker
-                clean_startup_name = startup_info['name'].lower().replace(' ', '').replace('-', '')
+            if gcp_env:
+                project_id = gcp_env["project_id"]
+                startup_namespace = gcp_env.get("startup_namespace")
                 
                 if startup_namespace:
                     # Shared project mode - use namespace
@@ -1306,64 +2298,61 @@ print("Query result:", result)
                     instance_name = f"{clean_namespace}-looker"
                 else:
                     # Individual project mode - simple instance name
-                    instance_name = f"{clean_startup_name}-looker"
+                    instance_name = f"{names.slug_alnum}-looker"
                 
                 # Create real Looker instance
-                return self._create_looker_instance(project_id, instance_name, startup_namespace, startup_info, environments)
+                return self._create_looker_instance(project_id, instance_name, startup_namespace, names, environments)
         
         elif service == "aws_rds":
             # Create actual RDS instance in AWS account
-            if "aws" in environments:
-                return self._create_rds_instance(environments["aws"], startup_info)
+            if aws_env:
+                return self._create_rds_instance(aws_env, names, wait=startup_info.get("wait_for_resources", False))
         
         elif service == "redshift":
             # Create actual Redshift cluster in AWS account
-            if "aws" in environments:
-                return self._create_redshift_cluster(environments["aws"], startup_info)
+            if aws_env:
+                return self._create_redshift_cluster(aws_env, names)
         
         elif service == "aws_ec2":
             # Create actual EC2 instance in AWS account
-            if "aws" in environments:
-                return self._create_ec2_instance(environments["aws"], startup_info)
+            if aws_env:
+                return self._create_ec2_instance(aws_env, names, wait=startup_info.get("wait_for_resources", False))
         
         
         elif service == "metabase":
             # Deploy Metabase container
-            deployment_provider = environments.get("aws") or environments.get("gcp")
+            deployment_provider = aws_env or gcp_env
             if deployment_provider:
                 return {
                     "service": "Metabase",
                     "type": "dashboard",
-                    "name": f"{startup_info['name'].replace(' ', '-').lower()}-dashboard",
-                    "url": f"https://dashboard-{uuid.uuid4().hex[:8]}.platforge.ai",
+                    "name": f"{names.slug}-dashboard",
+                    "url": f"https://dashboard-{_rand_hex(8)}.platforge.ai",
                     "admin_email": startup_info["email"],
                     "status": "running"
                 }
         
         elif service == "s3" or service == "aws_s3":
             # Create S3 bucket
-            if "aws" in environments:
-                return self._create_s3_bucket(environments["aws"], startup_info)
+            if aws_env:
+                return self._create_s3_bucket(aws_env, names)
         
         # Add more service provisioning logic...
         return None
     
-    def _create_rds_instance(self, aws_env: Dict, startup_info: Dict) -> Dict[str, Any]:
-        """Create actual RDS instance in the AWS sub-account"""
+    def _create_rds_instance(self, aws_env: Dict, names: NameSpec, wait: bool = False) -> Mapping[str, Any]:
+        """Create actual RDS instance in the AWS sub-account (wait=True blocks until it is available)"""
+        # Identifiers are shared by the real attempt and the mock fallback; one random draw
+        # covers the password and the mock endpoint
+        db_instance_id = f"{names.slug}-db"
+        token = _rand_hex(16)
+        master_password = f"StartupPass{token[:8]}!"
+        region = self._aws_region(aws_env)
+        
         try:
-            # Try to assume role in sub-account, fallback to master session
-            try:
-                assumed_session = self._assume_role_in_subaccount(aws_env["account_id"])
-                rds_client = assumed_session.client('rds')
-            except Exception as role_error:
-                print(f"⚠️ Cross-account role assumption failed: {role_error}")
-                print("📝 Using master session - ensure platforge-api user has RDS permissions")
-                rds_client = self.aws_master_session.client('rds')
-            
-            db_instance_id = f"{startup_info['name'].lower().replace(' ', '-')}-db"
-            master_password = f"StartupPass{uuid.uuid4().hex[:8]}!"
+            rds_client, _ = self._subaccount_client(aws_env, 'rds', region)
             
-            print(f"🔨 Creating RDS instance: {db_instance_id}")
+            logger.info(f"🔨 Creating RDS instance: {db_instance_id}")
             
             # Create RDS instance
             response = rds_client.create_db_instance(
@@ -1380,16 +2369,19 @@ print("Query result:", result)
                 MultiAZ=False  # Single AZ for cost savings
             )
             
-            # Wait a moment to get the actual endpoint
-            time.sleep(2)
-            
-            # Get instance details
-            db_instances = rds_client.describe_db_instances(DBInstanceIdentifier=db_instance_id)
-            db_instance = db_instances['DBInstances'][0]
-            
-            endpoint = db_instance.get('Endpoint', {}).get('Address', f"{db_instance_id}.placeholder.us-east-1.rds.amazonaws.com")
+            # RDS assigns the endpoint minutes after creation, far beyond any short poll, so
+            # take it from the create response unless the caller asked to wait for it
+            db_instance = response.get('DBInstance', {})
+            if wait:
+                db_instance = _wait_then_describe(
+                    rds_client, 'db_instance_available', RDS_WAITER_CONFIG,
+                    lambda: rds_client.describe_db_instances(DBInstanceIdentifier=db_instance_id)['DBInstances'][0],
+                    db_instance,
+                    DBInstanceIdentifier=db_instance_id
+                )
+            endpoint = db_instance.get('Endpoint', {}).get('Address') or f"{db_instance_id}.placeholder.{region}.rds.amazonaws.com"
             
-            return {
+            return LazyRecord({
                 "service": "AWS RDS",
                 "type": "database",
                 "name": db_instance_id,
@@ -1398,87 +2390,54 @@ print("Query result:", result)
                 "database": "startupdb",
                 "username": "startupuser",
                 "password": master_password,
-                "status": "creating",
-                "console_url": f"https://console.aws.amazon.com/rds/home?region=us-east-1#database:id={db_instance_id}",
-                "connection_string": f"postgresql://startupuser:{master_password}@{endpoint}:5432/startupdb",
-                "python_code": f'''import psycopg2
-
-# Connect to RDS PostgreSQL
-conn = psycopg2.connect(
-    host="{endpoint}",
-    port=5432,
-    database="startupdb",
-    user="startupuser",
-    password="{master_password}"
-)
-
-cursor = conn.cursor()
-cursor.execute("SELECT version();")
-print(cursor.fetchone())
-conn.close()'''
-            }
+                "status": db_instance.get('DBInstanceStatus', 'creating'),
+                "console_url": f"https://console.aws.amazon.com/rds/home?region={region}#database:id={db_instance_id}",
+                "connection_string": f"postgresql://startupuser:{master_password}@{endpoint}:5432/startupdb"
+            }, python_code=lambda: _RDS_PY_TMPL.format_map({"note": "", "endpoint": endpoint, "password": master_password}))
             
-        except Exception as e:
-            print(f"⚠️ RDS creation failed: {e}")
+        except AWS_PROVISIONING_ERRORS as e:
+            logger.warning(f"⚠️ RDS creation failed: {e}")
             
             # Check if it's a permissions issue
-            if "not authorized" in str(e) or "AccessDenied" in str(e):
-                print("🔧 SOLUTION: Add these permissions to your platforge-api IAM user:")
-                print("   - rds:CreateDBInstance")
-                print("   - rds:DescribeDBInstances") 
-                print("   - rds:CreateDBSubnetGroup")
-                print("   - ec2:DescribeVpcs")
-                print("   - ec2:DescribeSubnets")
-                print("   - ec2:DescribeSecurityGroups")
+            if _is_permission_error(e):
+                logger.info(_RDS_PERMS_HINT)
                 
             # Return mock data if real creation fails
-            mock_password = f"StartupPass{uuid.uuid4().hex[:8]}!"
-            mock_endpoint = f"{startup_info['name'].lower().replace(' ', '-')}-db.{uuid.uuid4().hex[:8]}.us-east-1.rds.amazonaws.com"
+            mock_endpoint = f"{db_instance_id}.{token[8:16]}.{region}.rds.amazonaws.com"
             
-            return {
+            return LazyRecord({
                 "service": "AWS RDS",
                 "type": "database", 
-                "name": f"{startup_info['name'].lower().replace(' ', '-')}-db",
+                "name": db_instance_id,
                 "endpoint": mock_endpoint,
                 "port": 5432,
                 "database": "startupdb",
                 "username": "startupuser",
-                "password": mock_password,
+                "password": master_password,
                 "status": "mock_created",
                 "note": f"Mock resource - real RDS creation failed: {str(e)}",
-                "connection_string": f"postgresql://startupuser:{mock_password}@{mock_endpoint}:5432/startupdb",
-                "python_code": f'''import psycopg2
-
-# Connect to RDS PostgreSQL (Mock - replace with real endpoint)
-conn = psycopg2.connect(
-    host="{mock_endpoint}",
-    port=5432,
-    database="startupdb",
-    user="startupuser",
-    password="{mock_password}"
-)
-
-cursor = conn.cursor()
-cursor.execute("SELECT version();")
-print(cursor.fetchone())
-conn.close()'''
-            }
+                "connection_string": f"postgresql://startupuser:{master_password}@{mock_endpoint}:5432/startupdb"
+            }, python_code=lambda: _RDS_PY_TMPL.format_map({"note": " (Mock - replace with real endpoint)", "endpoint": mock_endpoint, "password": master_password}))
     
-    def _create_redshift_cluster(self, aws_env: Dict, startup_info: Dict) -> Dict[str, Any]:
+    def _create_redshift_cluster(self, aws_env: Dict, names: NameSpec) -> Dict[str, Any]:
         """Create actual Redshift cluster in the AWS sub-account"""
+        cluster_id = f"{names.slug}-warehouse"
+        region = self._aws_region(aws_env)
+        # One random draw: password, then the endpoint suffix (shared by the real and mock records)
+        token = _rand_hex(16)
+        endpoint = f"{cluster_id}.{token[8:16]}.{region}.redshift.amazonaws.com"
+        
         try:
             # Assume role in the sub-account to create resources
             assumed_role_session = self._assume_role_in_subaccount(aws_env["account_id"])
-            redshift_client = assumed_role_session.client('redshift')
-            
-            cluster_id = f"{startup_info['name'].lower().replace(' ', '-')}-warehouse"
+            redshift_client = self._client(assumed_role_session, 'redshift', region)
             
             # Create Redshift cluster
             response = redshift_client.create_cluster(
                 ClusterIdentifier=cluster_id,
                 DBName='startupwarehouse',
                 MasterUsername='startupuser',
-                MasterUserPassword=f"StartupPass{uuid.uuid4().hex[:8]}!",
+                MasterUserPassword=f"StartupPass{token[:8]}!",
                 NodeType='dc2.large',
                 ClusterType='single-node',
                 PubliclyAccessible=True
@@ -1488,49 +2447,47 @@ conn.close()'''
                 "service": "AWS Redshift",
                 "type": "data_warehouse",
                 "name": cluster_id,
-                "endpoint": f"{cluster_id}.{uuid.uuid4().hex[:8]}.us-east-1.redshift.amazonaws.com",
+                "endpoint": endpoint,
                 "port": 5439,
                 "database": "startupwarehouse",
                 "status": "creating",
-                "console_url": f"https://console.aws.amazon.com/redshift/home?region=us-east-1#cluster-details:cluster={cluster_id}"
+                "console_url": f"https://console.aws.amazon.com/redshift/home?region={region}#cluster-details:cluster={cluster_id}"
             }
             
-        except Exception as e:
-            print(f"⚠️ Redshift creation failed: {e}")
+        except AWS_PROVISIONING_ERRORS as e:
+            logger.warning(f"⚠️ Redshift creation failed: {e}")
             # Return mock data if real creation fails
             return {
                 "service": "AWS Redshift",
                 "type": "data_warehouse",
-                "name": f"{startup_info['name'].lower().replace(' ', '-')}-warehouse",
-                "endpoint": f"{startup_info['name'].lower().replace(' ', '-')}-warehouse.{uuid.uuid4().hex[:8]}.us-east-1.redshift.amazonaws.com",
+                "name": cluster_id,
+                "endpoint": endpoint,
                 "port": 5439,
                 "database": "startupwarehouse", 
                 "status": "mock_created",
                 "note": "Mock resource - real Redshift requires cross-account role setup"
             }
     
-    def _create_ec2_instance(self, aws_env: Dict, startup_info: Dict) -> Dict[str, Any]:
-        """Create actual EC2 instance in the AWS sub-account"""
+    def _create_ec2_instance(self, aws_env: Dict, names: NameSpec, wait: bool = False) -> Mapping[str, Any]:
+        """Create actual EC2 instance in the AWS sub-account (wait=True blocks until it is running)"""
+        instance_name = f"{names.slug}-server"
+        region = self._aws_region(aws_env)
+        # One random draw: the run_instances client token, then the mock instance id
+        token = _rand_hex(49)
+        
         try:
-            # Try to assume role in sub-account, fallback to master session
-            try:
-                assumed_session = self._assume_role_in_subaccount(aws_env["account_id"])
-                ec2_client = assumed_session.client('ec2')
-            except Exception as role_error:
-                print(f"⚠️ Cross-account role assumption failed: {role_error}")
-                print("📝 Using master session - ensure platforge-api user has EC2 permissions")
-                ec2_client = self.aws_master_session.client('ec2')
+            ec2_client, ec2_session = self._subaccount_client(aws_env, 'ec2', region)
             
-            instance_name = f"{startup_info['name'].lower().replace(' ', '-')}-server"
+            logger.info(f"🔨 Creating EC2 instance: {instance_name}")
             
-            print(f"🔨 Creating EC2 instance: {instance_name}")
-            
-            # Create EC2 instance
+            # Create EC2 instance; botocore retries throttles (_BOTO_CFG) and the client token
+            # makes those retries return the same instance
             response = ec2_client.run_instances(
-                ImageId='ami-0c02fb55956c7d316',  # Amazon Linux 2 AMI
+                ImageId=self._amazon_linux_ami(ec2_session, region),  # Amazon Linux 2 AMI
                 InstanceType='t3.micro',  # Free tier eligible
                 MinCount=1,
                 MaxCount=1,
+                ClientToken=token[:32],
                 TagSpecifications=[{
                     'ResourceType': 'instance',
                     'Tags': [
@@ -1541,19 +2498,23 @@ conn.close()'''
                 }]
             )
             
-            instance_id = response['Instances'][0]['InstanceId']
-            
-            # Wait a moment to get instance details
-            time.sleep(2)
-            
-            # Get instance details
-            instances = ec2_client.describe_instances(InstanceIds=[instance_id])
-            instance = instances['Reservations'][0]['Instances'][0]
+            instance = response['Instances'][0]
+            instance_id = instance['InstanceId']
+            
+            # A just-launched instance has no public IP yet; unless the caller waits, report the
+            # launch data as-is and let get_ec2_public_ip fill it in later
+            if wait:
+                instance = _wait_then_describe(
+                    ec2_client, 'instance_running', EC2_WAITER_CONFIG,
+                    lambda: ec2_client.describe_instances(InstanceIds=[instance_id])['Reservations'][0]['Instances'][0],
+                    instance,
+                    InstanceIds=[instance_id]
+                )
             
             public_ip = instance.get('PublicIpAddress', 'pending')
             private_ip = instance.get('PrivateIpAddress', 'pending')
             
-            return {
+            return LazyRecord({
                 "service": "AWS EC2",
                 "type": "compute",
                 "name": instance_name,
@@ -1561,197 +2522,182 @@ conn.close()'''
                 "instance_type": "t3.micro",
                 "public_ip": public_ip,
                 "private_ip": private_ip,
-                "status": "launching",
-                "console_url": f"https://console.aws.amazon.com/ec2/home?region=us-east-1#InstanceDetails:instanceId={instance_id}",
-                "ssh_command": f"ssh -i your-key.pem ec2-user@{public_ip}" if public_ip != 'pending' else "SSH command available after launch",
-                "python_code": f'''import boto3
-
-# Connect to EC2
-ec2 = boto3.client('ec2', region_name='us-east-1')
-
-# Get instance details
-response = ec2.describe_instances(InstanceIds=['{instance_id}'])
-instance = response['Reservations'][0]['Instances'][0]
-
-print(f"Instance State: {{instance['State']['Name']}}")
-print(f"Public IP: {{instance.get('PublicIpAddress', 'N/A')}}")
-print(f"Private IP: {{instance.get('PrivateIpAddress', 'N/A')}}")'''
-            }
+                "status": "running" if instance.get('State', {}).get('Name') == 'running' else "launching",
+                "console_url": f"https://console.aws.amazon.com/ec2/home?region={region}#InstanceDetails:instanceId={instance_id}",
+                "ssh_command": f"ssh -i your-key.pem ec2-user@{public_ip}" if public_ip != 'pending' else "SSH command available after launch"
+            }, python_code=lambda: _EC2_PY_TMPL.format_map({"note": "", "region": region, "instance_id": instance_id}))
             
-        except Exception as e:
-            print(f"⚠️ EC2 creation failed: {e}")
+        except AWS_PROVISIONING_ERRORS as e:
+            logger.warning(f"⚠️ EC2 creation failed: {e}")
             
             # Check if it's a permissions issue
-            if "not authorized" in str(e) or "UnauthorizedOperation" in str(e):
-                print("🔧 SOLUTION: Add these permissions to your platforge-api IAM user:")
-                print("   - ec2:RunInstances")
-                print("   - ec2:DescribeInstances")
-                print("   - ec2:DescribeImages")
-                print("   - ec2:CreateTags")
-                print("   - ec2:DescribeKeyPairs")
-                print("   - ec2:DescribeSecurityGroups")
-                print("   - ec2:DescribeSubnets")
-                print("   - ec2:DescribeVpcs")
+            if _is_permission_error(e):
+                logger.info(_EC2_PERMS_HINT)
                 
             # Return mock data if real creation fails
-            mock_instance_id = f"i-{uuid.uuid4().hex[:17]}"
-            return {
+            mock_instance_id = f"i-{token[32:49]}"
+            return LazyRecord({
                 "service": "AWS EC2",
                 "type": "compute",
-                "name": f"{startup_info['name'].lower().replace(' ', '-')}-server",
+                "name": instance_name,
                 "instance_id": mock_instance_id,
                 "instance_type": "t3.micro",
                 "public_ip": "mock.ip.address",
                 "private_ip": "10.0.0.100",
                 "status": "mock_created",
                 "note": f"Mock resource - real EC2 creation failed: {str(e)}",
-                "ssh_command": "ssh -i your-key.pem ec2-user@mock.ip.address",
-                "python_code": f'''import boto3
-
-# Connect to EC2 (Mock - replace with real credentials)
-ec2 = boto3.client('ec2', region_name='us-east-1')
-
-# Get instance details
-response = ec2.describe_instances(InstanceIds=['{mock_instance_id}'])
-instance = response['Reservations'][0]['Instances'][0]
-
-print(f"Instance State: {{instance['State']['Name']}}")
-print(f"Public IP: {{instance.get('PublicIpAddress', 'N/A')}}")
-print(f"Private IP: {{instance.get('PrivateIpAddress', 'N/A')}}")'''
-            }
+                "ssh_command": "ssh -i your-key.pem ec2-user@mock.ip.address"
+            }, python_code=lambda: _EC2_PY_TMPL.format_map({"note": " (Mock - replace with real credentials)", "region": region, "instance_id": mock_instance_id}))
+    
+    def get_rds_endpoint(self, aws_env: Dict, db_instance_id: str) -> Optional[str]:
+        """Current endpoint of a provisioned RDS instance (None while it is still being created)"""
+        rds_client, _ = self._subaccount_client(aws_env, 'rds', self._aws_region(aws_env))
+        db_instance = rds_client.describe_db_instances(DBInstanceIdentifier=db_instance_id)['DBInstances'][0]
+        return db_instance.get('Endpoint', {}).get('Address')
     
-    def _create_s3_bucket(self, aws_env: Dict, startup_info: Dict) -> Dict[str, Any]:
+    def get_ec2_public_ip(self, aws_env: Dict, instance_id: str) -> Optional[str]:
+        """Current public IP of a provisioned EC2 instance (None until one is assigned)"""
+        ec2_client, _ = self._subaccount_client(aws_env, 'ec2', self._aws_region(aws_env))
+        instance = ec2_client.describe_instances(InstanceIds=[instance_id])['Reservations'][0]['Instances'][0]
+        return instance.get('PublicIpAddress')
+    
+    def _create_s3_bucket(self, aws_env: Dict, names: NameSpec) -> Mapping[str, Any]:
         """Create actual S3 bucket in the AWS account"""
+        bucket_name = f"{names.slug}-storage-{_rand_hex(8)}"
+        region = self._aws_region(aws_env)
+        
         try:
-            # Try to assume role in sub-account, fallback to master session
-            try:
-                assumed_session = self._assume_role_in_subaccount(aws_env["account_id"])
-                s3_client = assumed_session.client('s3')
-            except Exception as role_error:
-                print(f"⚠️ Cross-account role assumption failed: {role_error}")
-                print("📝 Using master session - ensure platforge-api user has S3 permissions")
-                s3_client = self.aws_master_session.client('s3')
-            
-            bucket_name = f"{startup_info['name'].lower().replace(' ', '-')}-storage-{uuid.uuid4().hex[:8]}"
+            s3_client, _ = self._subaccount_client(aws_env, 's3', region)
             
-            print(f"🔨 Creating S3 bucket: {bucket_name}")
+            logger.info(f"🔨 Creating S3 bucket: {bucket_name}")
             
             # Create S3 bucket
-            s3_client.create_bucket(Bucket=bucket_name)
+            if region == "us-east-1":
+                s3_client.create_bucket(Bucket=bucket_name)
+            else:
+                # Every region except us-east-1 requires an explicit location constraint
+                s3_client.create_bucket(Bucket=bucket_name,
+                                        CreateBucketConfiguration={'LocationConstraint': region})
             
             # Set bucket policy for startup access
-            bucket_policy = {
-                "Version": "2012-10-17",
-                "Statement": [
-                    {
-                        "Sid": "StartupAccess",
-                        "Effect": "Allow",
-                        "Principal": {"AWS": f"arn:aws:iam::{aws_env['account_id']}:root"},
-                        "Action": "s3:*",
-                        "Resource": [
-                            f"arn:aws:s3:::{bucket_name}",
-                            f"arn:aws:s3:::{bucket_name}/*"
-                        ]
-                    }
-                ]
-            }
-            
             s3_client.put_bucket_policy(
                 Bucket=bucket_name,
-                Policy=json.dumps(bucket_policy)
+                Policy=_BUCKET_POLICY_TMPL % (aws_env['account_id'], bucket_name, bucket_name)
             )
             
-            return {
+            # Tags are bookkeeping only; a missing s3:PutBucketTagging grant must not fail the bucket
+            try:
+                s3_client.put_bucket_tagging(Bucket=bucket_name, Tagging={'TagSet': [
+                    {'Key': 'Name', 'Value': bucket_name},
+                    {'Key': 'Environment', 'Value': 'startup'},
+                    {'Key': 'CreatedBy', 'Value': 'PlatForge'}
+                ]})
+            except AWS_PROVISIONING_ERRORS as e:
+                logger.warning(f"⚠️ Could not tag S3 bucket {bucket_name}: {e}")
+            
+            return LazyRecord({
                 "service": "AWS S3",
                 "type": "storage",
                 "name": bucket_name,
                 "bucket_name": bucket_name,
-                "region": self.platforge_aws_region,
+                "region": region,
                 "url": f"https://s3.console.aws.amazon.com/s3/buckets/{bucket_name}",
                 "status": "active",
                 "console_url": f"https://s3.console.aws.amazon.com/s3/buckets/{bucket_name}",
-                "endpoint": f"https://{bucket_name}.s3.{self.platforge_aws_region}.amazonaws.com",
-                "python_code": f'''import boto3
-
-# Initialize S3 client
-s3_client = boto3.client('s3', region_name='{self.platforge_aws_region}')
-
-# Upload a file
-s3_client.upload_file('local_file.txt', '{bucket_name}', 'remote_file.txt')
-
-# Download a file
-s3_client.download_file('{bucket_name}', 'remote_file.txt', 'downloaded_file.txt')
-
-# List objects
-response = s3_client.list_objects_v2(Bucket='{bucket_name}')
-for obj in response.get('Contents', []):
-    print(f"File: {{obj['Key']}}, Size: {{obj['Size']}}")'''
-            }
+                "endpoint": f"https://{bucket_name}.s3.{region}.amazonaws.com"
+            }, python_code=lambda: _S3_PY_TMPL.format_map({"note": "", "region": region, "bucket_name": bucket_name}))
             
-        except Exception as e:
-            print(f"⚠️ S3 bucket creation failed: {e}")
+        except AWS_PROVISIONING_ERRORS as e:
+            logger.warning(f"⚠️ S3 bucket creation failed: {e}")
             # Return mock data if real creation fails
-            mock_bucket_name = f"{startup_info['name'].lower().replace(' ', '-')}-storage-{uuid.uuid4().hex[:8]}"
-            return {
+            return LazyRecord({
                 "service": "AWS S3",
                 "type": "storage",
-                "name": mock_bucket_name,
-                "bucket_name": mock_bucket_name,
-                "region": self.platforge_aws_region,
+                "name": bucket_name,
+                "bucket_name": bucket_name,
+                "region": region,
                 "status": "mock_created",
                 "note": f"Mock resource - real S3 creation failed: {str(e)}",
-                "console_url": f"https://s3.console.aws.amazon.com/s3/buckets/{mock_bucket_name}",
-                "endpoint": f"https://{mock_bucket_name}.s3.{self.platforge_aws_region}.amazonaws.com",
-                "python_code": f'''import boto3
-
-# Initialize S3 client (Mock - replace with real credentials)
-s3_client = boto3.client('s3', region_name='{self.platforge_aws_region}')
-
-# Upload a file
-s3_client.upload_file('local_file.txt', '{mock_bucket_name}', 'remote_file.txt')
-
-# Download a file
-s3_client.download_file('{mock_bucket_name}', 'remote_file.txt', 'downloaded_file.txt')
-
-# List objects
-response = s3_client.list_objects_v2(Bucket='{mock_bucket_name}')
-for obj in response.get('Contents', []):
-    print(f"File: {{obj['Key']}}, Size: {{obj['Size']}}")'''
-            }
+                "console_url": f"https://s3.console.aws.amazon.com/s3/buckets/{bucket_name}",
+                "endpoint": f"https://{bucket_name}.s3.{region}.amazonaws.com"
+            }, python_code=lambda: _S3_PY_TMPL.format_map({"note": " (Mock - replace with real credentials)", "region": region, "bucket_name": bucket_name}))
+    
+    def _subaccount_client(self, aws_env: Dict, service_name: str, region: str) -> Tuple[Any, boto3.Session]:
+        """Cached client (and its session) in the startup's sub-account, falling back to the master session"""
+        try:
+            session = self._assume_role_in_subaccount(aws_env["account_id"])
+            return self._client(session, service_name, region), session
+        except Exception as role_error:
+            logger.warning(f"⚠️ Cross-account role assumption failed: {role_error}")
+            logger.info(f"📝 Using master session - ensure platforge-api user has {service_name.upper()} permissions")
+            return self._client(self.aws_master_session, service_name, region), self.aws_master_session
     
     def _assume_role_in_subaccount(self, account_id: str):
-        """Assume cross-account role to create resources in sub-account"""
+        """Assume cross-account role to create resources in sub-account (cached; credentials self-refresh)"""
+        # Per-account lock: parallel services in one account share a single AssumeRole call,
+        # while the network round-trip doesn't hold up lookups for other accounts
+        with self._role_session_lock:
+            account_lock = self._role_session_locks.setdefault(account_id, threading.Lock())
+        with account_lock:
+            cached_session, retry_at = self._role_session_cache.get(account_id, (None, None))
+            if cached_session and (retry_at is None or retry_at > datetime.now(timezone.utc)):
+                return cached_session
+            
+            assumed_session, refreshable = self._assume_role_session(account_id)
+            # Master fallback: remember it briefly so the plan's other services skip the failing call
+            retry_at = None if refreshable else datetime.now(timezone.utc) + ROLE_FALLBACK_RETRY_INTERVAL
+            self._role_session_cache[account_id] = (assumed_session, retry_at)
+            return assumed_session
+    
+    def _assume_role_credentials(self, account_id: str) -> Dict[str, str]:
+        """AssumeRole round-trip, in the metadata shape RefreshableCredentials expects"""
+        sts_client = self._client(self.aws_master_session, 'sts')
+        credentials = sts_client.assume_role(
+            RoleArn=f"arn:aws:iam::{account_id}:role/PlatForgeManagementRole",
+            RoleSessionName=f"PlatForge-Session-{_rand_hex(8)}"
+        )['Credentials']
+        return {
+            "access_key": credentials['AccessKeyId'],
+            "secret_key": credentials['SecretAccessKey'],
+            "token": credentials['SessionToken'],
+            "expiry_time": credentials['Expiration'].isoformat()
+        }
+    
+    def _assume_role_session(self, account_id: str) -> Tuple[boto3.Session, bool]:
+        """Session in the sub-account, and whether it is a self-refreshing role session (False for the master fallback)"""
         try:
             # Try to assume the PlatForgeManagementRole in the sub-account
-            sts_client = self.aws_master_session.client('sts')
-            
             role_arn = f"arn:aws:iam::{account_id}:role/PlatForgeManagementRole"
             
-            print(f"🔑 Attempting to assume role: {role_arn}")
+            logger.info(f"🔑 Attempting to assume role: {role_arn}")
             
-            assumed_role = sts_client.assume_role(
-                RoleArn=role_arn,
-                RoleSessionName=f"PlatForge-Session-{uuid.uuid4().hex[:8]}"
+            # botocore re-assumes the role shortly before expiry, inside the request signer,
+            # so the cached session (and its clients) stays valid indefinitely
+            credentials = RefreshableCredentials.create_from_metadata(
+                metadata=self._assume_role_credentials(account_id),
+                refresh_using=lambda: self._assume_role_credentials(account_id),
+                method='sts-assume-role'
             )
-            
-            # Create session with assumed role credentials
-            assumed_session = boto3.Session(
-                aws_access_key_id=assumed_role['Credentials']['AccessKeyId'],
-                aws_secret_access_key=assumed_role['Credentials']['SecretAccessKey'],
-                aws_session_token=assumed_role['Credentials']['SessionToken'],
-                region_name=self.platforge_aws_region
+            # Register the credentials through a resolver instead of setting the session's private
+            # _credentials attribute: the resolver is botocore's public hook, and the session asks it
+            # for credentials lazily, the same way it would consult the env/profile chain
+            botocore_session = botocore.session.get_session()
+            botocore_session.register_component(
+                'credential_provider', CredentialResolver(providers=[_AssumedRoleCredentialProvider(credentials)])
             )
+            botocore_session.set_config_variable('region', self.platforge_aws_region)
+            assumed_session = boto3.Session(botocore_session=botocore_session)
             
-            print(f"✅ Successfully assumed role in account {account_id}")
-            return assumed_session
+            logger.info(f"✅ Successfully assumed role in account {account_id}")
+            return assumed_session, True
             
         except Exception as e:
-            print(f"⚠️ Failed to assume role in sub-account {account_id}: {e}")
-            print("📝 The PlatForgeManagementRole may not be set up correctly")
-            print("📝 Falling back to master session - this may have limited permissions")
+            logger.warning(f"⚠️ Failed to assume role in sub-account {account_id}: {e}")
+            logger.info("📝 The PlatForgeManagementRole may not be set up correctly")
+            logger.info("📝 Falling back to master session - this may have limited permissions")
             
             # Return master session as fallback
-            return self.aws_master_session
+            return self.aws_master_session, False
     
     def _generate_startup_access_package(self, startup_info, environments, third_party_accounts, resources) -> Dict[str, Any]:
         """Generate complete access package for the startup"""
@@ -1775,21 +2721,77 @@ for obj in response.get('Contents', []):
     
     # Helper methods (simplified implementations)
     def _create_aws_startup_credentials(self, account_id: str) -> Dict[str, str]:
+        with self._idempotency_lock:
+            if account_id not in self._aws_creds_cache:
+                self._aws_creds_cache[account_id] = self._generate_aws_credentials()
+            return self._aws_creds_cache[account_id]
+    
+    @staticmethod
+    def _generate_aws_credentials() -> Dict[str, str]:
+        """Mock access key pair, sliced from one random draw"""
+        token = _rand_hex(80)
         return {
-            "access_key_id": f"AKIA{uuid.uuid4().hex[:16].upper()}",
-            "secret_access_key": f"{uuid.uuid4().hex}{uuid.uuid4().hex}",
+            "access_key_id": f"AKIA{token[:16].upper()}",
+            "secret_access_key": token[16:],
             "region": "us-east-1"
         }
     
-    def _create_gcp_startup_credentials(self, project_id: str) -> Dict[str, str]:
+    def _create_gcp_startup_credentials(self, project_id: str, startup_namespace: Optional[str] = None) -> Dict[str, str]:
+        # Keyed by namespace too: startups in the shared project must not share credentials
+        key = (project_id, startup_namespace)
+        with self._idempotency_lock:
+            if key not in self._gcp_creds_cache:
+                self._gcp_creds_cache[key] = {
+                    **self._service_account_key_fields(project_id),
+                    "project_id": project_id
+                }
+            return self._gcp_creds_cache[key]
+    
+    def _aws_region(self, aws_env: Dict) -> str:
+        """Region for an AWS environment (accounts created before per-startup regions use the PlatForge default)"""
+        return aws_env.get("region") or self.platforge_aws_region
+    
+    def _amazon_linux_ami(self, session: boto3.Session, region: str) -> str:
+        """Latest Amazon Linux 2 AMI for a region (AMI ids are region-scoped), cached per region for AMI_CACHE_TTL"""
+        with self._ami_lock:
+            cached = self._ami_by_region.get(region)
+        if cached and time.monotonic() - cached[1] < AMI_CACHE_TTL:
+            return cached[0]
+        # The SSM round-trip runs unlocked so a slow region doesn't stall lookups for the others
+        try:
+            ssm_client = self._client(session, 'ssm', region)
+            ami_id = ssm_client.get_parameter(Name=AMAZON_LINUX_AMI_PARAMETER)['Parameter']['Value']
+        except Exception:
+            # A stale image is still a valid image; prefer it to the hardcoded fallback
+            if cached:
+                return cached[0]
+            if region != DEFAULT_AMI_REGION:
+                raise
+            ami_id = DEFAULT_AMI_ID
+        with self._ami_lock:
+            self._ami_by_region[region] = (ami_id, time.monotonic())
+        return ami_id
+    
+    def _gcp_console_url(self, page: str, project_id: str) -> str:
+        """Console link for a project, reusing the pre-rendered one for the PlatForge project"""
+        if project_id == self.platforge_gcp_project_id:
+            return self._console_urls[page]
+        return GCP_CONSOLE_URL_TEMPLATES[page].format(project_id=project_id)
+    
+    def _service_account_key_fields(self, project_id: str, **fields: str) -> Dict[str, Any]:
+        """Build the service_account_json string plus its parsed credentials_dict"""
+        credentials_dict = {"type": "service_account", "project_id": project_id, **fields}
         return {
-            "service_account_json": f'{{"project_id": "{project_id}", "type": "service_account"}}',
-            "project_id": project_id
+            "service_account_json": json.dumps(credentials_dict, separators=(",", ":")),
+            "credentials_dict": credentials_dict
         }
     
     def _setup_gcp_billing(self, project_id: str):
-        # Link project to PlatForge billing account
-        pass
+        # Link project to PlatForge billing account (at most once per project)
+        with self._idempotency_lock:
+            if project_id in self._billing_linked:
+                return
+            self._billing_linked.add(project_id)
 
 
 if __name__ == "__main__":
@@ -1809,7 +2811,7 @@ if __name__ == "__main__":
     # Auto-provision everything
     result = provisioner.auto_provision_startup_infrastructure(startup_info, pipeline_services)
     
-    print("\n" + "="*50)
-    print("PROVISIONING COMPLETE!")
-    print("="*50)
-    print(json.dumps(result, indent=2))
\ No newline at end of file
+    logger.info("\n" + "="*50)
+    logger.info("PROVISIONING COMPLETE!")
+    logger.info("="*50)
+    logger.info(_json_dumps_pretty(result).decode())
\ No newline at end of file
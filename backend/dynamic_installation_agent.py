@@ -1,88 +1,183 @@
 import os
+import re
+import shlex
+import shutil
 import subprocess
 import platform
 import json
 import time
-from typing import Dict, List, Any, Optional
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+from typing import Dict, List, Any, Optional, Sequence
 from pathlib import Path
 import venv
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from infrastructure_catalog import PlatformCatalog
+from project_paths import PROJECT_ROOT
+
+# pyahocorasick - optional, linear-time keyword scan for long flow descriptions
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Installer output is written by one background listener so concurrent agents never contend on stdout
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue()
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+logger.setLevel(logging.INFO)
+logger.propagate = False
+_log_listener: Optional[logging.handlers.QueueListener] = None
+_log_listener_lock = threading.Lock()
+
+
+def _start_log_listener() -> None:
+    """Start the background console writer (once per process); records logged earlier are buffered"""
+    global _log_listener
+    with _log_listener_lock:
+        if _log_listener is None:
+            handler = logging.StreamHandler(sys.stdout)
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            _log_listener = logging.handlers.QueueListener(_log_queue, handler)
+            _log_listener.start()
+            atexit.register(_log_listener.stop)
+
+# Keywords in a flow description that signal each service
+_SERVICE_KEYWORDS = {
+    "aws": ["aws", "amazon"],
+    "s3": ["s3", "storage"],
+    "lambda": ["lambda", "serverless"],
+    "redshift": ["redshift", "data warehouse"],
+    "ec2": ["ec2", "server", "virtual machine", "compute"],
+    "tableau": ["tableau", "visualization"],
+    "pandas": ["pandas", "data processing", "csv", "excel"]
+}
+
+# Services implied by each keyword, including keywords nested inside it ("serverless" also hits "server")
+_KEYWORD_SERVICES = {
+    keyword: frozenset(
+        service for service, keywords in _SERVICE_KEYWORDS.items()
+        if any(other in keyword for other in keywords)
+    )
+    for keywords in _SERVICE_KEYWORDS.values() for keyword in keywords
+}
+
+# Zero-width lookahead so overlapping keywords are all found in one scan; longest first
+_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(map(re.escape, sorted(_KEYWORD_SERVICES, key=len, reverse=True))) + "))"
+)
+
+# Executable each system package provides, probed before reinstalling it
+_SYSTEM_BINARIES = {
+    "aws": "aws"
+}
+
+# System packages installed by earlier runs, shared across projects
+SYSTEM_INSTALL_CACHE = Path.home() / ".platforge" / "system_installed.json"
+
+# Wheel/download caches shared by every project, so each package is fetched once per machine
+PIP_CACHE_DIR = Path.home() / ".platforge" / "pip-cache"
+UV_CACHE_DIR = Path.home() / ".platforge" / "uv-cache"
+
+# Package mappings for different services (will be expanded dynamically)
+_SERVICE_PACKAGES = MappingProxyType({
+    "aws": MappingProxyType({
+        "python": ("boto3>=1.26.0", "awscli"),
+        "system": MappingProxyType({
+            "Darwin": ("brew", "install", "awscli"),
+            "Linux": ("sudo", "apt-get", "install", "-y", "awscli"),
+            "Windows": ("winget", "install", "Amazon.AWSCLI")
+        })
+    }),
+    "redshift": MappingProxyType({
+        "python": ("redshift-connector>=2.0.0", "psycopg2-binary>=2.9.0"),
+        "system": MappingProxyType({})
+    }),
+    "ec2": MappingProxyType({
+        "python": ("paramiko>=2.8.0", "boto3>=1.26.0"),
+        "system": MappingProxyType({})
+    }),
+    "tableau": MappingProxyType({
+        "python": ("tableauserverclient>=0.25.0",),
+        "system": MappingProxyType({})
+    }),
+    "lambda": MappingProxyType({
+        "python": ("boto3>=1.26.0",),
+        "system": MappingProxyType({})
+    }),
+    "s3": MappingProxyType({
+        "python": ("boto3>=1.26.0",),
+        "system": MappingProxyType({})
+    }),
+    "pandas": MappingProxyType({
+        "python": ("pandas>=1.5.0",),
+        "system": MappingProxyType({})
+    }),
+    "common": MappingProxyType({
+        "python": ("python-dotenv>=1.0.0", "requests>=2.28.0"),
+        "system": MappingProxyType({})
+    })
+})
+
+
+
+def _build_keyword_automaton():
+    """Aho-Corasick automaton mapping each keyword to the services it implies"""
+    automaton = ahocorasick.Automaton()
+    for keyword, services in _KEYWORD_SERVICES.items():
+        automaton.add_word(keyword, services)
+    automaton.make_automaton()
+    return automaton
+
+
+# Reports every (overlapping) keyword hit in one pass; the regex scan is used without it
+_KEYWORD_AUTOMATON = _build_keyword_automaton() if AHOCORASICK_AVAILABLE else None
+
+
+@lru_cache(maxsize=128)
+def _services_in_flow(flow_description: str) -> tuple:
+    """Services whose keywords occur anywhere in the flow description, in keyword-table order"""
+    flow_lower = flow_description.lower()
+    found = set()
+    if _KEYWORD_AUTOMATON is not None:
+        for _, services in _KEYWORD_AUTOMATON.iter(flow_lower):
+            found.update(services)
+    else:
+        for match in _KEYWORD_RE.finditer(flow_lower):
+            found.update(_KEYWORD_SERVICES[match.group(1)])
+    # Always add common utilities
+    return tuple(service for service in _SERVICE_KEYWORDS if service in found) + ("common",)
+
+
+def _dedupe_ordered(items: List[str]) -> List[str]:
+    """Drop duplicates, keeping first-seen order"""
+    return list(dict.fromkeys(items))
 
 class DynamicInstallationAgent:
     def __init__(self, project_name: str = "platforge_project"):
         self.project_name = project_name
         self.os_name = platform.system()
-        self.project_dir = Path.home() / "platforge_projects" / project_name
+        self.project_dir = PROJECT_ROOT / project_name
         self.venv_dir = self.project_dir / "venv"
         self.catalog = PlatformCatalog()
-        
-        # Package mappings for different services (will be expanded dynamically)
-        self.service_packages = {
-            "aws": {
-                "python": ["boto3>=1.26.0", "awscli"],
-                "system": {
-                    "Darwin": "brew install awscli",
-                    "Linux": "sudo apt-get install -y awscli",
-                    "Windows": "winget install Amazon.AWSCLI"
-                }
-            },
-            "redshift": {
-                "python": ["redshift-connector>=2.0.0", "psycopg2-binary>=2.9.0"],
-                "system": {}
-            },
-            "ec2": {
-                "python": ["paramiko>=2.8.0", "boto3>=1.26.0"],
-                "system": {}
-            },
-            "tableau": {
-                "python": ["tableauserverclient>=0.25.0"],
-                "system": {}
-            },
-            "lambda": {
-                "python": ["boto3>=1.26.0"],
-                "system": {}
-            },
-            "s3": {
-                "python": ["boto3>=1.26.0"],
-                "system": {}
-            },
-            "pandas": {
-                "python": ["pandas>=1.5.0"],
-                "system": {}
-            },
-            "common": {
-                "python": ["python-dotenv>=1.0.0", "requests>=2.28.0"],
-                "system": {}
-            }
-        }
+        _start_log_listener()
+        # uv resolves and downloads in parallel; fall back to the venv's pip without it
+        self.uv_path = shutil.which("uv")
+        self.service_packages = _SERVICE_PACKAGES
     
     def parse_infrastructure_flow(self, flow_description: str) -> List[str]:
         """Parse flow description and extract required services"""
         # For now, this is a simple keyword-based parser
         # In production, this would use the chatbot's structured output
-        
-        services = []
-        flow_lower = flow_description.lower()
-        
-        # Check for various service keywords
-        service_keywords = {
-            "aws": ["aws", "amazon"],
-            "s3": ["s3", "storage"],
-            "lambda": ["lambda", "serverless"],
-            "redshift": ["redshift", "data warehouse"],
-            "ec2": ["ec2", "server", "virtual machine", "compute"],
-            "tableau": ["tableau", "visualization"],
-            "pandas": ["pandas", "data processing", "csv", "excel"]
-        }
-        
-        for service, keywords in service_keywords.items():
-            if any(keyword in flow_lower for keyword in keywords):
-                services.append(service)
-        
-        # Always add common utilities
-        services.append("common")
-        
-        return list(set(services))  # Remove duplicates
+        return list(_services_in_flow(flow_description))
     
     def generate_requirements_from_flow(self, services: List[str]) -> List[str]:
         """Generate Python requirements based on services needed"""
@@ -92,9 +187,9 @@ class DynamicInstallationAgent:
             if service in self.service_packages:
                 requirements.extend(self.service_packages[service]["python"])
         
-        return list(set(requirements))  # Remove duplicates
+        return _dedupe_ordered(requirements)
     
-    def generate_system_commands_from_flow(self, services: List[str]) -> List[Dict[str, str]]:
+    def generate_system_commands_from_flow(self, services: List[str]) -> List[Dict[str, Any]]:
         """Generate system installation commands based on services"""
         commands = []
         
@@ -115,7 +210,12 @@ class DynamicInstallationAgent:
             self.project_dir.mkdir(parents=True, exist_ok=True)
             
             if not self.venv_dir.exists():
-                venv.create(self.venv_dir, with_pip=True)
+                uv_result = None
+                if self.uv_path:
+                    uv_result = self._run_command([self.uv_path, "venv", str(self.venv_dir)], timeout=120)
+                if uv_result is None or uv_result["status"] == "error":
+                    # Seeding pip dominates venv creation; it is bootstrapped later only if needed
+                    venv.create(self.venv_dir, with_pip=False)
             
             return {
                 "status": "success",
@@ -129,18 +229,18 @@ class DynamicInstallationAgent:
                 "message": f"Failed to create project structure: {str(e)}"
             }
     
-    def _run_command(self, command: str, timeout: int = 300) -> Dict[str, Any]:
-        """Run a shell command with timeout"""
-        print(f"Executing command: {command}")
+    def _run_command(self, argv: Sequence[str], timeout: int = 300) -> Dict[str, Any]:
+        """Run a command (argv list, no shell) with timeout"""
+        command = shlex.join(map(str, argv))
+        logger.info(f"Executing command: {command}")
         try:
             result = subprocess.run(
-                command,
-                shell=True,
+                [str(arg) for arg in argv],
                 capture_output=True,
                 text=True,
                 timeout=timeout
             )
-            print(f"Command completed with return code: {result.returncode}")
+            logger.info(f"Command completed with return code: {result.returncode}")
             return {
                 "status": "success" if result.returncode == 0 else "error",
                 "returncode": result.returncode,
@@ -149,20 +249,167 @@ class DynamicInstallationAgent:
                 "command": command
             }
         except subprocess.TimeoutExpired:
-            print(f"Command timed out after {timeout} seconds")
+            logger.warning(f"⚠️ Command timed out after {timeout} seconds")
             return {
                 "status": "error",
                 "message": f"Command timed out after {timeout} seconds",
                 "command": command
             }
         except Exception as e:
-            print(f"Command failed with exception: {e}")
+            logger.warning(f"⚠️ Command failed with exception: {e}")
             return {
                 "status": "error",
                 "message": str(e),
                 "command": command
             }
     
+    def _load_system_install_cache(self) -> Dict[str, float]:
+        """Read the on-disk record of previously installed system packages"""
+        try:
+            with open(SYSTEM_INSTALL_CACHE) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _system_tool_present(self, service: str) -> bool:
+        """Check PATH and the install cache before running a system install"""
+        binary = _SYSTEM_BINARIES.get(service)
+        if binary and shutil.which(binary):
+            return True
+        return service in self._load_system_install_cache()
+    
+    def _record_system_install(self, service: str) -> None:
+        """Remember a successful system install so later runs can skip it"""
+        try:
+            installed = self._load_system_install_cache()
+            installed[service] = time.time()
+            SYSTEM_INSTALL_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            with open(SYSTEM_INSTALL_CACHE, 'w') as f:
+                json.dump(installed, f)
+        except OSError as e:
+            logger.warning(f"⚠️ Failed to record system install for {service}: {e}")
+    
+    @staticmethod
+    def _package_name(requirement: str) -> str:
+        """Strip version specifiers and extras from a requirement string"""
+        return requirement.split('>=')[0].split('==')[0].split('[')[0].strip()
+    
+    def _write_requirements(self, requirements: List[str]) -> Path:
+        """Write requirements.txt, leaving it untouched when the set is unchanged"""
+        requirements_file = self.project_dir / "requirements.txt"
+        content = "".join(f"{req}\n" for req in sorted(requirements))
+        if not requirements_file.exists() or requirements_file.read_text() != content:
+            requirements_file.write_text(content)
+        return requirements_file
+    
+    def _compile_lockfile(self, requirements_file: Path, python_path: Path) -> Optional[Path]:
+        """Resolve requirements.txt into requirements.lock once, reusing it until the requirements change"""
+        lock_file = self.project_dir / "requirements.lock"
+        if lock_file.exists() and lock_file.stat().st_mtime >= requirements_file.stat().st_mtime:
+            logger.info("Reusing resolved requirements.lock")
+            return lock_file
+        
+        logger.info("Resolving requirements...")
+        compile_cmd = [self.uv_path, "pip", "compile", "--cache-dir", UV_CACHE_DIR, "--python", python_path, requirements_file, "-o", lock_file]
+        result = self._run_command(compile_cmd, timeout=300)
+        if result["status"] == "error":
+            logger.warning(f"⚠️ Failed to resolve requirements: {result.get('stderr', 'Unknown error')}")
+            return None
+        return lock_file
+    
+    def _install_python_requirements(self, requirements_file: Path, requirements: List[str]) -> List[Dict[str, Any]]:
+        """Install requirements.txt with one uv/pip call and report status per package"""
+        if not requirements:
+            return []
+        
+        bin_dir = self.venv_dir / ("Scripts" if self.os_name == "Windows" else "bin")
+        python_path = bin_dir / "python"
+        
+        batch_cmd = None
+        if self.uv_path:
+            installer = [self.uv_path, "pip", "install", "--cache-dir", UV_CACHE_DIR, "--python", python_path]
+            lock_file = self._compile_lockfile(requirements_file, python_path)
+            if lock_file:
+                # Fully pinned, so the install itself does no resolution
+                batch_cmd = [self.uv_path, "pip", "sync", "--cache-dir", UV_CACHE_DIR, "--python", python_path, lock_file]
+        else:
+            pip_path = bin_dir / "pip"
+            if not any(bin_dir.glob("pip*")):
+                logger.info("Bootstrapping pip...")
+                ensurepip_result = self._run_command([python_path, "-m", "ensurepip", "--default-pip"], timeout=120)
+                if ensurepip_result["status"] == "error":
+                    logger.warning(f"⚠️ Failed to bootstrap pip: {ensurepip_result.get('stderr', 'Unknown error')}")
+            
+            logger.info("Upgrading pip...")
+            upgrade_result = self._run_command([pip_path, "install", "--cache-dir", PIP_CACHE_DIR, "--upgrade", "pip"], timeout=120)
+            if upgrade_result["status"] == "error":
+                logger.warning(f"⚠️ Failed to upgrade pip: {upgrade_result.get('stderr', 'Unknown error')}")
+            
+            installer = [pip_path, "install", "--cache-dir", PIP_CACHE_DIR]
+        
+        logger.info(f"Installing {len(requirements)} Python packages...")
+        # One resolver pass for the whole set, so allow the old per-package budget in total
+        result = self._run_command(batch_cmd or [*installer, "-r", requirements_file], timeout=300 * len(requirements))
+        
+        if result["status"] == "success":
+            python_results = [{**result, "package": self._package_name(req)} for req in requirements]
+        else:
+            # Retry individually to find which packages broke the batch
+            logger.warning("⚠️ Batch install failed, retrying packages individually...")
+            if self.uv_path:
+                # uv locks the target environment, so concurrent installs into one venv are safe
+                with ThreadPoolExecutor(max_workers=min(8, len(requirements))) as executor:
+                    python_results = list(executor.map(lambda req: self._install_one(installer, req), requirements))
+            else:
+                # pip has no such lock; parallel runs can corrupt site-packages, so install one at a time
+                python_results = [self._install_one(installer, req) for req in requirements]
+        
+        for package_result in python_results:
+            package_name = package_result["package"]
+            if package_result["status"] == "success":
+                logger.info(f"✅ Successfully installed {package_name}")
+            else:
+                logger.error(f"❌ Failed to install {package_name}: {package_result.get('stderr', package_result.get('message', 'Unknown error'))}")
+        
+        return python_results
+    
+    def _install_one(self, installer: List[Any], requirement: str) -> Dict[str, Any]:
+        """Install a single requirement and tag the result with its package name"""
+        result = self._run_command([*installer, requirement], timeout=300)
+        result["package"] = self._package_name(requirement)
+        return result
+    
+    def _install_system_packages(self, system_commands: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Install essential system packages (with shorter timeout and error handling)"""
+        system_results = []
+        essential_packages = ["aws"]  # Only install essential ones
+        
+        for cmd_info in system_commands:
+            if self._system_tool_present(cmd_info['service']):
+                logger.info(f"Skipping {cmd_info['service']} (already installed)...")
+                system_results.append({
+                    "service": cmd_info['service'],
+                    "status": "skipped",
+                    "message": "Already installed"
+                })
+            elif any(essential in cmd_info['service'] for essential in essential_packages):
+                logger.info(f"Installing {cmd_info['service']}...")
+                # Use shorter timeout and don't fail if it doesn't work
+                result = self._run_command(cmd_info['command'], timeout=120)
+                result["service"] = cmd_info['service']
+                system_results.append(result)
+                if result["status"] == "success":
+                    self._record_system_install(cmd_info['service'])
+            else:
+                logger.info(f"Skipping {cmd_info['service']} (not essential for this demo)...")
+                system_results.append({
+                    "service": cmd_info['service'],
+                    "status": "skipped",
+                    "message": "Not essential for demo"
+                })
+        
+        return system_results
+    
     def install_packages_for_flow(self, flow_description: str) -> Dict[str, Any]:
         """Install packages based on infrastructure flow description"""
         
@@ -187,64 +434,17 @@ class DynamicInstallationAgent:
             }
         
         # Step 2: Create requirements.txt
-        requirements_file = self.project_dir / "requirements.txt"
-        with open(requirements_file, 'w') as f:
-            for req in python_requirements:
-                f.write(f"{req}\n")
-        
-        # Step 3: Install essential system packages (with shorter timeout and error handling)
-        system_results = []
-        essential_packages = ["aws"]  # Only install essential ones
-        
-        for cmd_info in system_commands:
-            if any(essential in cmd_info['service'] for essential in essential_packages):
-                print(f"Installing {cmd_info['service']}...")
-                # Use shorter timeout and don't fail if it doesn't work
-                result = self._run_command(cmd_info['command'], timeout=120)
-                result["service"] = cmd_info['service']
-                system_results.append(result)
-                time.sleep(1)
-            else:
-                print(f"Skipping {cmd_info['service']} (not essential for this demo)...")
-                system_results.append({
-                    "service": cmd_info['service'],
-                    "status": "skipped",
-                    "message": "Not essential for demo"
-                })
-        
-        installation_log.append({"step": "system_packages", "result": system_results})
-        
-        # Step 4: Install Python packages one by one for better progress tracking
-        if self.os_name == "Windows":
-            pip_path = self.venv_dir / "Scripts" / "pip"
-        else:
-            pip_path = self.venv_dir / "bin" / "pip"
-        
-        print("Upgrading pip...")
-        upgrade_cmd = f'"{pip_path}" install --upgrade pip'
-        upgrade_result = self._run_command(upgrade_cmd, timeout=120)
-        
-        if upgrade_result["status"] == "error":
-            print(f"Warning: Failed to upgrade pip: {upgrade_result.get('stderr', 'Unknown error')}")
+        requirements_file = self._write_requirements(python_requirements)
         
-        # Install each Python package individually to show progress
-        python_results = []
-        for requirement in python_requirements:
-            package_name = requirement.split('>=')[0].split('==')[0].strip()
-            print(f"Installing Python package: {package_name}...")
+        # Step 3: Install essential system packages in the background; they don't touch the venv
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            system_future = executor.submit(self._install_system_packages, system_commands)
             
-            install_cmd = f'"{pip_path}" install "{requirement}"'
-            result = self._run_command(install_cmd, timeout=300)  # 5 minutes per package
-            result["package"] = package_name
-            python_results.append(result)
-            
-            if result["status"] == "success":
-                print(f"✅ Successfully installed {package_name}")
-            else:
-                print(f"❌ Failed to install {package_name}: {result.get('stderr', 'Unknown error')}")
-            
-            time.sleep(0.5)  # Brief pause between installations
+            # Step 4: Install Python packages in a single resolver pass
+            python_results = self._install_python_requirements(requirements_file, python_requirements)
+            system_results = system_future.result()
         
+        installation_log.append({"step": "system_packages", "result": system_results})
         installation_log.append({"step": "python_packages", "result": python_results})
         
         return {
@@ -283,49 +483,13 @@ class DynamicInstallationAgent:
                 all_packages.extend(rec["packages"])
         
         # Remove duplicates while preserving order
-        unique_packages = []
-        seen = set()
-        for pkg in all_packages:
-            if pkg not in seen:
-                unique_packages.append(pkg)
-                seen.add(pkg)
+        unique_packages = _dedupe_ordered(all_packages)
         
         # Step 3: Create requirements.txt
-        requirements_file = self.project_dir / "requirements.txt"
-        with open(requirements_file, 'w') as f:
-            for pkg in unique_packages:
-                f.write(f"{pkg}\n")
+        requirements_file = self._write_requirements(unique_packages)
         
         # Step 4: Install Python packages
-        if self.os_name == "Windows":
-            pip_path = self.venv_dir / "Scripts" / "pip"
-        else:
-            pip_path = self.venv_dir / "bin" / "pip"
-        
-        print("Upgrading pip...")
-        upgrade_cmd = f'"{pip_path}" install --upgrade pip'
-        upgrade_result = self._run_command(upgrade_cmd, timeout=120)
-        
-        if upgrade_result["status"] == "error":
-            print(f"Warning: Failed to upgrade pip: {upgrade_result.get('stderr', 'Unknown error')}")
-        
-        # Install each Python package individually
-        python_results = []
-        for package in unique_packages:
-            package_name = package.split('>=')[0].split('==')[0].split('[')[0].strip()
-            print(f"Installing Python package: {package_name}...")
-            
-            install_cmd = f'"{pip_path}" install "{package}"'
-            result = self._run_command(install_cmd, timeout=300)
-            result["package"] = package_name
-            python_results.append(result)
-            
-            if result["status"] == "success":
-                print(f"✅ Successfully installed {package_name}")
-            else:
-                print(f"❌ Failed to install {package_name}: {result.get('stderr', 'Unknown error')}")
-            
-            time.sleep(0.5)
+        python_results = self._install_python_requirements(requirements_file, unique_packages)
         
         installation_log.append({"step": "python_packages", "result": python_results})
         
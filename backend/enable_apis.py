@@ -4,10 +4,50 @@ Script to enable required GCP APIs for service account creation
 """
 
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from google.oauth2 import service_account
 from google.cloud.service_usage_v1 import ServiceUsageClient
 
+# APIs confirmed enabled per project, so repeat runs skip the Service Usage round-trips
+ENABLED_APIS_CACHE = Path.home() / ".platforge" / "gcp_apis_enabled.json"
+
+# How long a cached "enabled" result is trusted (seconds)
+ENABLED_APIS_CACHE_TTL = 24 * 60 * 60
+
+def _load_enabled_cache():
+    """Read the per-project enabled-API cache ({project_id: {api: enabled_at}})"""
+    try:
+        with open(ENABLED_APIS_CACHE, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_enabled_cache(cache):
+    """Write the enabled-API cache; failures only cost a re-check next run"""
+    try:
+        ENABLED_APIS_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        with open(ENABLED_APIS_CACHE, 'w') as f:
+            json.dump(cache, f)
+    except OSError as e:
+        print(f"   ⚠️ Failed to save enabled-API cache: {e}")
+
+def _report_enable_failure(api, e):
+    """Print an enable failure and the manual activation URL if GCP included one"""
+    print(f"   ⚠️ Failed to enable {api}: {e}")
+    
+    if "SERVICE_DISABLED" in str(e) or "has not been used" in str(e):
+        # Extract the activation URL from the error
+        error_str = str(e)
+        if "https://console.developers.google.com" in error_str:
+            start = error_str.find("https://console.developers.google.com")
+            end = error_str.find(" ", start)
+            if end == -1:
+                end = len(error_str)
+            url = error_str[start:end]
+            print(f"   🔗 Manual activation required: {url}")
+
 def enable_required_apis():
     """Enable the IAM API in the GCP project"""
     
@@ -35,7 +75,17 @@ def enable_required_apis():
             "serviceusage.googleapis.com"           # Service Usage API (should already be enabled)
         ]
         
+        cache = _load_enabled_cache()
+        enabled = cache.setdefault(project_id, {})
+        now = time.time()
+        
+        # Submit every enable first; each is an independent long-running operation
+        pending = []
         for api in apis_to_enable:
+            if now - enabled.get(api, 0) < ENABLED_APIS_CACHE_TTL:
+                print(f"✅ Already enabled (cached): {api}")
+                continue
+            
             try:
                 print(f"🔨 Enabling {api}...")
                 
@@ -46,6 +96,7 @@ def enable_required_apis():
                     service = client.get_service(name=service_name)
                     if hasattr(service, 'state') and str(service.state) == 'ENABLED':
                         print(f"   ✅ Already enabled: {api}")
+                        enabled[api] = now
                         continue
                 except Exception:
                     # Service doesn't exist or not accessible, try to enable it
@@ -53,25 +104,25 @@ def enable_required_apis():
                 
                 # Enable the service
                 operation = client.enable_service(name=service_name)
-                
                 print(f"   ⏳ Enabling {api}... (this may take a few minutes)")
-                result = operation.result(timeout=300)  # 5 minute timeout
-                
-                print(f"   ✅ Successfully enabled: {api}")
+                pending.append((api, operation))
                 
             except Exception as e:
-                print(f"   ⚠️ Failed to enable {api}: {e}")
-                
-                if "SERVICE_DISABLED" in str(e) or "has not been used" in str(e):
-                    # Extract the activation URL from the error
-                    error_str = str(e)
-                    if "https://console.developers.google.com" in error_str:
-                        start = error_str.find("https://console.developers.google.com")
-                        end = error_str.find(" ", start)
-                        if end == -1:
-                            end = len(error_str)
-                        url = error_str[start:end]
-                        print(f"   🔗 Manual activation required: {url}")
+                _report_enable_failure(api, e)
+        
+        # Then wait on all of them together, so the total wait is the slowest enable, not the sum
+        if pending:
+            with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+                futures = [(api, executor.submit(operation.result, timeout=300)) for api, operation in pending]  # 5 minute timeout
+                for api, future in futures:
+                    try:
+                        future.result()
+                        print(f"   ✅ Successfully enabled: {api}")
+                        enabled[api] = time.time()
+                    except Exception as e:
+                        _report_enable_failure(api, e)
+        
+        _save_enabled_cache(cache)
         
         print("\n🎉 API enablement process completed!")
         print("📝 If any APIs failed to enable automatically, use the provided URLs to enable them manually.")
@@ -1,39 +1,138 @@
+import hashlib
+import os
+import re
 import subprocess
+import threading
 import platform
 import json
-from typing import Dict, List, Any
+import shlex
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from importlib.metadata import distributions
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
+from project_paths import PROJECT_ROOT
+
+# Runs inside the venv interpreter: imports each module named in argv and prints one JSON report
+_IMPORT_PROBE_SCRIPT = """
+import importlib, json, sys
+report = {}
+for name in sys.argv[1:]:
+    try:
+        module = importlib.import_module(name)
+        report[name] = {"version": str(getattr(module, "__version__", "unknown")), "file": getattr(module, "__file__", None) or "built-in"}
+    except Exception as e:
+        report[name] = {"error": f"{type(e).__name__}: {e}"}
+print(json.dumps(report))
+"""
+
+# Results of tool probes, keyed by argv and the resolved binary's identity (path, mtime, inode)
+PROBE_CACHE_FILE = Path.home() / ".platforge" / "probe_cache.json"
+_probe_cache: Optional[Dict[str, Dict[str, Any]]] = None
+_probe_cache_lock = threading.Lock()
+
+
+def _probe_cache_key(argv: List[str], binary: str) -> Optional[str]:
+    """Cache key that changes whenever the binary argv[0] resolves to is replaced or upgraded"""
+    try:
+        st = os.stat(binary)
+    except OSError:
+        return None
+    return hashlib.sha1(repr((argv, os.path.realpath(binary), st.st_mtime_ns, st.st_ino)).encode()).hexdigest()
+
+
+def _load_probe_cache() -> Dict[str, Dict[str, Any]]:
+    """Read the on-disk probe cache once per process (caller holds the lock)"""
+    global _probe_cache
+    if _probe_cache is None:
+        try:
+            with open(PROBE_CACHE_FILE, 'r') as f:
+                _probe_cache = json.load(f)
+        except (OSError, ValueError):
+            _probe_cache = {}
+    return _probe_cache
+
+
+def _store_probe_result(key: str, result: Dict[str, Any]) -> None:
+    """Record a probe result and rewrite the cache file atomically"""
+    with _probe_cache_lock:
+        cache = _load_probe_cache()
+        cache[key] = result
+        try:
+            PROBE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = PROBE_CACHE_FILE.with_suffix(".tmp")
+            with open(tmp_file, 'w') as f:
+                json.dump(cache, f)
+            os.replace(tmp_file, PROBE_CACHE_FILE)
+        except OSError:
+            pass
+
+
+# Threads used to walk directory trees; each scandir/stat batch is I/O bound
+DIR_SCAN_WORKERS = 8
+
+
+def _scan_dir(path: str) -> Tuple[int, List[str]]:
+    """Bytes in regular files directly under path, plus its subdirectories (symlinks not followed)"""
+    size, subdirs = 0, []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        size += entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    pass
+    except OSError:
+        pass
+    return size, subdirs
+
+
+def _dir_size(root: Path, exclude: Optional[Path] = None) -> int:
+    """Total file bytes under root, scanning each directory level in parallel"""
+    total = 0
+    frontier = [str(root)]
+    with ThreadPoolExecutor(max_workers=DIR_SCAN_WORKERS) as executor:
+        while frontier:
+            next_frontier = []
+            for size, subdirs in executor.map(_scan_dir, frontier):
+                total += size
+                next_frontier.extend(subdirs)
+            frontier = [d for d in next_frontier if exclude is None or d != str(exclude)]
+    return total
 
 class InfrastructureVerification:
     def __init__(self, project_name: str = "platforge_project"):
         self.project_name = project_name
         self.os_name = platform.system()
-        self.project_dir = Path.home() / "platforge_projects" / project_name
+        self.project_dir = PROJECT_ROOT / project_name
         
         # Define what to verify for each service
         self.verification_commands = {
             "aws": {
-                "command": "aws --version",
+                "argv": ["aws", "--version"],
                 "name": "AWS CLI",
                 "expected_keywords": ["aws-cli"]
             },
             "python": {
-                "command": "python3 --version",
+                "argv": ["python3", "--version"],
                 "name": "Python",
                 "expected_keywords": ["Python"]
             },
             "docker": {
-                "command": "docker --version",
+                "argv": ["docker", "--version"],
                 "name": "Docker",
                 "expected_keywords": ["Docker version"]
             },
             "node": {
-                "command": "node --version",
+                "argv": ["node", "--version"],
                 "name": "Node.js",
                 "expected_keywords": ["v"]
             },
             "pip": {
-                "command": "pip3 --version",
+                "argv": ["pip3", "--version"],
                 "name": "pip",
                 "expected_keywords": ["pip"]
             }
@@ -49,13 +148,53 @@ class InfrastructureVerification:
             "python-dotenv",
             "requests"
         ]
+        # Module name tried for each package, computed once
+        self.python_import_names = {package: package.replace("-", "_") for package in self.python_packages}
+        # requirements.txt contents, read on first use by _reqs()
+        self._requirements_text: Optional[str] = None
+
+    def _reqs(self) -> Optional[str]:
+        """Return requirements.txt contents, reading the file at most once (None if it does not exist)"""
+        if self._requirements_text is None:
+            requirements_file = self.project_dir / "requirements.txt"
+            if not requirements_file.exists():
+                return None
+            self._requirements_text = requirements_file.read_text()
+        return self._requirements_text
+
+    def _run_command(self, argv: List[str], timeout: int = 30, use_cache: bool = True) -> Dict[str, Any]:
+        """Run a command (argv list, no shell) and return result; unchanged binaries reuse the cached result"""
+        # A tool missing from PATH is reported without forking just to fail the exec
+        binary = shutil.which(argv[0])
+        if not binary:
+            return {
+                "status": "error",
+                "message": f"{argv[0]} not found on PATH",
+                "command": shlex.join(argv)
+            }
+        
+        key = _probe_cache_key(argv, binary) if use_cache else None
+        if key:
+            with _probe_cache_lock:
+                cached = _load_probe_cache().get(key)
+            if cached is not None:
+                return dict(cached)
+        
+        result = self._execute(argv, binary, timeout)
+        if key and "returncode" in result:
+            _store_probe_result(key, result)
+        return result
 
-    def _run_command(self, command: str, timeout: int = 30) -> Dict[str, Any]:
-        """Run a shell command and return result"""
+    def _execute(self, argv: List[str], binary: str, timeout: int) -> Dict[str, Any]:
+        """Run a command (argv list, no shell) and return result"""
+        command = shlex.join(argv)
         try:
+            # A resolved executable path plus close_fds=False lets CPython use posix_spawn instead of
+            # fork + closing every fd; our own fds are non-inheritable (PEP 446), so nothing leaks
             result = subprocess.run(
-                command,
-                shell=True,
+                argv,
+                executable=binary,
+                close_fds=False,
                 capture_output=True,
                 text=True,
                 timeout=timeout
@@ -80,41 +219,82 @@ class InfrastructureVerification:
                 "command": command
             }
 
+    @staticmethod
+    def _venv_distributions(venv_dir: Path) -> Dict[str, Any]:
+        """Installed distributions in the venv, keyed by normalized name, read from dist-info metadata"""
+        site_dirs = [str(p) for p in (*venv_dir.glob("lib/python*/site-packages"), venv_dir / "Lib" / "site-packages") if p.is_dir()]
+        return {
+            re.sub(r"[-_.]+", "-", dist.metadata["Name"]).lower(): dist
+            for dist in distributions(path=site_dirs) if dist.metadata["Name"]
+        }
+
+    def _probe_packages(self, venv_dir: Path, python_path: Path, packages: List[Tuple[str, str]]) -> Dict[str, Dict[str, str]]:
+        """Version and file per (distribution, import name), from metadata; only unresolved modules are imported"""
+        dists = self._venv_distributions(venv_dir)
+        probes, unresolved = {}, []
+        for dist_name, import_name in packages:
+            dist = dists.get(re.sub(r"[-_.]+", "-", dist_name).lower())
+            module_path = import_name.replace(".", "/")
+            located = dist and next((
+                path for path in (Path(dist.locate_file(f"{module_path}/__init__.py")), Path(dist.locate_file(f"{module_path}.py")))
+                if path.exists()
+            ), None)
+            if located:
+                probes[import_name] = {"version": dist.version, "file": str(located)}
+            else:
+                unresolved.append(import_name)
+        
+        probes.update(self._probe_imports(python_path, unresolved))
+        return probes
+
+    def _probe_imports(self, python_path: Path, import_names: List[str]) -> Dict[str, Dict[str, str]]:
+        """Import all modules in a single venv interpreter; returns {name: {version, file} or {error}}"""
+        if not import_names:
+            return {}
+        
+        result = self._run_command([str(python_path), "-c", _IMPORT_PROBE_SCRIPT, *import_names], timeout=120, use_cache=False)
+        try:
+            # The report is the last line, in case an import printed something
+            return json.loads(result["stdout"].splitlines()[-1])
+        except (KeyError, IndexError, ValueError):
+            error = result.get("stderr") or result.get("message", "Unknown error")
+            return {name: {"error": error} for name in import_names}
+
+    def _verify_system_package(self, package_key: str, config: Dict[str, Any]) -> Dict[str, Any]:
+        """Probe one system package for its version and install location"""
+        print(f"Verifying {config['name']}...")
+        result = self._run_command(config["argv"])
+        
+        verification_result = {
+            "name": config["name"],
+            "installed": result["status"] == "success",
+            "version": "",
+            "location": "",
+            "details": result.get("stdout", result.get("stderr", ""))
+        }
+        
+        if result["status"] == "success":
+            # Extract version info
+            output = result["stdout"]
+            if any(keyword in output for keyword in config["expected_keywords"]):
+                verification_result["version"] = output.split('\n')[0] if output else "Unknown"
+                
+                # Try to get installation location (PATH lookup, no subprocess needed)
+                location = shutil.which("python3" if package_key == "python" else package_key)
+                if location:
+                    verification_result["location"] = location
+        
+        return verification_result
+
     def verify_system_packages(self) -> Dict[str, Any]:
         """Verify system-level packages"""
-        results = {}
-        
-        for package_key, config in self.verification_commands.items():
-            print(f"Verifying {config['name']}...")
-            result = self._run_command(config["command"])
-            
-            verification_result = {
-                "name": config["name"],
-                "installed": result["status"] == "success",
-                "version": "",
-                "location": "",
-                "details": result.get("stdout", result.get("stderr", ""))
+        # Probes are independent subprocesses, so run them all at once
+        with ThreadPoolExecutor(max_workers=len(self.verification_commands)) as executor:
+            futures = {
+                package_key: executor.submit(self._verify_system_package, package_key, config)
+                for package_key, config in self.verification_commands.items()
             }
-            
-            if result["status"] == "success":
-                # Extract version info
-                output = result["stdout"]
-                if any(keyword in output for keyword in config["expected_keywords"]):
-                    verification_result["version"] = output.split('\n')[0] if output else "Unknown"
-                    
-                    # Try to get installation location
-                    if package_key == "python":
-                        location_result = self._run_command("which python3")
-                        if location_result["status"] == "success":
-                            verification_result["location"] = location_result["stdout"]
-                    else:
-                        location_result = self._run_command(f"which {package_key}")
-                        if location_result["status"] == "success":
-                            verification_result["location"] = location_result["stdout"]
-            
-            results[package_key] = verification_result
-        
-        return results
+            return {package_key: future.result() for package_key, future in futures.items()}
 
     def verify_python_packages(self) -> Dict[str, Any]:
         """Verify Python packages in virtual environment"""
@@ -135,32 +315,24 @@ class InfrastructureVerification:
         else:
             python_path = venv_dir / "bin" / "python"
         
-        # Verify each package
-        for package in self.python_packages:
+        # Verify every package from metadata, starting the interpreter at most once
+        probes = self._probe_packages(venv_dir, python_path, list(self.python_import_names.items()))
+        
+        for package, import_name in self.python_import_names.items():
             print(f"Verifying Python package: {package}")
-            
-            # Try to import and get version
-            test_command = f'"{python_path}" -c "import {package.replace("-", "_")}; print(f\'{package}: {{getattr({package.replace("-", "_")}, "__version__", "unknown")}}\');"'
-            result = self._run_command(test_command)
+            probe = probes.get(import_name, {"error": "Unknown error"})
             
             package_result = {
                 "name": package,
-                "installed": result["status"] == "success",
+                "installed": "error" not in probe,
                 "version": "",
                 "import_path": "",
-                "details": result.get("stdout", result.get("stderr", ""))
+                "details": probe.get("error") or f"{package}: {probe['version']}"
             }
             
-            if result["status"] == "success":
-                output = result["stdout"]
-                if ":" in output:
-                    package_result["version"] = output.split(":", 1)[1].strip()
-                
-                # Get package location
-                location_command = f'"{python_path}" -c "import {package.replace("-", "_")}; print({package.replace("-", "_")}.__file__ if hasattr({package.replace("-", "_")}, \'__file__\') else \'built-in\')"'
-                location_result = self._run_command(location_command)
-                if location_result["status"] == "success":
-                    package_result["import_path"] = location_result["stdout"]
+            if "error" not in probe:
+                package_result["version"] = probe["version"]
+                package_result["import_path"] = probe["file"]
             
             results[package] = package_result
         
@@ -186,27 +358,23 @@ class InfrastructureVerification:
             }
         }
         
-        # Get directory sizes
+        # Get directory sizes (the venv is walked once and counted toward the project too)
         try:
+            venv_dir = self.project_dir / "venv"
+            venv_size = _dir_size(venv_dir) if venv_dir.exists() else 0
+            structure_info["venv_dir"]["size_mb"] = round(venv_size / (1024 * 1024), 2)
+            
             if self.project_dir.exists():
-                total_size = sum(f.stat().st_size for f in self.project_dir.rglob('*') if f.is_file())
+                total_size = venv_size + _dir_size(self.project_dir, exclude=venv_dir)
                 structure_info["project_dir"]["size_mb"] = round(total_size / (1024 * 1024), 2)
-            
-            venv_dir = self.project_dir / "venv"
-            if venv_dir.exists():
-                venv_size = sum(f.stat().st_size for f in venv_dir.rglob('*') if f.is_file())
-                structure_info["venv_dir"]["size_mb"] = round(venv_size / (1024 * 1024), 2)
         except:
             pass
         
         # Read requirements.txt
-        requirements_file = self.project_dir / "requirements.txt"
-        if requirements_file.exists():
-            try:
-                with open(requirements_file, 'r') as f:
-                    structure_info["requirements_file"]["content"] = f.read()
-            except:
-                pass
+        try:
+            structure_info["requirements_file"]["content"] = self._reqs() or ""
+        except:
+            pass
         
         return structure_info
 
@@ -233,17 +401,17 @@ class InfrastructureVerification:
         requirements_file = self.project_dir / "requirements.txt"
         installed_packages = []
         
-        if requirements_file.exists():
-            try:
-                with open(requirements_file, 'r') as f:
-                    requirements_content = f.read()
-                    for line in requirements_content.strip().split('\n'):
-                        if line.strip() and not line.startswith('#'):
-                            # Extract package name (remove version specifiers)
-                            package_name = line.split('>=')[0].split('==')[0].split('<')[0].strip()
-                            installed_packages.append(package_name)
-            except Exception as e:
-                print(f"Error reading requirements.txt: {e}")
+        try:
+            requirements_content = self._reqs()
+            if requirements_content:
+                # Extract package names (strip version specifiers and markers in one split)
+                installed_packages = [
+                    re.split(r'[<>=!~;]', line, maxsplit=1)[0].strip()
+                    for line in requirements_content.strip().split('\n')
+                    if line.strip() and not line.startswith('#')
+                ]
+        except Exception as e:
+            print(f"Error reading requirements.txt: {e}")
         
         # Map package names to service names and their import names
         package_info = {
@@ -268,6 +436,12 @@ class InfrastructureVerification:
         
         services_status = {}
         
+        # Resolve every mapped package from metadata, starting the interpreter at most once
+        probes = self._probe_packages(venv_dir, python_path, [
+            (package_name, package_info[package_name]["import"]) for package_name in installed_packages
+            if package_name in package_info and package_info[package_name]["import"]
+        ])
+        
         for package_name in installed_packages:
             if package_name not in package_info:
                 # Skip packages not in our mapping
@@ -287,12 +461,10 @@ class InfrastructureVerification:
                 }
                 continue
             
-            # Try to import and get location
-            test_command = f'"{python_path}" -c "import {import_name}; print({import_name}.__file__ if hasattr({import_name}, \'__file__\') else \'built-in\')"'
-            result = self._run_command(test_command)
+            probe = probes.get(import_name, {"error": "Unknown error"})
             
-            if result["status"] == "success":
-                location = result["stdout"].strip()
+            if "error" not in probe:
+                location = probe["file"]
                 # Clean up the path to show relative to venv
                 if str(venv_dir) in location:
                     location = location.replace(str(venv_dir), "venv")
@@ -302,10 +474,10 @@ class InfrastructureVerification:
                     "path": location
                 }
             else:
-                print(f"Failed to import {import_name}: {result.get('stderr', 'Unknown error')}")
+                print(f"Failed to import {import_name}: {probe['error']}")
                 services_status[service_name] = {
                     "status": "undetected", 
-                    "path": f"Import failed: {result.get('stderr', 'Unknown error')[:50]}"
+                    "path": f"Import failed: {probe['error'][:50]}"
                 }
         
         return {
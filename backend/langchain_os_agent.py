@@ -1,14 +1,45 @@
 import platform
+import shutil
 import subprocess
 import psutil
 import json
-from typing import Dict, List, Any
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 from langchain.agents import Tool, AgentExecutor, create_react_agent
 from langchain.prompts import PromptTemplate
 from langchain_openai import ChatOpenAI
 from langchain import hub
 import os
 
+# ReAct prompt shared by every agent; templates are immutable, so it is built once
+PROMPT = PromptTemplate(
+    input_variables=["input", "agent_scratchpad", "tools", "tool_names"],
+    template="""You are an OS checking agent. Use the available tools to analyze the system and provide recommendations.
+
+Available tools: {tools}
+Tool names: {tool_names}
+
+IMPORTANT: Use the EXACT tool names:
+- get_system_info (for OS, version, architecture info)
+- get_resource_info (for RAM, CPU, disk info)  
+- check_software_installed (for software versions)
+
+Question: {input}
+
+Thought: I need to call the tools using their exact names.
+{agent_scratchpad}"""
+)
+
+
+@lru_cache(maxsize=4)
+def _get_llm(api_key: str) -> ChatOpenAI:
+    """Chat model client per API key, reused across agents so its HTTP client and validation are set up once"""
+    return ChatOpenAI(
+        model="gpt-3.5-turbo",
+        temperature=0,
+        openai_api_key=api_key
+    )
+
 
 class OSCheckingAgent:
     def __init__(self, openai_api_key: str = None):
@@ -16,19 +47,25 @@ class OSCheckingAgent:
         if not self.api_key:
             raise ValueError("OpenAI API key is required. Set OPENAI_API_KEY environment variable or pass it directly.")
         
-        self.llm = ChatOpenAI(
-            model="gpt-3.5-turbo",
-            temperature=0,
-            openai_api_key=self.api_key
-        )
+        self.llm = _get_llm(self.api_key)
         
+        # Tool data for the current run_os_check, so the agent's calls and the structured output share it
+        self._tool_results: Dict[str, Dict[str, Any]] = {}
+        self._collectors: Dict[str, Any] = {}
         self.tools = self._create_tools()
-        self.agent_executor = self._create_agent()
+        self._agent_executor: Optional[AgentExecutor] = None
+    
+    @property
+    def agent_executor(self) -> AgentExecutor:
+        """Agent executor, built on first use"""
+        if self._agent_executor is None:
+            self._agent_executor = self._create_agent()
+        return self._agent_executor
     
     def _create_tools(self) -> List[Tool]:
         """Create LangChain tools for OS checking"""
         
-        def get_system_info() -> str:
+        def get_system_info() -> Dict[str, Any]:
             """Get basic system information"""
             info = {
                 "os": platform.system(),
@@ -37,9 +74,9 @@ class OSCheckingAgent:
                 "hostname": platform.node(),
                 "platform": platform.platform()
             }
-            return json.dumps(info, indent=2)
+            return info
         
-        def get_resource_info() -> str:
+        def get_resource_info() -> Dict[str, Any]:
             """Get system resource information"""
             memory = psutil.virtual_memory()
             disk = psutil.disk_usage('/')
@@ -55,25 +92,30 @@ class OSCheckingAgent:
                 "disk_free_gb": round(disk.free / (1024**3), 2),
                 "disk_percent_used": round((disk.used / disk.total) * 100, 2)
             }
-            return json.dumps(info, indent=2)
+            return info
         
-        def check_software_installed() -> str:
+        def check_software_installed() -> Dict[str, Any]:
             """Check if common development software is installed"""
-            def command_exists(command: str) -> bool:
+            @lru_cache(maxsize=64)
+            def probe(command: str) -> Tuple[bool, str]:
+                """Run `command --version` once; returns (succeeded, first line of output)"""
+                binary = shutil.which(command)
+                if binary is None:
+                    # Not on PATH - no need to spawn anything
+                    return False, "Not installed"
                 try:
-                    subprocess.run([command, '--version'], 
-                                 capture_output=True, check=True, timeout=5)
-                    return True
-                except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-                    return False
+                    # Resolved path + close_fds=False takes CPython's posix_spawn fast path
+                    result = subprocess.run([command, '--version'], executable=binary, close_fds=False,
+                                          capture_output=True, text=True, timeout=5)
+                    return result.returncode == 0, result.stdout.strip().split('\n')[0]
+                except (FileNotFoundError, subprocess.TimeoutExpired, OSError):
+                    return False, "Not installed"
+            
+            def command_exists(command: str) -> bool:
+                return probe(command)[0]
             
             def get_version(command: str) -> str:
-                try:
-                    result = subprocess.run([command, '--version'], 
-                                          capture_output=True, text=True, timeout=5)
-                    return result.stdout.strip().split('\n')[0]
-                except:
-                    return "Not installed"
+                return probe(command)[1]
             
             software = {
                 "docker": {
@@ -109,53 +151,53 @@ class OSCheckingAgent:
                     "version": get_version('node') if command_exists('node') else "Not installed"
                 }
             }
-            return json.dumps(software, indent=2)
+            return software
+        
+        self._collectors = {
+            func.__name__: func for func in (get_system_info, get_resource_info, check_software_installed)
+        }
+        
+        def cached(func):
+            """Serve the tool from data already collected for the current run"""
+            def wrapper(*args, **kwargs) -> str:
+                if func.__name__ not in self._tool_results:
+                    self._tool_results[func.__name__] = func()
+                return json.dumps(self._tool_results[func.__name__], indent=2)
+            return wrapper
         
         return [
             Tool(
                 name="get_system_info",
                 description="Get basic system information including OS, version, architecture, and hostname",
-                func=get_system_info
+                func=cached(get_system_info)
             ),
             Tool(
                 name="get_resource_info", 
                 description="Get system resource information including RAM, CPU, and disk usage",
-                func=get_resource_info
+                func=cached(get_resource_info)
             ),
             Tool(
                 name="check_software_installed",
                 description="Check if common development tools and cloud CLIs are installed",
-                func=check_software_installed
+                func=cached(check_software_installed)
             )
         ]
     
+    def _collect(self) -> Dict[str, Dict[str, Any]]:
+        """Run each data-gathering tool at most once for the current check"""
+        for name, collector in self._collectors.items():
+            if name not in self._tool_results:
+                self._tool_results[name] = collector()
+        return self._tool_results
+    
     def _create_agent(self) -> AgentExecutor:
         """Create LangChain agent for OS checking"""
         
-        # Create a specific prompt for the agent
-        prompt = PromptTemplate(
-            input_variables=["input", "agent_scratchpad", "tools", "tool_names"],
-            template="""You are an OS checking agent. Use the available tools to analyze the system and provide recommendations.
-
-Available tools: {tools}
-Tool names: {tool_names}
-
-IMPORTANT: Use the EXACT tool names:
-- get_system_info (for OS, version, architecture info)
-- get_resource_info (for RAM, CPU, disk info)  
-- check_software_installed (for software versions)
-
-Question: {input}
-
-Thought: I need to call the tools using their exact names.
-{agent_scratchpad}"""
-        )
-        
         # Create the agent
         agent = create_react_agent(
             llm=self.llm,
             tools=self.tools,
-            prompt=prompt
+            prompt=PROMPT
         )
         
         # Create agent executor
@@ -177,13 +219,16 @@ Thought: I need to call the tools using their exact names.
         3. Check what software is installed
         4. Based on the findings, provide recommendations for improvements"""
         
+        # Collect once up front; the agent's tool calls and the structured output both read this
+        self._tool_results = {}
+        collected = self._collect()
+        
         # Run the agent
         response = self.agent_executor.invoke({"input": query})
         
-        # Also get raw data for structured output
-        system_info = json.loads(self.tools[0].func())
-        resource_info = json.loads(self.tools[1].func())
-        software_info = json.loads(self.tools[2].func())
+        system_info = collected["get_system_info"]
+        resource_info = collected["get_resource_info"]
+        software_info = collected["check_software_installed"]
         
         # Combine all data
         full_system_info = {**system_info, **resource_info, "software": software_info}
@@ -0,0 +1,10 @@
+"""
+PlatForge.ai project locations
+Shared by the installer, verifier and config generator so they all agree on where projects live
+"""
+
+import os
+from pathlib import Path
+
+# Root directory for generated projects; PLATFORGE_ROOT overrides it (e.g. for CI)
+PROJECT_ROOT = Path(os.environ.get("PLATFORGE_ROOT") or Path.home() / "platforge_projects")
@@ -4,17 +4,33 @@ Test script to verify service account creation with a fresh startup
 """
 
 import json
+import sys
 import uuid
-from dynamic_cloud_provisioner import DynamicCloudProvisioner
+from functools import lru_cache
+
+@lru_cache(maxsize=1)
+def _get_provisioner():
+    """Build the provisioner once and reuse it across test runs"""
+    # Imported here so importing this module stays cheap (no SDK/credential setup until a test runs)
+    from dynamic_cloud_provisioner import DynamicCloudProvisioner
+    return DynamicCloudProvisioner()
+
+def _emit(lines):
+    """Write buffered output lines to stdout in one call"""
+    sys.stdout.write('\n'.join(lines) + '\n')
+    sys.stdout.flush()
+    lines.clear()
 
 def test_fresh_service_account():
     """Test with a completely new startup to avoid existing account loading"""
     
-    print("🧪 Testing Fresh Service Account Creation")
-    print("=" * 50)
+    # Output is buffered and written in one go instead of a print per line
+    lines = []
+    lines.append("🧪 Testing Fresh Service Account Creation")
+    lines.append("=" * 50)
     
     # Initialize provisioner
-    provisioner = DynamicCloudProvisioner()
+    provisioner = _get_provisioner()
     
     # Test startup info with random ID to ensure fresh creation
     random_id = uuid.uuid4().hex[:8]
@@ -27,58 +43,63 @@ def test_fresh_service_account():
     # Test with GCP services to trigger service account creation
     pipeline_services = ["bigquery", "looker"]
     
-    print(f"📦 Testing with fresh startup: {startup_info['name']}")
-    print(f"📧 Email: {startup_info['email']}")
-    print(f"🔧 Services: {', '.join(pipeline_services)}")
-    print()
+    lines.append(f"📦 Testing with fresh startup: {startup_info['name']}")
+    lines.append(f"📧 Email: {startup_info['email']}")
+    lines.append(f"🔧 Services: {', '.join(pipeline_services)}")
+    lines.append("")
+    
+    # Show the header before the (slow) provisioning run
+    _emit(lines)
     
     # Auto-provision everything
     try:
         result = provisioner.auto_provision_startup_infrastructure(startup_info, pipeline_services)
         
-        print("✅ PROVISIONING COMPLETED!")
-        print("=" * 50)
+        lines.append("✅ PROVISIONING COMPLETED!")
+        lines.append("=" * 50)
         
         # Print the account_info that the frontend will receive
         if "account_info" in result:
             account_info = result["account_info"]
-            print("🎯 FRONTEND ACCOUNT INFO:")
-            print(f"   Account ID: {account_info.get('account_id', 'N/A')}")
-            print(f"   Account Name: {account_info.get('account_name', 'N/A')}")
-            print(f"   Provider: {account_info.get('provider', 'N/A')}")
+            lines.append("🎯 FRONTEND ACCOUNT INFO:")
+            lines.append(f"   Account ID: {account_info.get('account_id', 'N/A')}")
+            lines.append(f"   Account Name: {account_info.get('account_name', 'N/A')}")
+            lines.append(f"   Provider: {account_info.get('provider', 'N/A')}")
             
             if account_info.get('service_account_email'):
-                print(f"   Service Account: {account_info['service_account_email']}")
-                print(f"   Console URL: {account_info.get('console_url', 'N/A')}")
-                print(f"   Keys URL: {account_info.get('keys_url', 'N/A')}")
-                print(f"   Project ID: {account_info.get('project_id', 'N/A')}")
+                lines.append(f"   Service Account: {account_info['service_account_email']}")
+                lines.append(f"   Console URL: {account_info.get('console_url', 'N/A')}")
+                lines.append(f"   Keys URL: {account_info.get('keys_url', 'N/A')}")
+                lines.append(f"   Project ID: {account_info.get('project_id', 'N/A')}")
             else:
-                print(f"   Console URL: {account_info.get('console_url', 'N/A')}")
+                lines.append(f"   Console URL: {account_info.get('console_url', 'N/A')}")
         else:
-            print("⚠️ No account_info found in result")
+            lines.append("⚠️ No account_info found in result")
         
-        print("\n" + "=" * 50)
-        print("📋 WHAT USER WILL SEE IN FRONTEND:")
-        print("=" * 50)
+        lines.append("\n" + "=" * 50)
+        lines.append("📋 WHAT USER WILL SEE IN FRONTEND:")
+        lines.append("=" * 50)
         
         account_info = result.get("account_info", {})
         if account_info.get("service_account_email"):
-            print("✅ Infrastructure Created Successfully")
-            print("🔑 Dedicated Service Account:")
-            print(f"   Email: {account_info['service_account_email']}")
-            print(f"   Project: {account_info.get('project_id', 'N/A')}")
-            print("Links:")
-            print(f"   🔗 Manage Service Account → {account_info.get('console_url', 'N/A')}")
-            print(f"   🔐 Create API Keys → {account_info.get('keys_url', 'N/A')}")
+            lines.append("✅ Infrastructure Created Successfully")
+            lines.append("🔑 Dedicated Service Account:")
+            lines.append(f"   Email: {account_info['service_account_email']}")
+            lines.append(f"   Project: {account_info.get('project_id', 'N/A')}")
+            lines.append("Links:")
+            lines.append(f"   🔗 Manage Service Account → {account_info.get('console_url', 'N/A')}")
+            lines.append(f"   🔐 Create API Keys → {account_info.get('keys_url', 'N/A')}")
         else:
-            print("❌ Would show generic account info instead of service account")
-            print(f"   Account ID: {account_info.get('account_id', 'N/A')}")
-            print(f"   Account Name: {account_info.get('account_name', 'N/A')}")
+            lines.append("❌ Would show generic account info instead of service account")
+            lines.append(f"   Account ID: {account_info.get('account_id', 'N/A')}")
+            lines.append(f"   Account Name: {account_info.get('account_name', 'N/A')}")
         
+        _emit(lines)
         return True
         
     except Exception as e:
-        print(f"❌ Test failed: {e}")
+        lines.append(f"❌ Test failed: {e}")
+        _emit(lines)
         import traceback
         traceback.print_exc()
         return False
@@ -4,16 +4,32 @@ Test script to verify service account creation and console links
 """
 
 import json
-from dynamic_cloud_provisioner import DynamicCloudProvisioner
+import sys
+from functools import lru_cache
+
+@lru_cache(maxsize=1)
+def _get_provisioner():
+    """Build the provisioner once and reuse it across test runs"""
+    # Imported here so importing this module stays cheap (no SDK/credential setup until a test runs)
+    from dynamic_cloud_provisioner import DynamicCloudProvisioner
+    return DynamicCloudProvisioner()
+
+def _emit(lines):
+    """Write buffered output lines to stdout in one call"""
+    sys.stdout.write('\n'.join(lines) + '\n')
+    sys.stdout.flush()
+    lines.clear()
 
 def test_service_account_creation():
     """Test the complete service account creation flow"""
     
-    print("🧪 Testing Service Account Creation")
-    print("=" * 50)
+    # Output is buffered and written in one go instead of a print per line
+    lines = []
+    lines.append("🧪 Testing Service Account Creation")
+    lines.append("=" * 50)
     
     # Initialize provisioner
-    provisioner = DynamicCloudProvisioner()
+    provisioner = _get_provisioner()
     
     # Test startup info
     startup_info = {
@@ -25,46 +41,49 @@ def test_service_account_creation():
     # Test with GCP services to trigger service account creation
     pipeline_services = ["bigquery", "looker"]
     
-    print(f"📦 Testing with services: {', '.join(pipeline_services)}")
-    print()
+    lines.append(f"📦 Testing with services: {', '.join(pipeline_services)}")
+    lines.append("")
+    
+    # Show the header before the (slow) provisioning run
+    _emit(lines)
     
     # Auto-provision everything
     try:
         result = provisioner.auto_provision_startup_infrastructure(startup_info, pipeline_services)
         
-        print("✅ PROVISIONING COMPLETED!")
-        print("=" * 50)
+        lines.append("✅ PROVISIONING COMPLETED!")
+        lines.append("=" * 50)
         
         # Check GCP environment
         if "gcp" in result.get("provisioned_environments", {}):
             gcp_env = result["provisioned_environments"]["gcp"]
-            print(f"🔧 GCP Project: {gcp_env['project_id']}")
-            print(f"🔑 Service Account: {gcp_env.get('service_account', 'N/A')}")
+            lines.append(f"🔧 GCP Project: {gcp_env['project_id']}")
+            lines.append(f"🔑 Service Account: {gcp_env.get('service_account', 'N/A')}")
             
             # Check service account credentials
             if "credentials" in gcp_env:
                 creds = gcp_env["credentials"]
-                print(f"📧 Service Account Email: {creds.get('email', 'N/A')}")
-                print(f"🔗 Console URL: {creds.get('console_url', 'N/A')}")
-                print(f"🔐 Keys URL: {creds.get('keys_url', 'N/A')}")
-                print(f"⚡ Status: {creds.get('status', 'N/A')}")
+                lines.append(f"📧 Service Account Email: {creds.get('email', 'N/A')}")
+                lines.append(f"🔗 Console URL: {creds.get('console_url', 'N/A')}")
+                lines.append(f"🔐 Keys URL: {creds.get('keys_url', 'N/A')}")
+                lines.append(f"⚡ Status: {creds.get('status', 'N/A')}")
                 
                 # Check instructions
                 if "instructions" in creds:
-                    print("📝 Instructions:")
+                    lines.append("📝 Instructions:")
                     for i, instruction in enumerate(creds["instructions"], 1):
-                        print(f"   {i}. {instruction}")
+                        lines.append(f"   {i}. {instruction}")
             else:
-                print("⚠️ No service account credentials found")
+                lines.append("⚠️ No service account credentials found")
         else:
-            print("⚠️ No GCP environment found in result")
+            lines.append("⚠️ No GCP environment found in result")
         
-        print("\n" + "=" * 50)
-        print("🎯 FRONTEND INTEGRATION TEST")
-        print("=" * 50)
+        lines.append("\n" + "=" * 50)
+        lines.append("🎯 FRONTEND INTEGRATION TEST")
+        lines.append("=" * 50)
         
         # Test what the frontend would receive
-        print("📱 Frontend would receive:")
+        lines.append("📱 Frontend would receive:")
         frontend_data = {
             "status": result["status"],
             "account_info": result.get("account_info"),
@@ -72,7 +91,12 @@ def test_service_account_creation():
             "provisioned_resources": result.get("provisioned_resources")
         }
         
-        print(json.dumps(frontend_data, indent=2))
+        # Stream the dump straight to stdout instead of building it as one string first;
+        # provisioned resources are lazy Mapping records, expanded by the provisioner's encoder hook
+        from dynamic_cloud_provisioner import _json_default
+        _emit(lines)
+        json.dump(frontend_data, sys.stdout, indent=2, default=_json_default)
+        sys.stdout.write('\n')
         
         # Verify service account links are accessible
         if "gcp" in result.get("provisioned_environments", {}):
@@ -82,19 +106,21 @@ def test_service_account_creation():
                 console_url = creds.get("console_url")
                 keys_url = creds.get("keys_url")
                 
-                print(f"\n🔗 Service Account Management:")
-                print(f"   Console URL: {console_url}")
-                print(f"   Keys URL: {keys_url}")
+                lines.append(f"\n🔗 Service Account Management:")
+                lines.append(f"   Console URL: {console_url}")
+                lines.append(f"   Keys URL: {keys_url}")
                 
                 if console_url and keys_url:
-                    print("✅ Frontend should display both service account links")
+                    lines.append("✅ Frontend should display both service account links")
                 else:
-                    print("⚠️ Missing service account URLs for frontend")
+                    lines.append("⚠️ Missing service account URLs for frontend")
         
+        _emit(lines)
         return True
         
     except Exception as e:
-        print(f"❌ Test failed: {e}")
+        lines.append(f"❌ Test failed: {e}")
+        _emit(lines)
         return False
 
 if __name__ == "__main__":